@@ -0,0 +1,100 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: Budget Engine Check
+
+# PURPOSE: Check the incremental BudgetEngine accumulator against a full
+# re-aggregation, and time a budget check after each save.
+
+# INPUT: Optional number of rows in the synthetic ledger and saves to time.
+
+# PROCESS: Build a synthetic ledger, save random expenses through a
+# LedgerStore, compare the engine's spent-to-date with a grouped pass over
+# the final ledger, and time the per-save Status lookup against
+# re-aggregating the ledger for the same answer.
+
+# OUTPUT: Mismatch count and timing lines printed to the console.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Check: BudgetEngine accumulator vs a full re-aggregation.
+
+Run from the repo root:
+    python -m benchmarks.bench_budget_engine [rows] [saves]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_ledger_memory import BuildLedgerCsv
+from src.budget_engine import BudgetEngine
+from src.dao.budget_dao import BudgetDAO
+from src.dao.transaction_dao import TransactionDAO
+from src.ledger_store import LedgerStore
+from src.models.transaction import Transaction
+
+DEFAULT_ROWS = 1_000_000
+DEFAULT_SAVES = 50
+
+
+def Reaggregate(store: LedgerStore) -> dict[tuple[str, str], int]:
+    """Return expense cents per (month, folded category) from scratch."""
+    df = store.Snapshot()
+    df = df[df["datetime"].notna()]
+    expense = df["transaction"].astype(str).str.strip().str.lower()
+    df = df[expense == "expense"]
+    totals = df.groupby(
+        [df["month"].astype(str),
+         df["category"].astype(str).str.strip().str.casefold()],
+        observed=True)["cents"].sum()
+    return {k: int(v) for k, v in totals.items() if v}
+
+
+def main(argv: list[str]) -> None:
+    """Save random expenses, then compare and time both approaches."""
+    rows = int(argv[0]) if argv else DEFAULT_ROWS
+    saves = int(argv[1]) if len(argv) > 1 else DEFAULT_SAVES
+    rng = random.Random(11)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "ledger.csv"
+        BuildLedgerCsv(path, rows, seed=11)
+        store = LedgerStore(TransactionDAO(str(path)))
+        budgets = BudgetDAO(str(Path(tmp) / "budgets.csv"))
+        budgets.SetBudget("Food", 500)
+        engine = BudgetEngine(store, budgets)
+        engine.Status("Food")
+
+        check_s = reagg_s = 0.0
+        for i in range(saves):
+            tx = Transaction(transaction="expense",
+                             category=rng.choice(["Food", " food", "Rent"]),
+                             description=f"bench {i}",
+                             amount=round(rng.uniform(1, 200), 2),
+                             date=f"2024/{rng.randint(1, 12):02d}/15")
+            store.SaveTransaction(tx)
+            t0 = time.perf_counter()
+            engine.Status("Food", tx.date)
+            t1 = time.perf_counter()
+            Reaggregate(store)
+            t2 = time.perf_counter()
+            check_s += t1 - t0
+            reagg_s += t2 - t1
+
+        got = {k: v for k, v in engine.Spent.items() if v}
+        mismatches = len(set(got.items()) ^ set(Reaggregate(store).items()))
+        print(f"{rows:,} rows + {saves} saves: {mismatches} mismatches")
+        print(f"per-save budget check {check_s / saves * 1e6:.1f}us vs "
+              f"re-aggregation {reagg_s / saves * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
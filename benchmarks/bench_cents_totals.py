@@ -0,0 +1,163 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: Cents Totals Check
+
+# PURPOSE: Check that the int64-cents report totals and the monthly rollup
+# equal an exact integer reference on randomized ledgers, and time float
+# vs int sums.
+
+# INPUT: Optional number of random ledgers and rows for the timing run.
+
+# PROCESS: Generate seeded ledgers with messy amounts (sub-cent, negative,
+# blank, non-numeric, odd spellings), out-of-range dates and an optional
+# byte-order mark, compare TransactionDAO reports, the service summary and
+# the monthly rollup with a pure-Python integer recomputation, then time
+# column sums.
+
+# OUTPUT: Mismatch count and a timing line printed to the console.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Check: cents-based totals vs an exact integer reference.
+
+Run from the repo root:
+    python -m benchmarks.bench_cents_totals [ledgers] [rows]
+"""
+
+import math
+import random
+import re
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+
+from src.dao.monthly_rollup import MonthlyRollup
+from src.dao.transaction_dao import AmountToCents, TransactionDAO
+from src.gillpay_service import GillPayService
+
+DEFAULT_LEDGERS = 200
+DEFAULT_ROWS = 1_000_000
+
+# Amount cells float() reads but the ledger does not
+ODD_AMOUNTS = ["1_000", " 12 ", "+5", ".5", "5.", "nan", "inf", "1e400",
+               "\u0661\u0662", "\u00a07", "1e-3", "0012"]
+
+# Date cells that parse but fall outside the ledger's date range
+FAR_DATES = ["3025/01/05", "1500/01/01", "01/05/3025"]
+
+
+def RandomAmount(rng: random.Random) -> str:
+    """Return an amount cell in one of the shapes seen in real exports."""
+    return rng.choice([
+        f"{rng.uniform(-5000, 5000):.2f}",
+        f"{rng.uniform(0, 100):.4f}",
+        str(rng.randint(0, 3000)),
+        "", "n/a", "0.005", "-0.015", "1e3", rng.choice(ODD_AMOUNTS),
+    ])
+
+
+def WriteLedger(path: Path, rng: random.Random) -> list[list[str]]:
+    """Write a random ledger to *path* and return its data rows."""
+    rows = [[rng.choice(["income", "expense", "Expense", " income"]),
+             rng.choice(["Food", "food ", "Rent", "Salary", "Other"]),
+             f"desc{rng.randint(0, 3)}", RandomAmount(rng),
+             rng.choice(["2024/01/05", "2024-02-29", "03/15/2025",
+                         "15 Mar 2025", "bad", "", rng.choice(FAR_DATES)])]
+            for _ in range(rng.randint(0, 300))]
+    lines = ["transaction,category,description,amount,date"]
+    lines += [",".join(r) for r in rows]
+    # Some exports (Excel) start with a byte-order mark
+    path.write_text("\n".join(lines) + "\n",
+                    encoding=rng.choice(["utf-8", "utf-8-sig"]))
+    return rows
+
+
+def ExactCents(raw: str) -> int:
+    """Round one amount cell to whole cents the way the ledger defines
+    it: round(float(amount) * 100) for a plain ASCII decimal number, 0 for
+    anything else or a non-finite result."""
+    if re.search(r"[^0-9.eE+\- \t]", raw):
+        return 0
+    try:
+        value = float(raw) * 100
+    except ValueError:
+        return 0
+    return round(value) if math.isfinite(value) else 0
+
+
+def Reference(rows: list[list[str]]) -> tuple[dict, dict]:
+    """Return exact ({(type, category): cents}, {type: cents}) for rows
+    with a valid date, and the summary over all rows."""
+    by_category: dict = defaultdict(int)
+    summary: dict = defaultdict(int)
+    for t, c, _, a, d in rows:
+        cents = ExactCents(a)
+        summary[t] += cents
+        if d not in ("bad", "", *FAR_DATES):
+            by_category[(t.strip().lower(), c)] += cents
+    return by_category, summary
+
+
+def CheckLedger(path: Path, rows: list[list[str]]) -> bool:
+    """Return True if reports, summary and the monthly rollup match the
+    exact reference and each other."""
+    by_category, summary = Reference(rows)
+    by_kind = dict(summary)
+    dao = TransactionDAO(str(path))
+    reports = dao.GetReports()
+    for type_key, report in (("expense", reports.expense),
+                             ("income", reports.income)):
+        want = {c: v / 100 for (t, c), v in by_category.items()
+                if t == type_key}
+        got = dict(zip(report["category"], report["amount"]))
+        if got != want:
+            return False
+    service = GillPayService.__new__(GillPayService)
+    service.TransactionDAO = dao
+    got = service.GetTransactionSummary()
+    if (got["income"] != summary["income"] / 100
+            or got["expense"] != summary["expense"] / 100):
+        return False
+    rollup = MonthlyRollup(path).Refresh()
+    kinds = {t: cents for t, (cents, _) in rollup.KindTotals().items()}
+    return (kinds == by_kind
+            and dao.SummaryByMonthData().equals(reports.monthly))
+
+
+def main(argv: list[str]) -> None:
+    """Check random ledgers, then time a float vs int64 column sum."""
+    ledgers = int(argv[0]) if argv else DEFAULT_LEDGERS
+    size = int(argv[1]) if len(argv) > 1 else DEFAULT_ROWS
+    mismatches = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for seed in range(ledgers):
+            path = Path(tmp) / f"ledger_{seed}.csv"
+            rows = WriteLedger(path, random.Random(seed))
+            mismatches += not CheckLedger(path, rows)
+    print(f"{ledgers} random ledgers, {mismatches} mismatches")
+
+    amounts = np.round(np.random.default_rng(7).uniform(0, 2500, size), 2)
+    cents = AmountToCents(amounts)
+    t0 = time.perf_counter()
+    float_total = amounts.sum()
+    t1 = time.perf_counter()
+    cents_total = int(cents.sum())
+    t2 = time.perf_counter()
+    drift = abs(round(float_total * 100) - cents_total)
+    print(f"{size:,} rows: float sum {t1 - t0:.4f}s, int64 cents sum "
+          f"{t2 - t1:.4f}s, float drift {drift} cent(s)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,96 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: CLI Startup Benchmark
+
+# PURPOSE: Time cold `gillpay summary` and `gillpay report` processes and
+# check the pandas-free summary against GillPayService.
+
+# INPUT: Optional ledger row count and number of timed runs.
+
+# PROCESS: Build a synthetic ledger, time a cold `summary` (no rollup saved
+# yet, so it sums with Pandas), save the monthly rollup via `report
+# by-month`, then time fresh `python -m src.main` processes for each
+# subcommand.
+
+# OUTPUT: Parity result, median wall times and the --startup-profile
+# breakdown of `summary` printed to the console.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Benchmark: cold-process CLI subcommand latency.
+
+Run from the repo root:
+    python -m benchmarks.bench_cli_startup [rows] [runs]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_ledger_memory import BuildLedgerCsv
+
+DEFAULT_ROWS = 1_000_000
+DEFAULT_RUNS = 5
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def RunCli(args: list[str], check: bool = True
+           ) -> tuple[float, subprocess.CompletedProcess]:
+    """Run `python -m src.main *args* in a fresh process; return (seconds,
+    completed process)."""
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    t0 = time.perf_counter()
+    done = subprocess.run([sys.executable, "-m", "src.main", *args],
+                          cwd=REPO_ROOT, env=env, capture_output=True,
+                          text=True, check=check)
+    return time.perf_counter() - t0, done
+
+
+def main(argv: list[str]) -> None:
+    """Build the ledger, then time each subcommand in fresh processes."""
+    rows = int(argv[0]) if argv else DEFAULT_ROWS
+    runs = int(argv[1]) if len(argv) > 1 else DEFAULT_RUNS
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "ledger.csv"
+        BuildLedgerCsv(path, rows)
+        data = ["--data", str(path)]
+
+        cold, out = RunCli(data + ["summary", "--format", "json"])
+        from src.main import NewService
+        want = NewService(str(path)).GetTransactionSummary()
+        got = json.loads(out.stdout)[0]
+        wrote = sorted(p.name for p in Path(tmp).iterdir()) != ["ledger.csv"]
+        build, _ = RunCli(data + ["report", "by-month"])
+        _, out = RunCli(data + ["summary", "--format", "json"])
+        warm = json.loads(out.stdout)[0]
+        print(f"{rows:,} rows: summary matches service: cold {got == want}, "
+              f"warm {warm == want}; cold summary (no rollup, Pandas) "
+              f"{cold:.2f}s, wrote files: {wrote}; first by-month (saves "
+              f"the rollup) {build:.2f}s")
+
+        for command in (["summary"], ["report", "by-month"],
+                        ["report", "exp-by-cat"]):
+            times = [RunCli(data + command)[0] for _ in range(runs)]
+            print(f"  gillpay {' '.join(command):20} median "
+                  f"{statistics.median(times):.3f}s over {runs} runs")
+
+        _, profiled = RunCli(data + ["--startup-profile", "summary"],
+                             check=False)
+        print(profiled.stderr, end="")
+        print(f"  exit status {profiled.returncode}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,123 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: Daily Analytics Check
+
+# PURPOSE: Check the running balance and moving averages against a pandas
+# resample/rolling reference, and time them on a multi-year ledger.
+
+# INPUT: Optional number of random ledgers and rows for the timing run.
+
+# PROCESS: Compare DailyBalanceData and SpendMovingAverageData with
+# groupby-by-day, cumsum and rolling(window).mean() on seeded messy
+# ledgers, then time a cold build and cached calls on a synthetic ledger.
+
+# OUTPUT: Mismatch count and timing lines printed to the console.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Check: daily balance and moving averages vs a pandas reference.
+
+Run from the repo root:
+    python -m benchmarks.bench_daily_analytics [ledgers] [rows]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_cents_totals import WriteLedger
+from benchmarks.bench_ledger_memory import BuildLedgerCsv
+from src.dao.transaction_dao import TransactionDAO
+
+DEFAULT_LEDGERS = 100
+DEFAULT_ROWS = 1_000_000
+WINDOWS = (7, 30, 90)
+
+
+def ReferenceDaily(df: pd.DataFrame, category: str | None) -> pd.DataFrame:
+    """Return per-day income/expense/spend cents via pandas resampling."""
+    df = df[df["datetime"].notna()]
+    kind = df["transaction"].astype(str).str.strip().str.lower()
+    day = df["datetime"].dt.normalize()
+    frame = pd.DataFrame({
+        "income": df["cents"].where(kind == "income", 0),
+        "expense": df["cents"].where(kind == "expense", 0),
+    })
+    spend = frame["expense"]
+    if category is not None:
+        folded = df["category"].astype(str).str.strip().str.lower()
+        spend = spend.where(folded == category, 0)
+    frame["spend"] = spend
+    return frame.groupby(day).sum().resample("D").sum()
+
+
+def CheckLedger(path: Path, rng: random.Random) -> bool:
+    """Return True if balance and averages match the reference."""
+    dao = TransactionDAO(str(path))
+    category = rng.choice([None, "food", "rent", "salary", "missing"])
+    ref = ReferenceDaily(dao.GetDataFrame(), category)
+    balance = dao.DailyBalanceData()
+    averages = dao.SpendMovingAverageData(WINDOWS, category=category)
+    if ref.empty:
+        return balance.empty and averages.empty
+    net = ref["income"] - ref["expense"]
+    ok = (balance["date"].tolist() == ref.index.tolist()
+          and np.array_equal(np.rint(balance["net"].to_numpy() * 100),
+                             net.to_numpy())
+          and np.allclose(balance["balance"].to_numpy() * 100,
+                          net.cumsum().to_numpy()))
+    for window in WINDOWS:
+        want = ref["spend"].rolling(window).mean().to_numpy() / 100
+        ok = ok and np.allclose(averages[f"ma{window}"].to_numpy(), want,
+                                equal_nan=True)
+    # A sub-range must keep the balance carried in from earlier days
+    if ok and len(balance) > 2:
+        mid = balance["date"].iloc[len(balance) // 2]
+        part = dao.DailyBalanceData(start=mid.strftime("%Y/%m/%d"))
+        ok = part["balance"].tolist() == balance["balance"].tolist()[
+            len(balance) // 2:]
+    return ok
+
+
+def main(argv: list[str]) -> None:
+    """Check random ledgers, then time the analytics on a large one."""
+    ledgers = int(argv[0]) if argv else DEFAULT_LEDGERS
+    rows = int(argv[1]) if len(argv) > 1 else DEFAULT_ROWS
+    with tempfile.TemporaryDirectory() as tmp:
+        mismatches = 0
+        for seed in range(ledgers):
+            path = Path(tmp) / f"ledger_{seed}.csv"
+            rng = random.Random(seed)
+            WriteLedger(path, rng)
+            mismatches += not CheckLedger(path, rng)
+        print(f"{ledgers} random ledgers, {mismatches} mismatches")
+
+        path = Path(tmp) / "big.csv"
+        BuildLedgerCsv(path, rows, seed=5)
+        dao = TransactionDAO(str(path))
+        dao.GetDataFrame()
+        t0 = time.perf_counter()
+        balance = dao.DailyBalanceData()
+        t1 = time.perf_counter()
+        dao.SpendMovingAverageData(WINDOWS, category="Food")
+        dao.DailyBalanceData()
+        t2 = time.perf_counter()
+        print(f"{rows:,} rows over {len(balance):,} days: first build "
+              f"{t1 - t0:.3f}s, cached balance + averages "
+              f"{(t2 - t1) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
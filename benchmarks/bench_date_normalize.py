@@ -0,0 +1,90 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: Date Normalization Benchmark
+
+# PURPOSE: Compare per-row NormalizeDateStr against the vectorized
+# NormalizeDateColumn on synthetic date columns.
+
+# INPUT: Optional row counts on the command line (default 10k/100k/1M).
+
+# PROCESS: Build mixed-format date columns, time both normalizers, and check
+# that they produce identical output.
+
+# OUTPUT: A timing table printed to the console.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Benchmark: per-row vs column-level date normalization.
+
+Run from the repo root:
+    python -m benchmarks.bench_date_normalize [rows ...]
+"""
+
+import sys
+import time
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from src.dao.transaction_dao import (
+    DateInFormats,
+    NormalizeDateColumn,
+    NormalizeDateStr,
+)
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+
+# Dates outside the datetime64[ns] range and unparseable cells, mixed in so
+# the parity check covers the fallback paths
+EDGE_DATES = ("3025/01/05", "1500/01/01", "01/05/3025", "2262/04/12",
+              "not a date", "")
+
+
+def BuildDateColumn(rows: int, seed: int = 7) -> pd.Series:
+    """Return *rows* dates spread over three years in mixed input formats,
+    with EDGE_DATES sprinkled in."""
+    rng = np.random.default_rng(seed)
+    start = date(2023, 1, 1)
+    offsets = rng.integers(0, 3 * 365, size=rows)
+    fmt_idx = rng.integers(0, len(DateInFormats), size=rows)
+    values = [
+        (start + timedelta(days=int(o))).strftime(DateInFormats[f])
+        for o, f in zip(offsets, fmt_idx)
+    ]
+    for i, pos in enumerate(rng.integers(0, rows, size=len(EDGE_DATES))):
+        values[pos] = EDGE_DATES[i]
+    return pd.Series(values, dtype=object)
+
+
+def TimeIt(func, *args) -> tuple[float, object]:
+    """Return (elapsed seconds, result) for a single call."""
+    t0 = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - t0, result
+
+
+def main(argv: list[str]) -> None:
+    """Run the benchmark for each requested size and print a table."""
+    sizes = [int(a) for a in argv] or list(DEFAULT_SIZES)
+    print(f"{'rows':>10} {'per-row (s)':>12} {'column (s)':>11} "
+          f"{'speedup':>8} {'equal':>6}")
+    for rows in sizes:
+        col = BuildDateColumn(rows)
+        t_row, per_row = TimeIt(col.map, NormalizeDateStr)
+        t_col, column = TimeIt(NormalizeDateColumn, col)
+        equal = (per_row.astype(object).tolist()
+                 == column.astype(object).tolist())
+        print(f"{rows:>10,} {t_row:>12.3f} {t_col:>11.3f} "
+              f"{t_row / t_col:>7.1f}x {str(equal):>6}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
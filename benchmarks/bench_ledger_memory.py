@@ -0,0 +1,109 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: Ledger Memory Benchmark
+
+# PURPOSE: Compare bytes per row of the loaded ledger frame with plain
+# string columns against the compact categorical layout.
+
+# INPUT: Optional row count on the command line (default 1M).
+
+# PROCESS: Write a synthetic ledger CSV, load it through TransactionDAO,
+# rebuild the old object-string layout from the same frame, and measure
+# both with DataFrame.memory_usage(deep=True).
+
+# OUTPUT: A per-column bytes-per-row table printed to the console.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Benchmark: in-memory ledger size, string vs categorical columns.
+
+Run from the repo root:
+    python -m benchmarks.bench_ledger_memory [rows]
+"""
+
+import sys
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.dao.transaction_dao import TransactionDAO
+
+DEFAULT_ROWS = 1_000_000
+
+# (type, category, descriptions) drawn for synthetic rows
+LEDGER_SHAPES = (
+    ("expense", "Bills", ("Rent", "Electric Bill", "Water Bill",
+                          "Internet Bill", "Cell Phone Bill")),
+    ("expense", "Food", ("Groceries", "Coffee", "Dinner Out", "Lunch Out",
+                         "Tacos")),
+    ("expense", "Transportation", ("Gas", "Parking", "Rideshare",
+                                   "Car Wash", "Maintenance")),
+    ("expense", "Entertainment", ("Movie Night", "Concert Tickets",
+                                  "Streaming Subscription")),
+    ("expense", "Healthcare", ("Copay", "Pharmacy", "Vision Exam")),
+    ("expense", "Personal", ("Haircut", "Clothes", "Gym Membership")),
+    ("expense", "Savings", ("Vacation Fund", "Emergency Fund")),
+    ("income", "Salary", ("HQ Paycheck", "Direct Deposit")),
+    ("income", "Investments", ("ETF Payout", "Interest Income")),
+    ("income", "Other", ("Refund", "Gift")),
+)
+
+
+def BuildLedgerCsv(path: Path, rows: int, seed: int = 7) -> None:
+    """Write *rows* synthetic transactions over three years to *path*."""
+    rng = np.random.default_rng(seed)
+    shapes = rng.integers(0, len(LEDGER_SHAPES), size=rows)
+    picks = rng.integers(0, 5, size=rows)
+    start = date(2023, 1, 1)
+    days = [(start + timedelta(days=d)).strftime("%Y/%m/%d")
+            for d in range(3 * 365)]
+    frame = pd.DataFrame({
+        "transaction": [LEDGER_SHAPES[s][0] for s in shapes],
+        "category": [LEDGER_SHAPES[s][1] for s in shapes],
+        "description": [LEDGER_SHAPES[s][2][p % len(LEDGER_SHAPES[s][2])]
+                        for s, p in zip(shapes, picks)],
+        "amount": np.round(rng.uniform(1, 2500, size=rows), 2),
+        "date": np.asarray(days, dtype=object)[
+            rng.integers(0, len(days), size=rows)],
+    })
+    frame.to_csv(path, index=False)
+
+
+def BytesPerRow(df: pd.DataFrame) -> pd.Series:
+    """Return deep memory usage per column divided by the row count."""
+    usage = df.memory_usage(deep=True, index=False)
+    return usage / max(len(df), 1)
+
+
+def main(argv: list[str]) -> None:
+    """Build the ledger, load it both ways and print bytes per row."""
+    rows = int(argv[0]) if argv else DEFAULT_ROWS
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "ledger.csv"
+        BuildLedgerCsv(path, rows)
+        compact = TransactionDAO(str(path)).GetDataFrame()
+    strings = compact.astype(
+        {c: object for c in TransactionDAO.CATEGORICAL_COLUMNS})
+
+    before, after = BytesPerRow(strings), BytesPerRow(compact)
+    print(f"{rows:,} rows")
+    print(f"{'column':>12} {'before':>9} {'after':>9} {'dtype':>16}")
+    for col in compact.columns:
+        print(f"{col:>12} {before[col]:>9.1f} {after[col]:>9.1f} "
+              f"{str(compact[col].dtype):>16}")
+    print(f"{'total':>12} {before.sum():>9.1f} {after.sum():>9.1f} "
+          f"{before.sum() / after.sum():>15.1f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
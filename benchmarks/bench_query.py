@@ -0,0 +1,106 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: Query Engine Check
+
+# PURPOSE: Check GillPayService.Query against the DAO's hand-written
+# reports and time cold vs cached queries on a large ledger.
+
+# INPUT: Optional number of random ledgers and rows for the timing run.
+
+# PROCESS: Compare grouped Query results with the category and monthly
+# reports on seeded messy ledgers, then time a first query (one pass) and
+# a repeat (cache hit) on a synthetic ledger.
+
+# OUTPUT: Mismatch count and timing lines printed to the console.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Check: GillPayService.Query vs the DAO reports, plus cache timing.
+
+Run from the repo root:
+    python -m benchmarks.bench_query [ledgers] [rows]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_cents_totals import WriteLedger
+from benchmarks.bench_ledger_memory import BuildLedgerCsv
+from src.dao.transaction_dao import TransactionDAO
+from src.gillpay_service import GillPayService
+
+DEFAULT_LEDGERS = 100
+DEFAULT_ROWS = 1_000_000
+
+
+def CheckLedger(path: Path) -> bool:
+    """Return True if Query reproduces the category reports and the
+    (month, type) totals."""
+    service = GillPayService(TransactionDAO(str(path)))
+    reports = service.TransactionDAO.GetReports()
+    for type_key, report in (("expense", reports.expense),
+                             ("income", reports.income)):
+        got = service.Query(filters={"type": type_key},
+                            date_range=(None, None),
+                            group_by=["category"], order_by=["-sum",
+                                                             "category"])
+        if (got["category"].tolist() != report["category"].tolist()
+                or got["sum"].tolist() != report["amount"].tolist()):
+            return False
+    by_month = service.Query(date_range=(None, None),
+                             group_by=["month", "type"])
+    got = {(str(m), t): round(v * 100) for m, t, v in
+           by_month.itertuples(index=False)}
+    # Reference: a plain Python pass over the valid-date rows
+    want: dict = {}
+    df = service.TransactionDAO.GetDataFrame()
+    df = df[df["datetime"].notna()]
+    for m, t, c in zip(df["month"].astype(str),
+                       df["transaction"].astype(str).str.strip().str.lower(),
+                       df["cents"]):
+        want[(m, t)] = want.get((m, t), 0) + int(c)
+    return got == want
+
+
+def main(argv: list[str]) -> None:
+    """Check random ledgers, then time cold and cached queries."""
+    ledgers = int(argv[0]) if argv else DEFAULT_LEDGERS
+    rows = int(argv[1]) if len(argv) > 1 else DEFAULT_ROWS
+    with tempfile.TemporaryDirectory() as tmp:
+        mismatches = 0
+        for seed in range(ledgers):
+            path = Path(tmp) / f"ledger_{seed}.csv"
+            WriteLedger(path, random.Random(seed))
+            mismatches += not CheckLedger(path)
+        print(f"{ledgers} random ledgers, {mismatches} mismatches")
+
+        path = Path(tmp) / "big.csv"
+        BuildLedgerCsv(path, rows, seed=3)
+        service = GillPayService(TransactionDAO(str(path)))
+        service.TransactionDAO.GetDataFrame()
+        query = dict(filters={"type": "expense"},
+                     date_range=("2024/01/01", None),
+                     group_by=["month", "category"],
+                     metrics=["sum", "count", "mean"], order_by="-sum",
+                     limit=10)
+        t0 = time.perf_counter()
+        service.Query(**query)
+        t1 = time.perf_counter()
+        service.Query(**query)
+        t2 = time.perf_counter()
+        print(f"{rows:,} rows: first query {t1 - t0:.3f}s, "
+              f"cached repeat {(t2 - t1) * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
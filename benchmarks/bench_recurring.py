@@ -0,0 +1,177 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: Recurring Detector Check
+
+# PURPOSE: Check RecurringDetector against a per-bucket Python reference,
+# confirm planted series are found, and time it on a large ledger.
+
+# INPUT: Optional number of random ledgers and rows for the timing run.
+
+# PROCESS: Plant weekly, biweekly, monthly, quarterly and yearly series in
+# random noise, compare the detector with a dict-of-lists reference, then
+# time a cold detection and a cached call on a synthetic ledger.
+
+# OUTPUT: Mismatch count and timing lines printed to the console.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Check: recurring-transaction detector vs a per-bucket reference.
+
+Run from the repo root:
+    python -m benchmarks.bench_recurring [ledgers] [rows]
+"""
+
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.bench_ledger_memory import BuildLedgerCsv
+from src.dao.transaction_dao import TransactionDAO
+from src.recurring_detector import RecurringDetector
+
+DEFAULT_LEDGERS = 50
+DEFAULT_ROWS = 1_000_000
+
+# (type, category, description, amount, frequency, step)
+SERIES = [
+    ("expense", "Bills", "Rent", "3150.00", "monthly", "month"),
+    ("expense", "Personal", "Gym #{n}", "39.99", "monthly", "month"),
+    ("income", "Salary", " PAYCHECK {n}", "2100.00", "biweekly", 14),
+    ("expense", "Food", "Meal kit", "64.5", "weekly", 7),
+    ("expense", "Insurance", "Auto policy", "410", "quarterly", "quarter"),
+    ("expense", "Personal", "Domain renewal", "15", "yearly", "year"),
+]
+
+
+def SeriesRows(rng: random.Random, spec: tuple, end: date) -> list[list]:
+    """Return 3-12 occurrences of one planted series ending near *end*."""
+    kind, category, text, amount, _, step = spec
+    count = rng.randint(3, 12)
+    when = []
+    for i in range(count):
+        back = count - 1 - i
+        if step == "month":
+            when.append(pd.Timestamp(end) - pd.DateOffset(months=back))
+        elif step == "quarter":
+            when.append(pd.Timestamp(end) - pd.DateOffset(months=3 * back))
+        elif step == "year":
+            when.append(pd.Timestamp(end) - pd.DateOffset(years=back))
+        else:
+            when.append(pd.Timestamp(end) - pd.Timedelta(days=step * back))
+    return [[rng.choice([kind, kind.title(), f" {kind}"]), category,
+             text.format(n=rng.randint(1, 999)), amount,
+             w.strftime("%Y/%m/%d")] for w in when]
+
+
+def WriteLedger(path: Path, rng: random.Random) -> None:
+    """Write random noise plus a few planted series to *path*."""
+    rows = []
+    for _ in range(rng.randint(0, 200)):
+        day = date(2024, 1, 1) + timedelta(days=rng.randint(0, 700))
+        rows.append([rng.choice(["income", "expense"]),
+                     rng.choice(["Food", "Bills", "Other"]),
+                     f"shop {rng.randint(0, 5)}",
+                     f"{rng.uniform(1, 60):.2f}",
+                     rng.choice([day.strftime("%Y/%m/%d"), "bad"])])
+    for spec in rng.sample(SERIES, rng.randint(0, len(SERIES))):
+        end = date(2025, 6, 1) + timedelta(days=rng.randint(0, 90))
+        rows += SeriesRows(rng, spec, end)
+    rng.shuffle(rows)
+    frame = pd.DataFrame(rows, columns=["transaction", "category",
+                                        "description", "amount", "date"])
+    frame.to_csv(path, index=False)
+
+
+def Reference(df: pd.DataFrame, min_occurrences: int) -> set:
+    """Return {(type, category, description, frequency, next date)}
+    using plain dicts and per-bucket loops."""
+    buckets = defaultdict(list)
+    for row in df.itertuples(index=False):
+        if pd.isna(row.datetime):
+            continue
+        key = (str(row.transaction).strip().lower(),
+               str(row.category).strip().lower(),
+               RecurringDetector.NormalizeDescription(row.description),
+               round(row.cents / 100))
+        buckets[key].append(row)
+    found = set()
+    for rows in buckets.values():
+        if len(rows) < min_occurrences:
+            continue
+        rows.sort(key=lambda r: r.datetime.normalize())
+        days = [r.datetime.normalize() for r in rows]
+        gaps = [(b - a).days for a, b in zip(days, days[1:])]
+        mean = statistics.fmean(gaps)
+        name, nominal, tol, months = min(
+            RecurringDetector.PERIODS, key=lambda p: abs(mean - p[1]))
+        regular = sum(abs(g - nominal) <= tol for g in gaps)
+        if regular < RecurringDetector.MIN_REGULAR * len(gaps):
+            continue
+        step = (pd.DateOffset(months=months) if months
+                else pd.Timedelta(days=nominal))
+        found.add((str(rows[-1].transaction).strip().lower(),
+                   str(rows[-1].category), str(rows[-1].description),
+                   name, days[-1] + step))
+    return found
+
+
+def CheckLedger(path: Path) -> bool:
+    """Return True if the detector matches the reference on *path*."""
+    dao = TransactionDAO(str(path))
+    result = RecurringDetector(dao).Detect()
+    got = {(r.type, r.category, r.description, r.frequency, r.next_date)
+           for r in result.itertuples(index=False)}
+    want = Reference(dao.GetDataFrame(), 3)
+    return got == want and len(got) == len(result)
+
+
+def main(argv: list[str]) -> None:
+    """Check random ledgers, then time detection on a large one."""
+    ledgers = int(argv[0]) if argv else DEFAULT_LEDGERS
+    rows = int(argv[1]) if len(argv) > 1 else DEFAULT_ROWS
+    with tempfile.TemporaryDirectory() as tmp:
+        mismatches = 0
+        for seed in range(ledgers):
+            path = Path(tmp) / f"ledger_{seed}.csv"
+            WriteLedger(path, random.Random(seed))
+            mismatches += not CheckLedger(path)
+        print(f"{ledgers} random ledgers, {mismatches} mismatches")
+
+        path = Path(tmp) / "big.csv"
+        BuildLedgerCsv(path, rows, seed=11)
+        rng = random.Random(11)
+        planted = [r for spec in SERIES
+                   for r in SeriesRows(rng, spec, date(2025, 12, 1))]
+        pd.DataFrame(planted).to_csv(path, mode="a", header=False,
+                                     index=False)
+        dao = TransactionDAO(str(path))
+        dao.GetDataFrame()
+        detector = RecurringDetector(dao)
+        t0 = time.perf_counter()
+        result = detector.Detect()
+        t1 = time.perf_counter()
+        detector.Detect()
+        t2 = time.perf_counter()
+        found = set(result["frequency"] + ":" + result["category"])
+        missing = [s for s in SERIES if f"{s[4]}:{s[1]}" not in found]
+        print(f"{rows:,} rows: {len(result)} recurrences, "
+              f"{len(missing)} planted series missed; cold "
+              f"{t1 - t0:.3f}s, cached {(t2 - t1) * 1e6:.0f}us")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,90 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: Transaction Summary Benchmark
+
+# PURPOSE: Compare the object-based income/expense summary against the
+# vectorized GillPayService.GetTransactionSummary.
+
+# INPUT: Optional row counts on the command line (default 10k/100k/1M).
+
+# PROCESS: Write a synthetic ledger, then time both summaries on a cold
+# DAO (includes the CSV parse) and on a warm one, and check they agree.
+
+# OUTPUT: A timing table printed to the console.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Benchmark: Transaction-list summary vs vectorized summary.
+
+Run from the repo root:
+    python -m benchmarks.bench_transaction_summary [rows ...]
+"""
+
+import math
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_ledger_memory import BuildLedgerCsv
+from src.dao.transaction_dao import TransactionDAO
+from src.gillpay_service import GillPayService
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+
+
+def ListSummary(service: GillPayService) -> dict[str, float]:
+    """The previous summary: two filtered Transaction lists, summed in
+    a Python loop."""
+    income = service.CalculateSum(service.GetIncomeData())
+    expense = service.CalculateSum(service.GetExpenseData())
+    return {"income": income, "expense": expense, "net": income - expense}
+
+
+def VectorSummary(service: GillPayService) -> dict[str, float]:
+    """The current GetTransactionSummary."""
+    return service.GetTransactionSummary()
+
+
+def TimeSummary(func, path: Path, warm: bool) -> tuple[float, dict]:
+    """Return (elapsed seconds, summary) on a fresh or pre-loaded DAO."""
+    service = GillPayService()
+    service.TransactionDAO = TransactionDAO(str(path))
+    if warm:
+        service.TransactionDAO.GetDataFrame()
+    t0 = time.perf_counter()
+    result = func(service)
+    return time.perf_counter() - t0, result
+
+
+def Agree(a: dict[str, float], b: dict[str, float]) -> bool:
+    """Return True if both summaries match to within a cent."""
+    return all(math.isclose(a[k], b[k], abs_tol=0.005) for k in a)
+
+
+def main(argv: list[str]) -> None:
+    """Run the benchmark for each requested size and print a table."""
+    sizes = [int(a) for a in argv] or list(DEFAULT_SIZES)
+    print(f"{'rows':>10} {'cache':>6} {'list (s)':>9} {'vector (s)':>11} "
+          f"{'speedup':>8} {'equal':>6}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sizes:
+            path = Path(tmp) / f"ledger_{rows}.csv"
+            BuildLedgerCsv(path, rows)
+            for warm in (False, True):
+                t_list, old = TimeSummary(ListSummary, path, warm)
+                t_vec, new = TimeSummary(VectorSummary, path, warm)
+                print(f"{rows:>10,} {'warm' if warm else 'cold':>6} "
+                      f"{t_list:>9.3f} {t_vec:>11.3f} "
+                      f"{t_list / t_vec:>7.1f}x {str(Agree(old, new)):>6}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
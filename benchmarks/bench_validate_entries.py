@@ -0,0 +1,118 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: Batch Validation Check
+
+# PURPOSE: Check that GillPayService.ValidateEntries agrees with
+# ValidateEntry row for row, and time both on large frames.
+
+# INPUT: Optional number of random rows for the parity check and the
+# timing run.
+
+# PROCESS: Build a seeded frame of valid and broken entries (bad types,
+# dates, categories, amounts, blank descriptions), run ValidateEntry per
+# row and ValidateEntries once, and compare codes and messages.
+
+# OUTPUT: Mismatch count and timing lines printed to the console.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Check: vectorized ValidateEntries vs the per-row ValidateEntry.
+
+Run from the repo root:
+    python -m benchmarks.bench_validate_entries [rows] [timing_rows]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.dao.transaction_dao import TransactionDAO
+from src.gillpay_service import GillPayService
+from src.models.transaction import Transaction
+
+DEFAULT_ROWS = 20_000
+DEFAULT_TIMING_ROWS = 200_000
+
+
+def RandomFrame(rows: int, seed: int) -> pd.DataFrame:
+    """Return a frame of entries mixing every kind of failure."""
+    rng = random.Random(seed)
+
+    def Pick(*choices):
+        return [rng.choice(choices) for _ in range(rows)]
+
+    return pd.DataFrame({
+        "transaction": Pick("income", "expense", " Expense ", "INCOME",
+                            "transfer", "", None),
+        "category": Pick("Salary", "food", " Rent ", "Other", "other",
+                         "Groceries", "Nope", "", None),
+        "description": Pick("Paycheck", "  ", "", "Coffee", None),
+        "amount": Pick(12.5, 0, -3, "7.25", "abc", "", None, float("nan"),
+                       "1e3", 1500, "inf", float("inf")),
+        "date": Pick("2025/01/31", "2024/02/29", "2025/02/29", "2025-01-31",
+                     "31/01/2025", "", None, "2025/13/01"),
+    })
+
+
+def PerRow(service: GillPayService, frame: pd.DataFrame) -> list[str]:
+    """Return ValidateEntry's message per row ('' when it passes).
+
+    Missing cells are passed the way ValidateEntries reads them: '' for
+    text and NaN for the amount.
+    """
+    text = frame.drop(columns="amount").fillna("")
+    amounts = frame["amount"].astype(object)
+    amounts = amounts.where(amounts.notna(), float("nan"))
+    messages = []
+    for row, amount in zip(text.itertuples(index=False), amounts):
+        tx = Transaction(transaction=row.transaction, category=row.category,
+                         description=row.description, amount=amount,
+                         date=row.date)
+        try:
+            service.ValidateEntry(tx)
+            messages.append("")
+        except ValueError as ex:
+            messages.append(str(ex))
+    return messages
+
+
+def main(argv: list[str]) -> None:
+    """Compare both validators, then time them."""
+    rows = int(argv[0]) if argv else DEFAULT_ROWS
+    timing_rows = int(argv[1]) if len(argv) > 1 else DEFAULT_TIMING_ROWS
+    with tempfile.TemporaryDirectory() as tmp:
+        service = GillPayService(TransactionDAO(str(Path(tmp) / "l.csv")))
+
+        frame = RandomFrame(rows, seed=1)
+        expected = PerRow(service, frame)
+        checked = service.ValidateEntries(frame)
+        mismatches = sum(a != b for a, b in zip(expected, checked.messages))
+        mismatches += int(np.sum(checked.valid
+                                 != np.array([m == "" for m in expected])))
+        print(f"{rows:,} random rows, {mismatches} mismatches, "
+              f"{int(checked.valid.sum()):,} valid")
+
+        frame = RandomFrame(timing_rows, seed=2)
+        t0 = time.perf_counter()
+        PerRow(service, frame)
+        t1 = time.perf_counter()
+        service.ValidateEntries(frame)
+        t2 = time.perf_counter()
+        print(f"{timing_rows:,} rows: ValidateEntry loop {t1 - t0:.3f}s, "
+              f"ValidateEntries {t2 - t1:.3f}s")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -9,7 +9,8 @@
 
 # INPUT: Reads transactions via TransactionDAO, user actions in the GUI.
 
-# PROCESS: Initializes theme and notebook tabs, displays summary metrics, and
+# PROCESS: Paints the window shell first, then loads the ledger and builds
+# each notebook tab on first selection; displays summary metrics, and
 # updates figures on data refresh.
 
 # OUTPUT: A Tkinter-based window with tabs for adding, viewing, reporting, and
@@ -29,25 +30,52 @@ app."""
 import os
 os.environ["PANDAS_COPY_ON_WRITE"] = "1"
 
+import time
+
+# Taken before the other imports so --startup-profile covers module loading
+_STARTED = time.perf_counter()
+
+import argparse
+import importlib
 import tkinter as tk
 import sys
 from tkinter import ttk
 from pathlib import Path
 from src.ui.theme import ApplyTheme
-from src.ui.tab_view import ViewTransactionsTab
-from src.ui.tab_add import AddTransactionTab
-from src.ui.tab_report_category import ReportCategoryTab
-from src.ui.tab_report_month import ReportMonthTab
-from src.dao.transaction_dao import TransactionDAO
-from src.ui.tab_charts import ChartsTab
+
+# Notebook tabs in display order: (text, module, class, keyword arguments
+# taken from app attributes). A tab's module is imported and the tab built
+# the first time it is selected, so tkcalendar and Matplotlib load only
+# when a tab needs them.
+TABS = (
+    ("Add Transaction", "src.ui.tab_add", "AddTransactionTab",
+     {"budgets": "Budgets"}),
+    ("View Transactions", "src.ui.tab_view", "ViewTransactionsTab",
+     {"on_refresh": "RefreshSummary"}),
+    ("Report: Category", "src.ui.tab_report_category", "ReportCategoryTab",
+     {"budgets": "Budgets"}),
+    ("Report: Month", "src.ui.tab_report_month", "ReportMonthTab", {}),
+    ("Visualizations", "src.ui.tab_charts", "ChartsTab", {}),
+)
+
+# --startup-profile budget: mark -> (max seconds since start, packages that
+# must not be imported by then)
+GUI_STARTUP_BUDGET = {
+    "imports": (0.3, ("numpy", "pandas", "matplotlib", "tkcalendar")),
+    "first paint": (1.0, ("numpy", "pandas", "matplotlib", "tkcalendar")),
+    "ready": (3.0, ("matplotlib",)),
+}
 
 
 class GillPayApp(tk.Tk):
     """Main Tkinter application for GillPay."""
 
-    def __init__(self):
-        """Initialize the window, theme, tabs, and summary bar."""
+    def __init__(self, Profile=None):
+        """Paint the window shell (theme, title, summary bar, empty tabs),
+        then load the ledger and build the selected tab. *Profile* is an
+        optional StartupProfile that receives the startup marks."""
         super().__init__()
+        self.Profile = Profile
         self.title("GillPay\u2122")
         self.geometry("1024x680")
 
@@ -106,27 +134,76 @@ class GillPayApp(tk.Tk):
         except Exception:
             pass
 
-        self.Dao = TransactionDAO()
+        # Set by LoadLedger once the window is on screen
+        self.Store = None
+        self.Dao = None
+        self.Budgets = None
 
         self.BuildSummaryBar()
 
         self.Notebook = ttk.Notebook(self, style="Gill.TNotebook")
         self.Notebook.pack(expand=True, fill="both", padx=10, pady=(10, 6))
 
-        view_tab = ViewTransactionsTab(self.Notebook, self.Dao,
-                                       on_refresh=self.RefreshSummary)
-        add_tab = AddTransactionTab(self.Notebook, self.Dao, view_tab)
-        report_cat_tab = ReportCategoryTab(self.Notebook, self.Dao)
-        report_month_tab = ReportMonthTab(self.Notebook, self.Dao)
-        charts_tab = ChartsTab(self.Notebook)
-
-        self.Notebook.add(add_tab, text="Add Transaction")
-        self.Notebook.add(view_tab, text="View Transactions")
-        self.Notebook.add(report_cat_tab, text="Report: Category")
-        self.Notebook.add(report_month_tab, text="Report: Month")
-        self.Notebook.add(charts_tab, text="Visualizations")
+        # One placeholder page per tab; BuildTab fills it on first selection
+        self.Pages = []
+        self.Tabs = {}
+        for text, _, _, _ in TABS:
+            page = ttk.Frame(self.Notebook)
+            ttk.Label(page, text="Loading\u2026").pack(pady=24)
+            self.Notebook.add(page, text=text)
+            self.Pages.append(page)
+        self.Notebook.bind(
+            "<<NotebookTabChanged>>",
+            lambda event: self.BuildTab(self.Notebook.index("current")))
+        self.Mark("shell built")
+
+        # Draw the shell before the Pandas-backed imports in LoadLedger
+        self.update()
+        self.Mark("first paint")
+        self.LoadLedger()
+
+    def Mark(self, label):
+        """Record a startup mark when profiling."""
+        if self.Profile is not None:
+            self.Profile.Mark(label)
+
+    def LoadLedger(self):
+        """Import the data layers, open the shared ledger store, and build
+        the selected tab."""
+        from src.dao.transaction_dao import TransactionDAO
+        from src.ledger_store import LedgerStore
+        from src.budget_engine import BudgetEngine
+        self.Mark("ledger imports")
+
+        # One ledger store shared by every tab; a save publishes a single
+        # change that each built tab and the summary bar redraw from.
+        self.Store = LedgerStore(TransactionDAO())
+        self.Dao = self.Store.Dao
+        # Subscribed before the tabs so budgets are current when they redraw
+        self.Budgets = BudgetEngine(self.Store)
 
         self.RefreshSummary()
+        # The view tab, once built, re-renders the bar for its filters
+        self.Store.Subscribe(lambda change: self.RefreshSummary(change.Frame))
+        self.Mark("ledger loaded")
+
+        self.BuildTab(self.Notebook.index("current"))
+        self.Mark("ready")
+
+    def BuildTab(self, index):
+        """Import and build the tab at *index* the first time it shows."""
+        if self.Store is None or index in self.Tabs:
+            return
+        _, module, name, options = TABS[index]
+        page = self.Pages[index]
+        for child in page.winfo_children():
+            child.destroy()
+        tab_class = getattr(importlib.import_module(module), name)
+        tab = tab_class(page, self.Store,
+                        **{k: getattr(self, attr) for k, attr in
+                           options.items()})
+        tab.pack(expand=True, fill="both")
+        self.Tabs[index] = tab
 
     def BuildSummaryBar(self):
         """Create the income, expense, and net summary labels."""
@@ -148,28 +225,56 @@ class GillPayApp(tk.Tk):
         self.LblNet.pack(side="left", padx=(0, 16), pady=6)
 
     def RefreshSummary(self, df=None):
-        """Update the summary labels using current transaction totals."""
+        """Update the summary labels using current transaction totals,
+        summed as whole cents."""
+        from src.dao.transaction_dao import AmountToCents
+        income = expense = 0
         try:
             if df is None:
-                df = self.Dao.GetDataFrame()
+                df = self.Store.Snapshot()
         except Exception:
-            income = expense = 0.0
+            pass
         else:
-            t = df["transaction"].astype(str).str.lower()
-            income = float(df.loc[t.eq("income"), "amount"].sum())
-            expense = float(df.loc[t.eq("expense"), "amount"].sum())
-
-        net = income - expense
+            t = df["transaction"].astype(str).str.lower().to_numpy()
+            cents = (df["cents"].to_numpy() if "cents" in df.columns
+                     else AmountToCents(df["amount"]))
+            income = int(cents[t == "income"].sum())
+            expense = int(cents[t == "expense"].sum())
+
+        net, income, expense = ((income - expense) / 100, income / 100,
+                                expense / 100)
         self.LblIncome.config(text=f"Income: ${income:,.2f}")
         self.LblExpense.config(text=f"Expense: ${expense:,.2f}")
         self.LblNet.config(text=f"Net: ${net:,.2f}")
 
 
-def Main():
-    """Entry point to launch the GillPay GUI."""
-    App = GillPayApp()
+def Main(argv=None):
+    """Entry point to launch the GillPay GUI.
+
+    With --startup-profile the window opens, the import/first-paint
+    breakdown is printed to stderr once the first tab is ready, and the app
+    exits (status 3 when over GUI_STARTUP_BUDGET).
+    """
+    parser = argparse.ArgumentParser(description="GillPay desktop app.")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="print the startup breakdown and exit")
+    args = parser.parse_args(argv)
+
+    profile = None
+    if args.startup_profile:
+        from src.startup_profile import StartupProfile
+        profile = StartupProfile("gillpay gui", _STARTED)
+        profile.Mark("imports")
+
+    App = GillPayApp(profile)
+    if profile is not None:
+        App.destroy()
+        from src.startup_profile import BUDGET_EXCEEDED_STATUS
+        return BUDGET_EXCEEDED_STATUS if profile.Report(
+            GUI_STARTUP_BUDGET) else 0
     App.mainloop()
+    return 0
 
 
 if __name__ == "__main__":
-    Main()
+    sys.exit(Main())
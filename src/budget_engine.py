@@ -0,0 +1,183 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: BudgetEngine
+
+# PURPOSE: Track spend-to-date per (category, month) against the monthly
+# budgets in BudgetDAO without re-aggregating the ledger.
+
+# INPUT: The shared LedgerStore and its change events; a BudgetDAO.
+
+# PROCESS: Seed an accumulator of expense cents keyed by (month, category)
+# from the persisted monthly rollup (or one grouped pass over the ledger),
+# then fold only the appended rows of each save into it.
+
+# OUTPUT: BudgetStatus values (budget, spent, remaining) per category and
+# month in O(1) each.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Incremental monthly budget tracking for GillPay."""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable
+
+import numpy as np
+from pandas import DataFrame
+
+from src.dao.budget_dao import BudgetDAO
+from src.dao.transaction_dao import FoldedCodes
+from src.ledger_store import LedgerChange, LedgerStore
+
+
+@dataclass(frozen=True)
+class BudgetStatus:
+    """Budget position of one category for one month, in dollars."""
+
+    Category: str
+    Month: str
+    Budget: float
+    Spent: float
+
+    @property
+    def Remaining(self) -> float:
+        """Budget left this month (negative once overspent)."""
+        return round(self.Budget - self.Spent, 2)
+
+    @property
+    def IsOver(self) -> bool:
+        """True when spend exceeds the budget."""
+        return self.Spent > self.Budget
+
+
+class BudgetEngine:
+    """Spend-to-date accumulator for monthly category budgets.
+
+    Spent holds expense cents per ('YYYY-MM', folded category), counted
+    the way the reports count them (valid dates only, type and category
+    matched ignoring case and surrounding spaces). It is seeded once and
+    then kept current from the store's change events: a save folds just
+    its appended rows, anything else (first load, outside edit) reseeds.
+    """
+
+    def __init__(self, store: LedgerStore, budgets: BudgetDAO | None = None):
+        """Subscribe to *store*; the accumulator is seeded on first use."""
+        self.Store = store
+        self.Budgets = budgets if budgets is not None else BudgetDAO()
+        self.Spent: dict[tuple[str, str], int] = {}
+        self._Seeded = False
+        self._Subscribers: list[Callable[[], None]] = []
+        store.Subscribe(self.OnLedgerChanged)
+
+    def Subscribe(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Register *callback* for budget edits (ledger changes come from
+        the store); returns an unsubscribe function."""
+        self._Subscribers.append(callback)
+
+        def Unsubscribe() -> None:
+            if callback in self._Subscribers:
+                self._Subscribers.remove(callback)
+
+        return Unsubscribe
+
+    def SetBudget(self, category: str, amount) -> None:
+        """Set a category's monthly budget and notify subscribers."""
+        self.Budgets.SetBudget(category, amount)
+        self._Publish()
+
+    def RemoveBudget(self, category: str) -> None:
+        """Remove a category's monthly budget and notify subscribers."""
+        self.Budgets.RemoveBudget(category)
+        self._Publish()
+
+    def _Publish(self) -> None:
+        """Call every budget-edit subscriber."""
+        for callback in list(self._Subscribers):
+            callback()
+
+    @staticmethod
+    def MonthKey(when=None) -> str:
+        """Return 'YYYY-MM' for a date, a 'YYYY/MM/DD' string or today."""
+        if when is None:
+            when = date.today()
+        if isinstance(when, str):
+            return when.strip().replace("/", "-")[:7]
+        return f"{when.year:04d}-{when.month:02d}"
+
+    def OnLedgerChanged(self, change: LedgerChange) -> None:
+        """Fold a save's appended rows, or reseed after any other change."""
+        if self._Seeded and change.Appended is not None:
+            self._Fold(change.Appended)
+        else:
+            self._Seed(change.Frame)
+
+    def SpentCents(self, category: str, month=None) -> int:
+        """Return expense cents for a category in a month; O(1)."""
+        self._EnsureSeeded()
+        return self.Spent.get((self.MonthKey(month),
+                               BudgetDAO.Fold(category)), 0)
+
+    def Status(self, category: str, month=None) -> BudgetStatus | None:
+        """Return the category's budget position for *month* (default:
+        this month), or None when it has no budget."""
+        budget = self.Budgets.GetBudgetCents(category)
+        if budget is None:
+            return None
+        return BudgetStatus(Category=str(category).strip(),
+                            Month=self.MonthKey(month), Budget=budget / 100,
+                            Spent=self.SpentCents(category, month) / 100)
+
+    def MonthStatuses(self, month=None) -> dict[str, BudgetStatus]:
+        """Return {category: BudgetStatus} for every budgeted category."""
+        return {name: self.Status(name, month)
+                for name in self.Budgets.ListBudgets()}
+
+    def _EnsureSeeded(self) -> None:
+        """Seed from the store's current snapshot if no event has yet."""
+        if not self._Seeded:
+            # A first load publishes a change, which seeds via the event
+            frame = self.Store.Snapshot()
+            if not self._Seeded:
+                self._Seed(frame)
+
+    def _Seed(self, frame: DataFrame) -> None:
+        """Rebuild the accumulator, preferring the DAO's monthly rollup
+        (O(rollup keys)) over a grouped pass on *frame*."""
+        self.Spent = {}
+        self._Seeded = True
+        rollup = getattr(self.Store.Dao, "Rollup", None)
+        if rollup is None:
+            self._Fold(frame)
+            return
+        for (month, tx_type, category), (cents, _) in (
+                rollup.Refresh().Entries().items()):
+            if tx_type == "expense":
+                key = (month, BudgetDAO.Fold(category))
+                self.Spent[key] = self.Spent.get(key, 0) + cents
+
+    def _Fold(self, frame: DataFrame) -> None:
+        """Add the expense rows of a ledger frame to the accumulator."""
+        if frame is None or frame.empty:
+            return
+        type_codes, types = FoldedCodes(frame["transaction"])
+        kinds = np.append(types, "")[type_codes]
+        mask = (kinds == "expense") & frame["datetime"].notna().to_numpy()
+        if not mask.any():
+            return
+        category_codes, categories = FoldedCodes(frame["category"])
+        folded = np.append([BudgetDAO.Fold(c) for c in categories], "")
+        spent = frame["cents"].to_numpy()[mask]
+        months = frame["month"].astype(str).to_numpy()[mask]
+        keys = folded[category_codes[mask]]
+        totals = DataFrame({"m": months, "c": keys, "s": spent}).groupby(
+            ["m", "c"], sort=False)["s"].sum()
+        for (month, category), cents in totals.items():
+            key = (month, category)
+            self.Spent[key] = self.Spent.get(key, 0) + int(cents)
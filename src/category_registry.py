@@ -0,0 +1,84 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: CategoryRegistry
+
+# PURPOSE: Map the raw category strings found in the ledger to stable
+# integer ids and one display name per case/space variant.
+
+# INPUT: Raw category values from ledger reports; per-row cents to total.
+
+# PROCESS: Fold each new raw string (strip + lower) once, give every folded
+# key the next free id, and total cents per id with one bincount.
+
+# OUTPUT: Id arrays and {DisplayCategory: total} dicts for charts.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Canonical category ids and display names for GillPay charts."""
+
+from typing import Dict, Iterable
+
+import numpy as np
+
+
+class CategoryRegistry:
+    """Append-only map from raw category strings to canonical ids.
+
+    Raw strings that differ only in case or surrounding spaces ('Food',
+    ' food ') share one id and one display name (the stripped, title-cased
+    key). Ids never change once assigned, so id arrays built for an older
+    data version stay valid after new categories are registered.
+    """
+
+    def __init__(self) -> None:
+        """Start empty; ids are handed out in registration order."""
+        self._RawIds: dict[str, int] = {}
+        self._KeyIds: dict[str, int] = {}
+        self.Names: list[str] = []
+
+    def __len__(self) -> int:
+        """Return the number of canonical categories."""
+        return len(self.Names)
+
+    @staticmethod
+    def Key(raw) -> str:
+        """Return the folded key that identifies a category."""
+        return str(raw).strip().lower()
+
+    def Id(self, raw) -> int:
+        """Return the id for *raw*, registering it on first sight."""
+        raw = str(raw)
+        found = self._RawIds.get(raw)
+        if found is not None:
+            return found
+        key = self.Key(raw)
+        found = self._KeyIds.get(key)
+        if found is None:
+            found = len(self.Names)
+            self._KeyIds[key] = found
+            self.Names.append(key.title())
+        self._RawIds[raw] = found
+        return found
+
+    def Ids(self, raws: Iterable) -> np.ndarray:
+        """Return an intp array with the id of every raw value."""
+        return np.fromiter((self.Id(r) for r in raws), dtype=np.intp)
+
+    def Totals(self, ids: np.ndarray, cents: np.ndarray) -> Dict[str, float]:
+        """Return {DisplayCategory: total} from per-row ids and cents.
+
+        Categories appear in the order their first row appears in *ids*.
+        """
+        if len(ids) == 0:
+            return {}
+        sums = np.bincount(ids, weights=cents, minlength=len(self.Names))
+        _, first = np.unique(ids, return_index=True)
+        order = ids[np.sort(first)]
+        return {self.Names[i]: float(np.rint(sums[i])) / 100 for i in order}
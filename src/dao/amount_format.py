@@ -0,0 +1,46 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: Amount Format Helpers
+
+# PURPOSE: The one rule for reading a raw ledger amount cell, shared by the
+# DAOs and the monthly rollup, without pulling in Pandas.
+
+# INPUT: Raw amount cells as read from a CSV ledger.
+
+# PROCESS: Accept plain decimal numbers (optional sign, fraction and
+# exponent, surrounding whitespace) and parse them with float().
+
+# OUTPUT: Float amounts and whole-cent integers.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Pandas-free amount parsing for GillPay ledgers."""
+
+import math
+import re
+
+# A ledger amount; float() alone would also take '1_000', 'nan', 'inf' and
+# non-ASCII digits or spaces
+AmountPattern = re.compile(
+    r"\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*", re.ASCII)
+
+
+def ParseAmount(cell: str) -> float:
+    """Return the amount in a raw cell; 0.0 if it is not a ledger amount."""
+    return float(cell) if AmountPattern.fullmatch(cell) else 0.0
+
+
+def AmountCents(cell: str) -> int:
+    """Return a raw amount cell as whole cents, rounded half-to-even.
+
+    Unparseable and non-finite amounts are 0 cents.
+    """
+    cents = ParseAmount(cell) * 100
+    return round(cents) if math.isfinite(cents) else 0
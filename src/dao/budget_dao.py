@@ -0,0 +1,178 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: BudgetDAO
+
+# PURPOSE: Manage monthly expense budgets per category stored in a CSV file.
+
+# INPUT: CSV path (optional) and category/amount parameters from callers.
+
+# PROCESS: Read/write budget rows (cached per file version), matching
+# categories case-insensitively, and provide list/set/remove operations.
+
+# OUTPUT: Updated CSV and per-category monthly budgets in whole cents.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+
+"""Data-access object for monthly category budgets backed by CSV."""
+
+import csv
+import math
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+
+@dataclass
+class _BudgetTable:
+    """Parsed budget rows plus the folded-name lookup derived from them."""
+
+    Key: tuple[int, int, int] | None
+    Rows: List[Dict[str, str]]
+    # folded category -> (display name, budget cents)
+    Index: Dict[str, tuple[str, int]] = field(default_factory=dict)
+
+
+class BudgetDAO:
+    """Monthly expense budgets with CSV persistence.
+
+    Columns:
+        - category: expense category display name
+        - monthly_budget: amount allowed per calendar month
+
+    Categories match case-insensitively and ignoring surrounding spaces.
+    Rows are cached per file path and keyed on the file's (size, mtime,
+    inode), like CategoryDAO, so lookups never re-read an unchanged file.
+    """
+
+    COLUMNS = ["category", "monthly_budget"]
+
+    # CSV path -> cached table, shared across instances
+    _Tables: Dict[Path, _BudgetTable] = {}
+
+    def __init__(self, datasource: str | None = None):
+        """Bind to <repo>/data/budgets.csv; create header if missing."""
+        if datasource is None:
+            repo_root = Path(__file__).resolve().parents[2]
+            self.CsvPath = repo_root / "data" / "budgets.csv"
+        else:
+            self.CsvPath = Path(datasource).resolve()
+
+        self.CsvPath.parent.mkdir(parents=True, exist_ok=True)
+
+        if not self.CsvPath.exists():
+            with self.CsvPath.open("w", newline="", encoding="utf-8") as f:
+                csv.DictWriter(f, fieldnames=self.COLUMNS).writeheader()
+
+    def Load(self) -> List[Dict[str, str]]:
+        """Return all normalized budget rows (copies callers may edit)."""
+        return [dict(r) for r in self._Table().Rows]
+
+    def Save(self, rows: List[Dict[str, str]]) -> None:
+        """Write all budget rows to CSV and refresh the cache from them."""
+        rows = [self._NormalizeRow(r) for r in rows]
+        with self.CsvPath.open("w", newline="", encoding="utf-8") as f:
+            w = csv.DictWriter(f, fieldnames=self.COLUMNS)
+            w.writeheader()
+            for r in rows:
+                w.writerow(r)
+        self._Tables[self.CsvPath] = self._BuildTable(self._FileKey(), rows)
+
+    def _Table(self) -> _BudgetTable:
+        """Return the cached table, re-reading the CSV only when its
+        (size, mtime, inode) key changed."""
+        key = self._FileKey()
+        table = self._Tables.get(self.CsvPath)
+        if table is None or key is None or table.Key != key:
+            table = self._BuildTable(key, self._ReadRows())
+            self._Tables[self.CsvPath] = table
+        return table
+
+    @classmethod
+    def _BuildTable(cls, key, rows: List[Dict[str, str]]) -> _BudgetTable:
+        """Index rows by folded category; a later row wins."""
+        table = _BudgetTable(key, rows)
+        for r in rows:
+            cents = cls._ToCents(r["monthly_budget"])
+            if r["category"] and cents is not None:
+                table.Index[cls.Fold(r["category"])] = (r["category"], cents)
+        return table
+
+    def _ReadRows(self) -> List[Dict[str, str]]:
+        """Read and normalize all budget rows from CSV."""
+        with self.CsvPath.open("r", newline="", encoding="utf-8") as f:
+            return [self._NormalizeRow(row) for row in csv.DictReader(f)]
+
+    @staticmethod
+    def _NormalizeRow(row: Dict[str, str]) -> Dict[str, str]:
+        """Return a row with a trimmed category and budget text."""
+        return {
+            "category": (row.get("category") or "").strip(),
+            "monthly_budget": (row.get("monthly_budget") or "").strip(),
+        }
+
+    @staticmethod
+    def _ToCents(amount) -> int | None:
+        """Return a budget amount as whole cents, None if not a number."""
+        try:
+            value = float(amount)
+        except (TypeError, ValueError):
+            return None
+        return round(value * 100) if math.isfinite(value) else None
+
+    def _FileKey(self) -> tuple[int, int, int] | None:
+        """Return the (size, mtime_ns, inode) version key of the CSV file."""
+        try:
+            st = os.stat(self.CsvPath)
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns, st.st_ino
+
+    @staticmethod
+    def Fold(category) -> str:
+        """Return the case/space-insensitive key for a category."""
+        return str(category or "").strip().casefold()
+
+    def ListBudgets(self) -> Dict[str, float]:
+        """Return {category: monthly budget} sorted case-insensitively."""
+        index = self._Table().Index
+        return {name: cents / 100 for name, cents in
+                sorted(index.values(), key=lambda v: v[0].casefold())}
+
+    def GetBudgetCents(self, category: str) -> int | None:
+        """Return the monthly budget in cents for *category*, or None;
+        O(1) per lookup."""
+        found = self._Table().Index.get(self.Fold(category))
+        return None if found is None else found[1]
+
+    def SetBudget(self, category: str, amount) -> None:
+        """Create or replace the monthly budget for a category."""
+        name = (category or "").strip()
+        if not name:
+            raise ValueError("Category name cannot be empty.")
+        cents = self._ToCents(amount)
+        if cents is None:
+            raise ValueError("Budget must be a number.")
+        if cents <= 0:
+            raise ValueError("Budget must be greater than zero.")
+        rows = [r for r in self.Load()
+                if self.Fold(r["category"]) != self.Fold(name)]
+        rows.append({"category": name,
+                     "monthly_budget": f"{cents / 100:.2f}"})
+        self.Save(rows)
+
+    def RemoveBudget(self, category: str) -> None:
+        """Delete the budget for a category (no-op when none is set)."""
+        rows = self.Load()
+        kept = [r for r in rows
+                if self.Fold(r["category"]) != self.Fold(category)]
+        if len(kept) != len(rows):
+            self.Save(kept)
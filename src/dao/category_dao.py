@@ -8,8 +8,8 @@
 
 # INPUT: CSV path (optional) and category parameters from callers.
 
-# PROCESS: Initialize default categories, read/write CSV rows, and provide
-# list/add/rename/delete operations.
+# PROCESS: Initialize default categories, read/write CSV rows (cached per
+# file version), and provide list/add/rename/delete operations.
 
 # OUTPUT: Updated CSV and lists of category names for the GUI.
 
@@ -24,10 +24,24 @@
 """Data-access object for category management (Income/Expense) backed by CSV."""
 
 import csv
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Dict
 
 
+@dataclass
+class _CategoryTable:
+    """Parsed category rows plus lookups derived from them."""
+
+    Key: tuple[int, int, int] | None
+    Rows: List[Dict[str, str]]
+    # (type, include_inactive) -> deduped, casefold-sorted names
+    Names: Dict[tuple[str, bool], List[str]] = field(default_factory=dict)
+    # type -> {casefolded name: canonical active name}
+    Casefold: Dict[str, Dict[str, str]] = field(default_factory=dict)
+
+
 class CategoryDAO:
     """Category data access with CSV persistence.
 
@@ -35,10 +49,18 @@ class CategoryDAO:
         - type: "Income" or "Expense"
         - name: category display name
         - is_active: "1" (active) or "0" (inactive)
+
+    Parsed rows are cached per file path, shared by every instance, and
+    keyed on the file's (size, mtime, inode), so repeated lookups and new
+    instances skip the CSV read; Save refreshes the cache without a
+    re-read.
     """
 
     COLUMNS = ["type", "name", "is_active"]
 
+    # CSV path -> cached table, shared across instances
+    _Tables: Dict[Path, _CategoryTable] = {}
+
     def __init__(self, datasource: str | None = None):
         """Bind to <repo>/data/categories.csv; create header if missing and
         guarantee 'Other' exists for both Income and Expense."""
@@ -56,40 +78,63 @@ class CategoryDAO:
                 csv.DictWriter(f, fieldnames=self.COLUMNS).writeheader()
 
         # Ensure 'Other' exists for both types (since UI/validation expects it)
-        rows = self.Load()
-        changed = False
-        for t in ("Income", "Expense"):
-            if not any(r["type"] == t and (
-                    r["name"] or "").strip().lower() == "other" for r in rows):
+        rows = self._Table().Rows
+        missing = [t for t in ("Income", "Expense")
+                   if not any(r["type"] == t and (
+                    r["name"] or "").strip().lower() == "other" for r in rows)]
+        if missing:
+            rows = self.Load()
+            for t in missing:
                 rows.append({"type": t, "name": "Other", "is_active": "1"})
-                changed = True
-        if changed:
             self.Save(rows)
 
     def Load(self) -> List[Dict[str, str]]:
-        """Read and normalize all category rows from CSV."""
-        rows: List[Dict[str, str]] = []
-        with self.CsvPath.open("r", newline="", encoding="utf-8") as f:
-            r = csv.DictReader(f)
-            for row in r:
-                rows.append(
-                    {
-                        "type": (row.get("type") or "").strip().title(),
-                        "name": (row.get("name") or "").strip(),
-                        "is_active": "1"
-                        if (row.get("is_active") or "1").strip() == "1"
-                        else "0",
-                    }
-                )
-        return rows
+        """Return all normalized category rows (copies callers may edit)."""
+        return [dict(r) for r in self._Table().Rows]
 
     def Save(self, rows: List[Dict[str, str]]) -> None:
-        """Write all category rows to CSV."""
+        """Write all category rows to CSV and refresh the cache from them."""
+        rows = [self._NormalizeRow(r) for r in rows]
         with self.CsvPath.open("w", newline="", encoding="utf-8") as f:
             w = csv.DictWriter(f, fieldnames=self.COLUMNS)
             w.writeheader()
             for r in rows:
                 w.writerow(r)
+        self._Tables[self.CsvPath] = _CategoryTable(self._FileKey(), rows)
+
+    def _Table(self) -> _CategoryTable:
+        """Return the cached table, re-reading the CSV only when its
+        (size, mtime, inode) key changed."""
+        key = self._FileKey()
+        table = self._Tables.get(self.CsvPath)
+        if table is None or key is None or table.Key != key:
+            table = _CategoryTable(key, self._ReadRows())
+            self._Tables[self.CsvPath] = table
+        return table
+
+    def _ReadRows(self) -> List[Dict[str, str]]:
+        """Read and normalize all category rows from CSV."""
+        with self.CsvPath.open("r", newline="", encoding="utf-8") as f:
+            return [self._NormalizeRow(row) for row in csv.DictReader(f)]
+
+    @staticmethod
+    def _NormalizeRow(row: Dict[str, str]) -> Dict[str, str]:
+        """Return a row with trimmed type/name and a '1'/'0' active flag."""
+        return {
+            "type": (row.get("type") or "").strip().title(),
+            "name": (row.get("name") or "").strip(),
+            "is_active": "1"
+            if (row.get("is_active") or "1").strip() == "1"
+            else "0",
+        }
+
+    def _FileKey(self) -> tuple[int, int, int] | None:
+        """Return the (size, mtime_ns, inode) version key of the CSV file."""
+        try:
+            st = os.stat(self.CsvPath)
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns, st.st_ino
 
     def NormalizeType(self, gui_type: str) -> str:
         """Map user/GUI input to canonical 'Income' or 'Expense'."""
@@ -100,16 +145,38 @@ class CategoryDAO:
                           include_inactive: bool = False) -> List[str]:
         """Return unique, case-insensitive sorted names for a given type."""
         t = self.NormalizeType(gui_type)
-        names: List[str] = []
-        for r in self.Load():
-            if r["type"] == t and (include_inactive or r["is_active"] == "1"):
-                names.append(r["name"])
-        seen, out = set(), []
-        for n in sorted(names, key=str.casefold):
+        return list(self._SortedNames(self._Table(), t, include_inactive))
+
+    def CanonicalName(self, gui_type: str, name: str) -> str | None:
+        """Return the active category matching *name* case-insensitively
+        (as ListCategoryNames spells it), or None; O(1) per lookup."""
+        t = self.NormalizeType(gui_type)
+        table = self._Table()
+        index = table.Casefold.get(t)
+        if index is None:
+            index = {n.casefold(): n
+                     for n in self._SortedNames(table, t, False)}
+            table.Casefold[t] = index
+        return index.get((name or "").strip().casefold())
+
+    @staticmethod
+    def _SortedNames(table: _CategoryTable, t: str,
+                     include_inactive: bool) -> List[str]:
+        """Return the cached deduped, casefold-sorted names for a type."""
+        names = table.Names.get((t, include_inactive))
+        if names is not None:
+            return names
+        matches = [r["name"] for r in table.Rows
+                   if r["type"] == t and (include_inactive
+                                          or r["is_active"] == "1")]
+        seen: set[str] = set()
+        names = []
+        for n in sorted(matches, key=str.casefold):
             if n.casefold() not in seen:
-                out.append(n)
+                names.append(n)
                 seen.add(n.casefold())
-        return out
+        table.Names[(t, include_inactive)] = names
+        return names
 
     def AddCategory(self, gui_type: str, name: str) -> None:
         """Add a new active category or reactivate an existing inactive one."""
@@ -0,0 +1,65 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: Date Format Helpers
+
+# PURPOSE: Canonical ledger date format, the scalar normalizer and the
+# date-validity rule shared by the DAOs, without pulling in Pandas.
+
+# INPUT: Date strings in any of the accepted input formats.
+
+# PROCESS: Try each accepted format with datetime.strptime.
+
+# OUTPUT: 'YYYY/MM/DD' strings and validated dates.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Pandas-free date normalization for GillPay ledgers."""
+
+from datetime import date, datetime
+
+# Accepted input date formats.
+DateInFormats = (
+    "%Y/%m/%d",  # 2025/10/05
+    "%Y-%m-%d",  # 2025-10-05
+    "%m/%d/%Y",  # 10/05/2025
+    "%m-%d-%Y",  # 10-05-2025
+    "%d %b %Y",  # 05 Oct 2025
+    "%d %B %Y",  # 05 October 2025
+)
+
+
+def NormalizeDateStr(s: str) -> str:
+    """Normalize many common date strings to 'YYYY/MM/DD'.
+    Returns '' for falsy input; returns original string when unparseable.
+    """
+    s = (s or "").strip()
+    if not s:
+        return ""
+    for fmt in DateInFormats:
+        try:
+            return datetime.strptime(s, fmt).strftime("%Y/%m/%d")
+        except ValueError:
+            continue
+    return s
+
+
+# Valid ledger dates: the span a datetime64[ns] column can hold
+MinDate = date(1677, 9, 22)
+MaxDate = date(2262, 4, 11)
+
+
+def ParseDateStr(s: str) -> date | None:
+    """Return the date *s* names, or None when NormalizeDateStr(s) is not a
+    'YYYY/MM/DD' date between MinDate and MaxDate."""
+    try:
+        d = datetime.strptime(NormalizeDateStr(s), "%Y/%m/%d").date()
+    except ValueError:
+        return None
+    return d if MinDate <= d <= MaxDate else None
@@ -0,0 +1,320 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: MonthlyRollup
+
+# PURPOSE: Persisted (month, type, category) totals for a CSV ledger so
+# monthly reports cost O(months) instead of O(transactions).
+
+# INPUT: Path to the ledger CSV; appended CSV text from the DAO.
+
+# PROCESS: Keep cents sums and row counts keyed by (month, type, category)
+# in <ledger>.rollup.json together with the ledger's (size, mtime, inode)
+# key and a CRC-32 of the bytes folded so far. Appends fold in directly;
+# a grown file whose prefix still matches the CRC folds only the new bytes;
+# anything else rebuilds from scratch.
+
+# OUTPUT: Monthly income/expense cent totals, whole-ledger totals per raw
+# type cell, and the rollup JSON file.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Materialized monthly rollup of a GillPay CSV ledger.
+
+Pure standard library so callers that only need monthly totals can skip
+Pandas entirely.
+"""
+
+import csv
+import io
+import json
+import os
+import zlib
+from pathlib import Path
+
+from src.dao.amount_format import AmountCents
+from src.dao.date_format import ParseDateStr
+
+ROLLUP_FORMAT = 4
+
+# Bytes read at a time while checksumming or folding the ledger
+CrcBlockBytes = 1024 * 1024
+
+
+class MonthlyRollup:
+    """(month 'YYYY-MM', type, category) -> [cents, count] for one ledger.
+
+    Rows are bucketed the way the DAO's report kernel buckets them: type is
+    stripped and lower-cased, amounts are read with AmountCents, and rows
+    ParseDateStr rejects are left out. Kinds separately totals
+    every row, dated or not, under its raw type cell, which is what the
+    account summary sums. Only complete (newline-terminated) lines are
+    persisted; an unterminated last line is counted in memory until it is
+    finished.
+    """
+
+    def __init__(self, csv_path):
+        """Bind to *csv_path*; the rollup lives next to it."""
+        self.CsvPath = Path(csv_path)
+        self.Path = self.CsvPath.with_name(self.CsvPath.stem + ".rollup.json")
+        self.Totals: dict[tuple[str, str, str], list[int]] = {}
+        self.Kinds: dict[str, list[int]] = {}
+        self.Header: list[str] = []
+        self.Key: tuple[int, int, int] | None = None
+        self.Offset = 0
+        self.Crc = 0
+        self._Pending: dict[tuple[str, str, str], list[int]] = {}
+        self._PendingKinds: dict[str, list[int]] = {}
+        self._Loaded = False
+        self._Months: dict[str, str | None] = {}
+
+    # -------------------------
+    # Queries
+    # -------------------------
+
+    def Entries(self) -> dict[tuple[str, str, str], list[int]]:
+        """Return current (month, type, category) -> [cents, count]."""
+        return self._Merged(self.Totals, self._Pending)
+
+    @staticmethod
+    def _Merged(totals: dict, pending: dict) -> dict:
+        """Return *totals* with the in-memory *pending* overlay added."""
+        if not pending:
+            return totals
+        merged = {k: list(v) for k, v in totals.items()}
+        for k, (cents, count) in pending.items():
+            slot = merged.setdefault(k, [0, 0])
+            slot[0] += cents
+            slot[1] += count
+        return merged
+
+    def KindTotals(self) -> dict[str, list[int]]:
+        """Return raw type cell -> [cents, count] over every row."""
+        return self._Merged(self.Kinds, self._PendingKinds)
+
+    def MonthTypeTotals(self) -> dict[tuple[str, str], int]:
+        """Return (month, type) -> cents, summed over categories."""
+        out: dict[tuple[str, str], int] = {}
+        for (month, tx_type, _), (cents, _) in self.Entries().items():
+            out[(month, tx_type)] = out.get((month, tx_type), 0) + cents
+        return out
+
+    # -------------------------
+    # Maintenance
+    # -------------------------
+
+    def Refresh(self) -> "MonthlyRollup":
+        """Bring the totals in line with the ledger file and save them.
+
+        A matching (size, mtime, inode) key is trusted as is (apart from
+        re-reading an unfinished last line into memory). Otherwise
+        the bytes already folded are checksummed: when they are unchanged
+        only the appended bytes are parsed, else the rollup is rebuilt.
+        """
+        if self._CatchUp(rebuild=True):
+            self._Save()
+        return self
+
+    def Peek(self) -> "MonthlyRollup | None":
+        """Bring the totals in line in memory only; never writes a file.
+
+        Returns None, without parsing the ledger, when no rollup was saved
+        for it or it was rewritten since, i.e. whenever catching up would
+        mean folding the whole file.
+        """
+        return None if self._CatchUp(rebuild=False) is None else self
+
+    def _CatchUp(self, rebuild: bool) -> bool | None:
+        """Fold whatever the ledger gained since the loaded state (see
+        Refresh). Returns True when there is new state to save, False when
+        there is none, and None when a full rebuild was needed but not
+        allowed."""
+        self._Load()
+        key = self._FileKey()
+        if key is None:
+            self._Reset()
+            return False
+        if self.Key is None and not rebuild:
+            return None
+        if key == self.Key:
+            if key[0] > self.Offset and not self._PendingKinds:
+                # An unfinished last line is only counted in memory
+                with self.CsvPath.open("rb") as f:
+                    self._FoldFile(f)
+            return False
+        with self.CsvPath.open("rb") as f:
+            if not (key[2] == (self.Key or key)[2] and key[0] >= self.Offset
+                    and self._PrefixCrc(f, self.Offset) == self.Crc):
+                if not rebuild:
+                    return None
+                self._Reset()
+            self._FoldFile(f)
+        self.Key = key
+        return True
+
+    def Append(self, text: bytes, before_key, after_key) -> None:
+        """Fold CSV *text* the DAO just appended.
+
+        Applied only when the persisted rollup matched the file right
+        before the write (*before_key*); otherwise the next Refresh
+        catches up from the checksum.
+        """
+        if not self.Path.exists():
+            return
+        self._Load()
+        # Every unfinished row is in _PendingKinds, dated or not
+        if (before_key is None or before_key != self.Key
+                or before_key[0] != self.Offset or self._PendingKinds):
+            return
+        self._Fold([text])
+        self.Key = after_key
+        self._Save()
+
+    def _FoldFile(self, f) -> None:
+        """Fold *f* from Offset to the end, CrcBlockBytes at a time."""
+        f.seek(self.Offset)
+        self._Fold(iter(lambda: f.read(CrcBlockBytes), b""))
+
+    def _Fold(self, blocks) -> None:
+        """Add the complete lines of *blocks* (consecutive bytes starting
+        at Offset) to Totals, carrying each block's unfinished last line
+        into the next, and any unterminated remainder to the in-memory
+        overlay."""
+        self._Pending, self._PendingKinds = {}, {}
+        rest = b""
+        for block in blocks:
+            data = rest + block if rest else block
+            end = data.rfind(b"\n") + 1
+            rest = data[end:]
+            if end:
+                complete = data[:end]
+                self._AddRows(complete, self.Totals, self.Kinds,
+                              header=self.Offset == 0)
+                self.Crc = zlib.crc32(complete, self.Crc)
+                self.Offset += end
+        if rest.strip():
+            self._AddRows(rest, self._Pending, self._PendingKinds,
+                          header=self.Offset == 0)
+
+    def _AddRows(self, data: bytes, into: dict, kinds: dict,
+                 header: bool) -> None:
+        """Parse CSV bytes; add each dated row's cents to *into* and every
+        row's cents to *kinds* under its raw type cell.
+
+        The ledger's first bytes are decoded as utf-8-sig, so a leading
+        byte-order mark is dropped from the header as Pandas drops it.
+        """
+        text = data.decode("utf-8-sig" if header else "utf-8", "replace")
+        reader = csv.reader(io.StringIO(text, newline=""))
+        if header:
+            self.Header = next(reader, [])
+        cols = {name: i for i, name in enumerate(self.Header)}
+        t_i, c_i = cols.get("transaction"), cols.get("category")
+        a_i, d_i = cols.get("amount"), cols.get("date")
+
+        def Cell(row: list[str], i: int | None) -> str:
+            return row[i] if i is not None and i < len(row) else ""
+
+        for row in reader:
+            if not row or not any(row):
+                continue
+            cents = AmountCents(Cell(row, a_i))
+            kind = kinds.setdefault(Cell(row, t_i), [0, 0])
+            kind[0] += cents
+            kind[1] += 1
+            month = self._Month(Cell(row, d_i))
+            if month is None:
+                continue
+            k = (month, Cell(row, t_i).strip().lower(), Cell(row, c_i))
+            slot = into.setdefault(k, [0, 0])
+            slot[0] += cents
+            slot[1] += 1
+
+    def _Month(self, raw: str) -> str | None:
+        """Return 'YYYY-MM' for a raw date cell, None if it is invalid."""
+        month = self._Months.get(raw, "")
+        if month == "":
+            d = ParseDateStr(raw)
+            month = None if d is None else f"{d.year:04d}-{d.month:02d}"
+            self._Months[raw] = month
+        return month
+
+    # -------------------------
+    # Persistence
+    # -------------------------
+
+    def _Load(self) -> None:
+        """Read the persisted rollup once; a missing or unreadable file
+        leaves an empty rollup that Refresh will rebuild."""
+        if self._Loaded:
+            return
+        self._Loaded = True
+        try:
+            state = json.loads(self.Path.read_text(encoding="utf-8"))
+            if state.get("format") != ROLLUP_FORMAT:
+                return
+            totals = {(m, t, c): [int(cents), int(count)]
+                      for m, t, c, cents, count in state["rows"]}
+            kinds = {t: [int(cents), int(count)]
+                     for t, cents, count in state["kinds"]}
+            key = tuple(state["key"])
+            offset, crc = int(state["offset"]), int(state["crc32"])
+            header = list(state["header"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        self.Totals, self.Key, self.Offset = totals, key, offset
+        self.Kinds = kinds
+        self.Crc, self.Header = crc, header
+
+    def _Save(self) -> None:
+        """Write the rollup atomically; failures only cost persistence."""
+        state = {
+            "format": ROLLUP_FORMAT,
+            "key": list(self.Key or ()),
+            "offset": self.Offset,
+            "crc32": self.Crc,
+            "header": self.Header,
+            "rows": [[*k, *v] for k, v in sorted(self.Totals.items())],
+            "kinds": [[k, *v] for k, v in sorted(self.Kinds.items())],
+        }
+        tmp = self.Path.with_name(self.Path.name + ".tmp")
+        try:
+            tmp.write_text(json.dumps(state, separators=(",", ":")),
+                           encoding="utf-8")
+            os.replace(tmp, self.Path)
+        except OSError:
+            pass
+
+    def _Reset(self) -> None:
+        """Drop all totals so the next fold starts from byte 0."""
+        self.Totals, self._Pending = {}, {}
+        self.Kinds, self._PendingKinds = {}, {}
+        self.Header, self.Key = [], None
+        self.Offset = self.Crc = 0
+
+    def _FileKey(self) -> tuple[int, int, int] | None:
+        """Return the ledger's (size, mtime_ns, inode), or None."""
+        try:
+            st = self.CsvPath.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_size, st.st_mtime_ns, st.st_ino
+
+    @staticmethod
+    def _PrefixCrc(f, length: int) -> int:
+        """Return the CRC-32 of the first *length* bytes of *f*."""
+        f.seek(0)
+        crc, left = 0, length
+        while left > 0:
+            block = f.read(min(CrcBlockBytes, left))
+            if not block:
+                break
+            crc = zlib.crc32(block, crc)
+            left -= len(block)
+        return crc
@@ -0,0 +1,379 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: SqliteTransactionDAO
+
+# PURPOSE: SQLite storage backend for GillPay transactions with indexed
+# queries, plus a one-shot CSV to SQLite migration command.
+
+# INPUT: SQLite path and transaction parameters from callers; a CSV path for
+# migration.
+
+# PROCESS: Store rows with normalized key columns; answer range, filter,
+# duplicate and aggregate queries with indexed SQL.
+
+# OUTPUT: DataFrames and Transaction lists matching the CSV DAO.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""SQLite-backed TransactionDAO.
+
+Selected automatically when TransactionDAO is given a path ending in
+.sqlite, .sqlite3 or .db. Migrate an existing CSV ledger with:
+
+    python -m src.dao.sqlite_transaction_dao data/gillpay_data.csv \\
+        data/gillpay_data.sqlite
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+from contextlib import closing
+from pathlib import Path
+from typing import Iterable
+
+import pandas as pd
+from pandas import DataFrame
+
+from src.dao.date_format import ParseDateStr
+from src.dao.transaction_dao import TransactionDAO, NormalizeDateStr
+from src.models.transaction import Transaction
+from src.models.transaction_batch import TransactionBatch
+
+SQLITE_SUFFIXES = (".sqlite", ".sqlite3", ".db")
+
+# Database header bytes holding the big-endian file change counter, which
+# SQLite increments on every committed write in rollback-journal mode
+CHANGE_COUNTER = slice(24, 28)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id            INTEGER PRIMARY KEY,
+    "transaction" TEXT NOT NULL DEFAULT '',
+    category      TEXT NOT NULL DEFAULT '',
+    description   TEXT NOT NULL DEFAULT '',
+    amount        REAL NOT NULL DEFAULT 0,
+    date          TEXT NOT NULL DEFAULT '',
+    type_key      TEXT NOT NULL DEFAULT '',
+    category_key  TEXT NOT NULL DEFAULT '',
+    description_key TEXT NOT NULL DEFAULT '',
+    cents         INTEGER NOT NULL DEFAULT 0,
+    date_key      INTEGER
+);
+CREATE INDEX IF NOT EXISTS ix_transactions_date
+    ON transactions (date_key);
+CREATE INDEX IF NOT EXISTS ix_transactions_type_category
+    ON transactions (type_key, category, date_key);
+CREATE INDEX IF NOT EXISTS ix_transactions_duplicate
+    ON transactions (date, type_key, category_key, description_key, cents);
+"""
+
+INSERT_SQL = (
+    'INSERT INTO transactions ("transaction", category, description, amount, '
+    "date, type_key, category_key, description_key, cents, date_key) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def IsSqlitePath(datasource) -> bool:
+    """Return True if *datasource* names a SQLite database file."""
+    return (datasource is not None
+            and Path(str(datasource)).suffix.lower() in SQLITE_SUFFIXES)
+
+
+def DateKey(date_str: str) -> int | None:
+    """Return YYYYMMDD for a date ParseDateStr accepts, else None."""
+    d = ParseDateStr(date_str)
+    if d is None:
+        return None
+    return d.year * 10000 + d.month * 100 + d.day
+
+
+def _Text(value) -> str:
+    """Return a clean string for a possibly-missing cell."""
+    return "" if value is None or value != value else str(value)
+
+
+def _RowValues(transaction, category, description, amount, date) -> tuple:
+    """Return INSERT parameters with the derived key columns filled in."""
+    t, c, d = _Text(transaction), _Text(category), _Text(description)
+    amt = float(amount)
+    norm = NormalizeDateStr(_Text(date))
+    return (t, c, d, amt, norm,
+            t.strip().lower(), c.strip().lower(), d.strip().lower(),
+            round(amt * 100), DateKey(norm))
+
+
+class _SqliteSession:
+    """Connection context: commit on success, roll back on error, close."""
+
+    def __init__(self, path: str):
+        self.Path = path
+        self.Con: sqlite3.Connection | None = None
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.Con = sqlite3.connect(self.Path)
+        return self.Con
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        with closing(self.Con) as con:
+            if exc_type is None:
+                con.commit()
+            else:
+                con.rollback()
+
+
+class SqliteTransactionDAO(TransactionDAO):
+    """TransactionDAO backed by a SQLite database.
+
+    Keeps the public API of the CSV DAO; reads, filters, duplicate checks
+    and aggregations run as SQL over indexed key columns:
+      - date_key (YYYYMMDD) for range queries and month grouping
+      - (type_key, category, date_key) for the category reports
+      - (date, type_key, category_key, description_key, cents) for
+        IsDuplicate
+    """
+
+    def __init__(self, datasource: str, chunksize: int | None = None):
+        """Bind to *datasource* and create the schema if missing.
+
+        *chunksize* is accepted for API parity; SQLite aggregates inside
+        the database and never loads the ledger to report on it.
+        """
+        self.DbPath = Path(datasource).resolve()
+        self.DbPath.parent.mkdir(parents=True, exist_ok=True)
+        self.Datasource = str(self.DbPath)
+        self.ChunkSize = None
+        self._Reports = {}
+        self._ReportsVersion = None
+        self._Daily = None
+        self._DailyVersion = None
+        with self._Connect() as con:
+            con.executescript(SCHEMA)
+
+    def _Connect(self):
+        """Return a closing connection context that commits on success."""
+        return _SqliteSession(self.Datasource)
+
+    def _Query(self, sql: str, params: Iterable = ()) -> DataFrame:
+        """Run a SELECT and return the result as a DataFrame."""
+        with self._Connect() as con:
+            return pd.read_sql_query(sql, con, params=tuple(params))
+
+    def _Select(self, where: str = "", params: Iterable = (),
+                order_by: str = "id") -> DataFrame:
+        """Return canonical ledger columns for rows matching *where*, in
+        *order_by* order (default: insertion order)."""
+        sql = ('SELECT "transaction", category, description, amount, date, '
+               "cents, date_key FROM transactions")
+        if where:
+            sql += f" WHERE {where}"
+        df = self._Query(sql + f" ORDER BY {order_by}", params)
+        parsed = pd.to_datetime(df["date_key"], format="%Y%m%d",
+                                errors="coerce").rename("datetime")
+        df = df.astype({"amount": float, self.CENTS_COLUMN: "int64"}).loc[
+            :, self.COLUMNS + [self.CENTS_COLUMN]]
+        return self._AddDateColumns(self._CompactColumns(df), parsed)
+
+    @staticmethod
+    def _RangeClause(start=None, end=None) -> tuple[str, list] | None:
+        """Return an inclusive date_key filter; None if a bound is invalid."""
+        clause, params = "date_key IS NOT NULL", []
+        for bound, op in ((start, ">="), (end, "<=")):
+            if not bound:
+                continue
+            key = DateKey(NormalizeDateStr(str(bound)))
+            if key is None:
+                return None
+            clause += f" AND date_key {op} ?"
+            params.append(key)
+        return clause, params
+
+    # -------------------------
+    # Core load/query helpers
+    # -------------------------
+
+    def GetDataFrame(self) -> DataFrame:
+        """Load all transactions as a DataFrame in insertion order."""
+        return self._Select()
+
+    def _LoadFrame(self) -> DataFrame:
+        """Return a freshly queried frame (SQLite needs no parse cache)."""
+        return self._Select()
+
+    def GetTransactionsBy(self, column_name: str, column_value,
+                          as_batch: bool = False) -> (
+            list[Transaction] | TransactionBatch):
+        """Filter by a valid column name and value; return matching
+        transactions (as a TransactionBatch with *as_batch*)."""
+        if column_name not in self.COLUMNS:
+            raise ValueError(
+                f"Unknown column '{column_name}'. Expected one of "
+                f"{self.COLUMNS}."
+            )
+        df = self._Select(f'"{column_name}" = ?', [column_value])
+        if as_batch:
+            return TransactionBatch.FromDataFrame(df)
+        return self.ConvertToTransactionList(
+            df.loc[:, self.COLUMNS].values.tolist())
+
+    def GetDataFrameInRange(self, start=None, end=None) -> DataFrame:
+        """Return rows whose date falls in the inclusive [start, end], in
+        date order (ties in insertion order), as the CSV DAO does."""
+        rng = self._RangeClause(start, end)
+        if rng is None:
+            return self._Select("0")
+        return self._Select(*rng, order_by="date_key, id")
+
+    def _FrameInRange(self, start=None, end=None) -> DataFrame:
+        """Range rows straight from the date_key index."""
+        return self.GetDataFrameInRange(start, end)
+
+    # -------------------------
+    # Duplicate + persistence
+    # -------------------------
+
+    def IsDuplicate(self, tx: Transaction) -> bool:
+        """Check for an existing identical transaction (case-insensitive
+        fields, amount at 2 decimals)."""
+        try:
+            return self.FindDuplicates([tx])[0]
+        except (TypeError, ValueError):
+            return False
+
+    def FindDuplicates(self, transactions: Iterable[Transaction],
+                       within_batch: bool = False) -> list[bool]:
+        """Return, per transaction, whether it duplicates an existing row;
+        with *within_batch*, repeats inside the batch are flagged too."""
+        sql = ("SELECT 1 FROM transactions WHERE date = ? AND type_key = ? "
+               "AND category_key = ? AND description_key = ? AND cents = ? "
+               "LIMIT 1")
+        seen: set[tuple] = set()
+        flags = []
+        with self._Connect() as con:
+            for tx in transactions:
+                row = _RowValues(tx.transaction, tx.category, tx.description,
+                                 tx.amount, tx.date)
+                key = (row[4], *row[5:9])
+                hit = key in seen or con.execute(sql, key).fetchone()
+                flags.append(bool(hit))
+                if within_batch:
+                    seen.add(key)
+        return flags
+
+    def SaveTransactions(self, transactions: Iterable[Transaction]) -> None:
+        """Insert multiple transactions in a single SQL transaction."""
+        if not transactions:
+            return
+        rows = [_RowValues(tx.transaction, tx.category, tx.description,
+                           tx.amount, tx.date) for tx in transactions]
+        if not rows:
+            return
+        with self._Connect() as con:
+            con.executemany(INSERT_SQL, rows)
+
+    # -------------------------
+    # Aggregation kernel
+    # -------------------------
+
+    def SummaryByMonthData(self) -> DataFrame:
+        """Return DataFrame with columns: month ('FullMonth YYYY'), income,
+        expense, net; grouped in SQL, so no rollup file is kept."""
+        return self.GetReports().monthly.copy()
+
+    def DataVersion(self):
+        """Return (inode, file change counter, -wal key) for the database.
+
+        The header's change counter moves on every commit, however small
+        or quick; the inode catches a replaced file, and the -wal file's
+        (size, mtime) covers commits not yet checkpointed in WAL mode.
+        """
+        try:
+            with self.DbPath.open("rb") as f:
+                counter = int.from_bytes(f.read(CHANGE_COUNTER.stop)[
+                    CHANGE_COUNTER], "big")
+                inode = os.fstat(f.fileno()).st_ino
+        except FileNotFoundError:
+            return None
+        try:
+            st = self.DbPath.with_name(self.DbPath.name + "-wal").stat()
+            wal = st.st_size, st.st_mtime_ns
+        except FileNotFoundError:
+            wal = None
+        return inode, counter, wal
+
+    def _Totals(self, start=None, end=None) -> tuple[pd.Series, pd.Series]:
+        """Return (by_category, by_month) cent totals for [start, end] from
+        one GROUP BY over (type_key, category, month)."""
+        empty = self._PartialTotals(self._EmptyFrame())
+        rng = self._RangeClause(start, end)
+        if rng is None:
+            return empty
+        clause, params = rng
+        sql = ("SELECT type_key AS type, category, date_key / 100 AS ym, "
+               "SUM(cents) AS cents FROM transactions "
+               f"WHERE {clause} GROUP BY type_key, category, ym")
+        rows = self._Query(sql, params)
+        if rows.empty:
+            return empty
+        month = pd.to_datetime(
+            (rows["ym"] * 100 + 1).astype(str), format="%Y%m%d"
+        ).dt.to_period("M").rename("month")
+        cents = rows["cents"].astype("int64")
+        by_category = cents.groupby([rows["type"], rows["category"]],
+                                    sort=False).sum()
+        by_month = cents.groupby([month, rows["type"]], sort=False).sum()
+        return by_category, by_month
+
+
+def MigrateCsvToSqlite(csv_path: str, sqlite_path: str,
+                       replace: bool = False) -> int:
+    """Copy every row of a CSV ledger into a SQLite ledger.
+
+    Refuses to write into a database that already holds transactions
+    unless *replace* is True. Returns the number of rows migrated.
+    """
+    source = TransactionDAO(csv_path).GetDataFrame()
+    target = SqliteTransactionDAO(sqlite_path)
+    with target._Connect() as con:
+        existing = con.execute("SELECT COUNT(*) FROM transactions").fetchone()
+        if existing[0] and not replace:
+            raise ValueError(
+                f"{sqlite_path} already holds {existing[0]} transactions; "
+                f"re-run with replace (--replace) to overwrite them.")
+        con.execute("DELETE FROM transactions")
+        con.executemany(
+            INSERT_SQL,
+            (_RowValues(*r) for r in
+             source.loc[:, TransactionDAO.COLUMNS].itertuples(index=False)),
+        )
+    return len(source)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point for the one-shot CSV to SQLite migration."""
+    parser = argparse.ArgumentParser(
+        description="Migrate a GillPay CSV ledger into SQLite.")
+    parser.add_argument("csv", help="source CSV ledger")
+    parser.add_argument("sqlite", help="target .sqlite/.db file")
+    parser.add_argument("--replace", action="store_true",
+                        help="overwrite transactions already in the target")
+    args = parser.parse_args(argv)
+    try:
+        count = MigrateCsvToSqlite(args.csv, args.sqlite, args.replace)
+    except (OSError, ValueError) as ex:
+        print(f"Migration failed: {ex}", file=sys.stderr)
+        return 1
+    print(f"Migrated {count} transactions to {args.sqlite}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,8 +9,8 @@
 
 # INPUT: CSV path (optional) and transaction parameters from callers.
 
-# PROCESS: Load data with Pandas for querying; append rows with csv.writer;
-# normalize dates.
+# PROCESS: Load data with Pandas for querying (cached per file version);
+# append rows with csv.writer; normalize dates.
 
 # OUTPUT: DataFrames for UI/reporting and lists of Transaction objects.
 
@@ -23,40 +23,189 @@
 
 """Transaction CSV DAO used by GillPay."""
 
+import codecs
 import csv
+import hashlib
+import io
+import os
+import re
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable
-from datetime import datetime
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
+from src.dao.amount_format import ParseAmount
+from src.dao.date_format import (
+    DateInFormats,
+    MaxDate,
+    MinDate,
+    NormalizeDateStr,
+    ParseDateStr,
+)
+from src.dao.monthly_rollup import MonthlyRollup
 from src.models.transaction import Transaction
+from src.models.transaction_batch import TransactionBatch
 
-# Accepted input date formats.
-DateInFormats = (
-    "%Y/%m/%d",  # 2025/10/05
-    "%Y-%m-%d",  # 2025-10-05
-    "%m/%d/%Y",  # 10/05/2025
-    "%m-%d-%Y",  # 10-05-2025
-    "%d %b %Y",  # 05 Oct 2025
-    "%d %B %Y",  # 05 October 2025
-)
+# Bytes hashed at each end of the parsed prefix to detect rewrites.
+PrefixDigestBytes = 64 * 1024
+
+# The header line. Pandas also ends a line at a lone carriage return, and a
+# header ended that way is never appended to (see _CanAppendTo).
+HeaderPattern = re.compile(rb"[^\r\n]*(?:\r\n?|\n)?")
 
 
-def NormalizeDateStr(s: str) -> str:
-    """Normalize many common date strings to 'YYYY/MM/DD'.
-    Returns '' for falsy input; returns original string when unparseable.
+def NormalizeDateColumn(values: pd.Series) -> pd.Series:
+    """Vectorized NormalizeDateStr over a whole column.
+
+    Distinct values are resolved one format at a time with
+    `pd.to_datetime(format=...)`, leaving unparsed values for the next
+    format. Anything still unresolved (including dates outside the pandas
+    Timestamp range) falls back to NormalizeDateStr, so results match the
+    scalar function value for value. Missing values normalize to ''.
     """
-    s = (s or "").strip()
-    if not s:
-        return ""
+    return ParseDateColumn(values)[0]
+
+
+def ParseDateColumn(values: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """Return (normalized 'YYYY/MM/DD' strings, datetime64[ns]) for a column.
+
+    See NormalizeDateColumn; the datetime column is NaT wherever
+    ParseDateStr rejects the value.
+    """
+    clean = values.fillna("").astype(str).str.strip()
+    codes, uniques = pd.factorize(clean)
+    uniques = pd.Series(uniques, dtype=object)
+    out = uniques.copy()
+    stamps = pd.Series(pd.NaT, index=uniques.index, dtype="datetime64[ns]")
+    pending = uniques.ne("")
+
     for fmt in DateInFormats:
-        try:
-            return datetime.strptime(s, fmt).strftime("%Y/%m/%d")
-        except ValueError:
-            continue
-    return s
+        if not pending.any():
+            break
+        parsed = pd.to_datetime(uniques[pending], format=fmt, errors="coerce")
+        hit = parsed.index[parsed.notna()]
+        out[hit] = parsed[hit].dt.strftime("%Y/%m/%d")
+        # Newer pandas parses beyond the ns range; keep those as strings
+        # only and leave their stamp NaT
+        fits = hit[parsed[hit].between(pd.Timestamp(MinDate),
+                                       pd.Timestamp(MaxDate))]
+        stamps[fits] = parsed[fits].astype("datetime64[ns]")
+        pending[hit] = False
+
+    if pending.any():
+        out[pending] = uniques[pending].map(NormalizeDateStr)
+        valid = uniques[pending].map(ParseDateStr).dropna()
+        if len(valid):
+            stamps[valid.index] = pd.to_datetime(valid).astype(
+                "datetime64[ns]")
+
+    normalized = pd.Series(out.to_numpy()[codes], index=values.index,
+                           name=values.name, dtype=object)
+    parsed = pd.Series(stamps.to_numpy()[codes], index=values.index,
+                       name="datetime")
+    return normalized, parsed
+
+
+def ParseAmountColumn(values: pd.Series) -> pd.Series:
+    """Vectorized ParseAmount over a whole column of raw amount cells.
+
+    Each distinct cell is parsed once; missing cells are 0.0.
+    """
+    codes, uniques = pd.factorize(values)
+    amounts = np.fromiter(map(ParseAmount, uniques), dtype=float,
+                          count=len(uniques))
+    # A trailing 0.0 slot catches code -1 (missing)
+    return pd.Series(np.append(amounts, 0.0)[codes], index=values.index,
+                     name=values.name)
+
+
+def AmountToCents(values) -> np.ndarray:
+    """Return amounts as int64 cents, rounded half-to-even per row.
+
+    Non-numeric and non-finite amounts become 0, matching how the ledger
+    treats an unparseable amount.
+    """
+    amounts = pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(
+        dtype=float, na_value=np.nan)
+    cents = np.rint(amounts * 100)
+    return np.where(np.isfinite(cents), cents, 0).astype(np.int64)
+
+
+def FoldedCodes(values: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Return (per-row codes, distinct folded values) for a text column.
+
+    Folding strips spaces and lower-cases; code -1 marks a missing cell.
+    Categorical columns are folded once per category, not once per row.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes = values.array.codes
+        categories = values.cat.categories
+    else:
+        codes, categories = pd.factorize(values)
+    folded = np.array([str(c).strip().lower() for c in categories],
+                      dtype=object)
+    fold_codes, uniques = pd.factorize(folded)
+    lookup = np.append(fold_codes, -1)
+    return lookup[codes], np.asarray(uniques, dtype=object)
+
+
+def _CopyOnWriteEnabled() -> bool:
+    """Return True when pandas Copy-on-Write semantics are active."""
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except Exception:  # pandas 3+ is always Copy-on-Write
+        return True
+
+
+@dataclass
+class _LedgerCache:
+    """Parsed ledger plus the file position and version it reflects."""
+
+    Frame: DataFrame
+    Key: tuple[int, int, int]
+    Header: bytes
+    Offset: int
+    Rows: int
+    Digest: bytes
+    # Valid-date rows stably sorted by 'datetime', built on first range query
+    Sorted: DataFrame | None = None
+    SortedDates: np.ndarray | None = None
+    # Normalized duplicate keys, built on first duplicate check
+    DuplicateKeys: set[tuple] | None = None
+
+
+@dataclass(frozen=True)
+class LedgerReports:
+    """Every report frame for one date range, built from one grouped pass.
+
+    expense/income: ['category', 'amount']; combined: ['type', 'category',
+    'amount']; monthly: ['month', 'income', 'expense', 'net'].
+    """
+
+    expense: DataFrame
+    income: DataFrame
+    combined: DataFrame
+    monthly: DataFrame
+
+
+@dataclass(frozen=True)
+class DailyTotals:
+    """Per-day int64 cent totals on a gap-free calendar axis.
+
+    Days runs from the first to the last valid ledger date
+    (datetime64[D]); Income and Expense hold one total per day.
+    CategoryExpense is a (days x categories) matrix of expense cents whose
+    columns follow Categories (folded: stripped, lower-cased names).
+    """
+
+    Days: np.ndarray
+    Income: np.ndarray
+    Expense: np.ndarray
+    Categories: list[str]
+    CategoryExpense: np.ndarray
 
 
 class TransactionDAO:
@@ -65,17 +214,72 @@ class TransactionDAO:
 
     Public methods provide:
       - Raw and filtered DataFrames
-      - List conversions for UI
+      - List conversions for UI, or columnar TransactionBatch results
       - Aggregations: ExpenseByCategoryData, IncomeByCategoryData,
         AllByCategoryData, SummaryByMonthData
+      - Daily analytics: DailyBalanceData, SpendMovingAverageData
+
+    Report aggregations sum amounts as integer cents through a shared
+    partial-totals kernel, so the chunked (out-of-core) mode selected with
+    `chunksize` returns exactly the same reports as the in-memory mode.
+    GetReports builds every report for a range from one grouped pass and
+    caches it per data version; the per-report methods are views over it.
+
+    SummaryByMonthData reads a MonthlyRollup persisted next to the CSV
+    (<stem>.rollup.json) that appends keep current.
+
+    Loaded frames store the text columns as categoricals (see
+    CATEGORICAL_COLUMNS) and dates as datetime64, so a row costs a few
+    small integer codes rather than Python strings. Amounts are parsed
+    once into an int64 'cents' column that every sum, report and
+    duplicate check uses; the float 'amount' column is for display.
+
+    Loaded DataFrames are cached in-process and keyed on the file's
+    (size, mtime, inode); appends through SaveTransaction(s) update the
+    cache directly, so repeated reads skip the CSV parse. When the file
+    has only grown, just the appended bytes are parsed; a shrink, a new
+    inode or a changed prefix digest forces a full reload.
+
+    A datasource ending in .sqlite, .sqlite3 or .db returns a
+    SqliteTransactionDAO with the same public API.
     """
 
+    # Date ranges whose reports are kept per data version
+    REPORT_CACHE_SIZE = 32
+
     COLUMNS: list[str] = ["transaction", "category", "description", "amount",
                           "date"]
 
-    def __init__(self, datasource: str | None = None):
+    # Typed date columns kept next to the display 'date' string
+    DATE_COLUMNS: list[str] = ["datetime", "month"]
+
+    # Exact int64 cents kept next to the display 'amount'
+    CENTS_COLUMN = "cents"
+
+    # Low-cardinality text columns stored dictionary-encoded (categorical)
+    CATEGORICAL_COLUMNS: list[str] = ["transaction", "category",
+                                      "description", "date"]
+
+    def __new__(cls, datasource: str | None = None, *args, **kwargs):
+        """Dispatch SQLite datasources to the SQLite backend."""
+        if cls is TransactionDAO:
+            from src.dao.sqlite_transaction_dao import (
+                IsSqlitePath,
+                SqliteTransactionDAO,
+            )
+            if IsSqlitePath(datasource):
+                cls = SqliteTransactionDAO
+        return super().__new__(cls)
+
+    def __init__(self, datasource: str | None = None,
+                 chunksize: int | None = None):
         """Bind to <repo>/data/gillpay_data.csv unless a custom path is
-        provided; ensure header exists."""
+        provided; ensure header exists.
+
+        With *chunksize*, the report aggregations stream the CSV in chunks
+        of that many rows instead of loading the whole ledger, so their
+        peak memory is bounded by the chunk size rather than the file size.
+        """
         if datasource is None:
             repo_root = Path(__file__).resolve().parents[2]
             self.CsvPath = repo_root / "data" / "gillpay_data.csv"
@@ -89,72 +293,338 @@ class TransactionDAO:
 
         self.Datasource = str(self.CsvPath)
 
+        self.ChunkSize = int(chunksize) if chunksize else None
+
+        # Parsed-frame cache and the file version it was built from
+        self._Cache: _LedgerCache | None = None
+        # Bumped whenever the cached frame changes (see DataVersion)
+        self._Version = 0
+
+        # Persisted (month, type, category) totals next to the CSV
+        self.Rollup = MonthlyRollup(self.CsvPath)
+
+        # Report bundles keyed by range bounds, valid for _ReportsVersion
+        self._Reports: dict[tuple | None, LedgerReports] = {}
+        self._ReportsVersion = None
+
+        # Per-day totals behind the daily analytics, valid for _DailyVersion
+        self._Daily: DailyTotals | None = None
+        self._DailyVersion = None
+
     # -------------------------
     # Core load/query helpers
     # -------------------------
 
     def GetDataFrame(self) -> DataFrame:
         """Load all transactions as a DataFrame with normalized types and
-        date format."""
+        date format.
+
+        Returns a read-only snapshot of the cached frame; the CSV is only
+        re-parsed when its (size, mtime, inode) key changes, and then only
+        from the last parsed offset when the file was appended to.
+        """
+        return self._Snapshot(self._LoadFrame())
+
+    def _LoadFrame(self) -> DataFrame:
+        """Return the cached frame, refreshing it from the file if needed."""
+        key = self._FileKey()
+        cache = self._Cache
+        if cache is not None and key == cache.Key:
+            return cache.Frame
+        if cache is not None and key is not None and self._TailParse(key):
+            return self._Cache.Frame
+        self._FullParse()
+        return self._Cache.Frame
+
+    def _FullParse(self) -> None:
+        """Parse the whole CSV and reset the cache."""
+        key = self._FileKey()
         try:
-            df = pd.read_csv(self.Datasource, dtype=str)
+            data = self.CsvPath.read_bytes()
         except FileNotFoundError:
-            df = pd.DataFrame(columns=self.COLUMNS)
+            data = b""
+        header = HeaderPattern.match(data).group()
+        if data.removeprefix(codecs.BOM_UTF8).strip():
+            df = self._ParseCsv(io.BytesIO(data))
+        else:
+            df = self._EmptyFrame()
+        self._Cache = _LedgerCache(
+            Frame=df, Key=key or (0, 0, 0), Header=header, Offset=len(data),
+            Rows=len(df),
+            Digest=self._PrefixDigest(data[:PrefixDigestBytes],
+                                      data[-PrefixDigestBytes:], len(data)))
+        self._Version += 1
+
+    def _TailParse(self, key: tuple[int, int, int]) -> bool:
+        """Parse only bytes appended since the last load.
+
+        Returns False when the file shrank, was replaced, or its parsed
+        prefix changed, in which case the caller must do a full reload.
+        """
+        cache = self._Cache
+        if (key[2] != cache.Key[2] or key[0] < cache.Offset
+                or not self._CanAppendTo(cache)):
+            return False
+        try:
+            with self.CsvPath.open("rb") as f:
+                if self._ReadDigest(f, cache.Offset) != cache.Digest:
+                    return False
+                # Resume only on a line boundary, never inside a row
+                f.seek(max(cache.Offset - 1, 0))
+                if cache.Offset and f.read(1) != b"\n":
+                    return False
+                tail = f.read()
+        except OSError:
+            return False
+        if tail and not tail.endswith(b"\n"):
+            return False  # partial row still being written
+        return self._ExtendCache(tail, key)
+
+    @staticmethod
+    def _CanAppendTo(cache: "_LedgerCache") -> bool:
+        """Return True if parsed rows can be extended from cache.Offset."""
+        return (cache.Header.endswith(b"\n")
+                and cache.Rows == len(cache.Frame)
+                and isinstance(cache.Frame.index, pd.RangeIndex))
+
+    def _ExtendCache(self, tail: bytes, key) -> bool:
+        """Append parsed *tail* rows to the cache and advance its offset.
+
+        Returns False, leaving the cache alone, when the tail parses
+        differently on its own than it would as part of the whole file.
+        """
+        cache = self._Cache
+        if tail.strip():
+            try:
+                added = self._ParseCsv(io.BytesIO(cache.Header + tail))
+            except pd.errors.ParserError:
+                return False  # a full parse reports it in context
+            if not isinstance(added.index, pd.RangeIndex):
+                # Rows wider than the header made Pandas read their leading
+                # cells as an index; only a full parse gets that right
+                return False
+            start = len(cache.Frame)
+            cache.Frame = self._ConcatFrames([cache.Frame, added],
+                                             ignore_index=True)
+            self._ExtendDateIndex(cache, cache.Frame.iloc[start:])
+            if cache.DuplicateKeys is not None:
+                cache.DuplicateKeys.update(self._DuplicateKeys(added))
+            self._Version += 1
+        cache.Offset += len(tail)
+        cache.Rows = len(cache.Frame)
+        cache.Key = key or cache.Key
+        with self.CsvPath.open("rb") as f:
+            cache.Digest = self._ReadDigest(f, cache.Offset)
+        return True
+
+    def DataVersion(self):
+        """Return an opaque token that changes whenever the ledger does.
+
+        In-memory mode counts cache rebuilds and appends; chunked mode,
+        which keeps no cache, uses the file's (size, mtime, inode) key.
+        """
+        if self.ChunkSize:
+            return self._FileKey()
+        self._LoadFrame()
+        return self._Version
+
+    @staticmethod
+    def _SortByDate(df: DataFrame) -> DataFrame:
+        """Return the valid-date rows of *df* stably sorted by datetime."""
+        valid = df.loc[df["datetime"].notna()]
+        order = np.argsort(valid["datetime"].to_numpy(), kind="stable")
+        return valid.iloc[order]
+
+    def _ExtendDateIndex(self, cache: _LedgerCache, added: DataFrame) -> None:
+        """Keep the sorted index current after an append.
+
+        Rows dated on or after the current last date are appended in place;
+        back-dated rows drop the index so the next range query re-sorts.
+        """
+        if cache.Sorted is None:
+            return
+        new = self._SortByDate(added)
+        if new.empty:
+            return
+        dates = new["datetime"].to_numpy()
+        if len(cache.SortedDates) and dates[0] < cache.SortedDates[-1]:
+            cache.Sorted = cache.SortedDates = None
+            return
+        cache.Sorted = self._ConcatFrames([cache.Sorted, new])
+        cache.SortedDates = np.concatenate([cache.SortedDates, dates])
+
+    def _DateIndex(self) -> tuple[DataFrame, np.ndarray]:
+        """Return (date-sorted valid rows, their datetime64 array)."""
+        df = self._LoadFrame()
+        cache = self._Cache
+        if cache.Sorted is None:
+            cache.Sorted = self._SortByDate(df)
+            cache.SortedDates = cache.Sorted["datetime"].to_numpy()
+        return cache.Sorted, cache.SortedDates
+
+    @staticmethod
+    def _PrefixDigest(head: bytes, tail: bytes, offset: int) -> bytes:
+        """Hash the first and last PrefixDigestBytes of a parsed prefix."""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(offset.to_bytes(8, "little"))
+        h.update(head)
+        h.update(tail)
+        return h.digest()
+
+    def _ReadDigest(self, f, offset: int) -> bytes:
+        """Compute _PrefixDigest for *offset* bytes of an open file."""
+        f.seek(0)
+        head = f.read(min(offset, PrefixDigestBytes))
+        start = max(0, offset - PrefixDigestBytes)
+        f.seek(start)
+        tail = f.read(offset - start)
+        return self._PrefixDigest(head, tail, offset)
+
+    def _FileKey(self) -> tuple[int, int, int] | None:
+        """Return the (size, mtime_ns, inode) version key of the CSV file."""
+        try:
+            st = os.stat(self.Datasource)
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns, st.st_ino
+
+    @staticmethod
+    def _Snapshot(df: DataFrame) -> DataFrame:
+        """Return a snapshot callers can mutate without touching the cache.
+
+        Under Copy-on-Write a shallow copy is enough (and O(1)); otherwise
+        fall back to a deep copy, which is still far cheaper than a parse.
+        """
+        return df.copy(deep=not _CopyOnWriteEnabled())
+
+    def _ParseCsv(self, source) -> DataFrame:
+        """Parse a CSV path or buffer into the normalized frame layout."""
+        return self._NormalizeFrame(pd.read_csv(source, dtype=str))
 
+    def _NormalizeFrame(self, df: DataFrame) -> DataFrame:
+        """Coerce a raw string frame into the canonical columns and types,
+        plus CENTS_COLUMN and the parsed DATE_COLUMNS."""
         # Ensure all expected columns exist
         for col in self.COLUMNS:
             if col not in df.columns:
-                df.loc[:, col] = "0" if col == "amount" else ""
+                df[col] = "0" if col == "amount" else ""
 
         # Work on a fresh copy in the expected column order
         df = df.loc[:, self.COLUMNS].copy()
 
         # Safe, non-chained assignments
-        df.loc[:, "amount"] = (
-            pd.to_numeric(df["amount"], errors="coerce").fillna(0.0).astype(
-                float)
-        )
-        df.loc[:, "date"] = df["date"].map(NormalizeDateStr)
-        return df
-
-    def GetTransactions(self) -> list[Transaction]:
-        """Return all transactions as Transaction objects."""
-        df = self.GetDataFrame()
-        return self.ConvertToTransactionList(df.values.tolist())
-
-    def GetTransactionsBy(self, column_name: str, column_value) -> list[
-        Transaction]:
+        df["amount"] = ParseAmountColumn(df["amount"])
+        df[self.CENTS_COLUMN] = AmountToCents(df["amount"])
+        df["date"], parsed = ParseDateColumn(df["date"])
+        return self._AddDateColumns(self._CompactColumns(df), parsed)
+
+    def _EmptyFrame(self) -> DataFrame:
+        """Return a zero-row frame in the normalized layout."""
+        return self._NormalizeFrame(pd.DataFrame(columns=self.COLUMNS))
+
+    @classmethod
+    def _CompactColumns(cls, df: DataFrame) -> DataFrame:
+        """Dictionary-encode CATEGORICAL_COLUMNS as pandas categoricals."""
+        return df.astype({c: "category" for c in cls.CATEGORICAL_COLUMNS
+                          if c in df.columns})
+
+    @staticmethod
+    def _ConcatFrames(frames: list[DataFrame], **kwargs) -> DataFrame:
+        """pd.concat that keeps categorical columns categorical.
+
+        Concatenating categoricals with different categories falls back
+        to object dtype, so the first frame's categories are extended with
+        any new values (its codes stay valid) and the rest are recoded.
+        """
+        head, rest = frames[0], frames[1:]
+        for col in head.columns:
+            if not isinstance(head[col].dtype, pd.CategoricalDtype):
+                continue
+            known = head[col].cat.categories
+            cats = known.append(
+                [pd.Index(f[col].astype(object).dropna().unique())
+                 for f in rest]).unique()
+            # One shared dtype: add_categories would keep the head's
+            # categories dtype (object when it is empty) and concat would
+            # then see two different categoricals
+            dtype = pd.CategoricalDtype(cats)
+            head = head.assign(**{col: pd.Categorical.from_codes(
+                head[col].cat.codes, dtype=dtype)})
+            rest = [f.assign(**{col: f[col].astype(dtype)}) for f in rest]
+        return pd.concat([head, *rest], **kwargs)
+
+    @staticmethod
+    def _AddDateColumns(df: DataFrame, parsed: pd.Series) -> DataFrame:
+        """Attach the datetime64 and month-period columns to *df*."""
+        return df.assign(datetime=parsed.array,
+                         month=parsed.dt.to_period("M").array)
+
+    def GetTransactions(self, as_batch: bool = False) -> (
+            list[Transaction] | TransactionBatch):
+        """Return all transactions as Transaction objects, or as a
+        TransactionBatch sharing the cached columns with *as_batch*."""
+        df = self._LoadFrame()
+        if as_batch:
+            return TransactionBatch.FromDataFrame(df)
+        return self.ConvertToTransactionList(
+            df.loc[:, self.COLUMNS].values.tolist())
+
+    def GetTransactionsBy(self, column_name: str, column_value,
+                          as_batch: bool = False) -> (
+            list[Transaction] | TransactionBatch):
         """Filter by a valid column name and value; return matching
-        transactions."""
+        transactions (as a TransactionBatch with *as_batch*)."""
         if column_name not in self.COLUMNS:
             raise ValueError(
                 f"Unknown column '{column_name}'. Expected one of "
                 f"{self.COLUMNS}."
             )
-        df = self.GetDataFrame()
-        rows = df[df[column_name] == column_value].values.tolist()
+        df = self._LoadFrame()
+        mask = (df[column_name] == column_value).to_numpy()
+        if as_batch:
+            return TransactionBatch.FromDataFrame(df)[mask]
+        rows = df.loc[mask, self.COLUMNS].values.tolist()
         return self.ConvertToTransactionList(rows)
 
     def GetDataFrameInRange(self, start=None, end=None) -> DataFrame:
-        """Return a DataFrame filtered by inclusive [start, end] dates."""
-        df = self.GetDataFrame().copy()
-        if df.empty:
-            return df
+        """Return a DataFrame filtered by inclusive [start, end] dates.
 
-        s = NormalizeDateStr(str(start)) if start else None
-        e = NormalizeDateStr(str(end)) if end else None
-
-        dt = pd.to_datetime(df["date"], format="%Y/%m/%d", errors="coerce")
-        mask = dt.notna()
+        Rows come back in date order; rows with unparseable dates are
+        excluded.
+        """
+        return self._Snapshot(self._FrameInRange(start, end))
 
-        if s:
-            sdt = pd.to_datetime(s, format="%Y/%m/%d", errors="coerce")
-            mask &= dt >= sdt
-        if e:
-            edt = pd.to_datetime(e, format="%Y/%m/%d", errors="coerce")
-            mask &= dt <= edt
+    def _FrameInRange(self, start=None, end=None) -> DataFrame:
+        """Slice the date-sorted index to [start, end] with binary search.
 
-        return df.loc[mask].copy()
+        Returns a view of the cached index; callers must not mutate it.
+        """
+        df, dates = self._DateIndex()
+        bounds = self._RangeBounds(start, end)
+        if bounds is None:
+            return df.iloc[0:0]
+        lo, hi = 0, len(dates)
+        if bounds[0] is not None:
+            lo = int(np.searchsorted(dates, bounds[0], side="left"))
+        if bounds[1] is not None:
+            hi = int(np.searchsorted(dates, bounds[1], side="right"))
+        return df.iloc[lo:max(lo, hi)]
+
+    @staticmethod
+    def _RangeBounds(start=None, end=None) -> tuple | None:
+        """Return inclusive (start, end) as datetime64 values (None when
+        open); None overall if a given bound is not a valid date."""
+        bounds = []
+        for bound in (start, end):
+            if not bound:
+                bounds.append(None)
+                continue
+            norm = NormalizeDateStr(str(bound))
+            when = pd.to_datetime(norm, format="%Y/%m/%d", errors="coerce")
+            if pd.isna(when):
+                return None
+            bounds.append(when.to_datetime64())
+        return tuple(bounds)
 
     # -------------------------
     # Duplicate + persistence
@@ -162,60 +632,121 @@ class TransactionDAO:
 
     def IsDuplicate(self, tx: Transaction) -> bool:
         """Check for an existing identical transaction (case-insensitive
-        fields, amount at 2 decimals)."""
+        fields, amount at 2 decimals).
+
+        Answers from a set of normalized keys that is built once per load
+        and extended on every append, so each check is O(1).
+        """
         try:
-            df = self.GetDataFrame()
+            return self.FindDuplicates([tx])[0]
         except Exception:
             return False
 
-        if df is None or df.empty:
-            return False
+    def FindDuplicates(self, transactions: Iterable[Transaction],
+                       within_batch: bool = False) -> list[bool]:
+        """Return, per transaction, whether it duplicates an existing row.
 
-        s_tx = str(tx.transaction).strip().lower()
-        s_cat = str(tx.category).strip().lower()
-        s_desc = str(tx.description).strip().lower()
-        amt2 = round(float(tx.amount), 2)
-        d_norm = NormalizeDateStr(str(tx.date))
-
-        mask = (
-                df["transaction"].astype(str).str.strip().str.lower().eq(s_tx)
-                & df["category"].astype(str).str.strip().str.lower().eq(s_cat)
-                & df["description"].astype(str).str.strip().str.lower().eq(
-            s_desc)
-                & df["amount"].astype(float).round(2).eq(amt2)
-                & df["date"].astype(str).eq(d_norm)
+        With *within_batch*, a transaction that repeats an earlier one in
+        the same batch is flagged too, matching what saving the batch one
+        row at a time with IsDuplicate checks would report.
+        """
+        transactions = list(transactions)
+        keys = self._DuplicateIndex()
+        # Cents exactly as the cents column will hold them once saved
+        cents = AmountToCents([float(tx.amount) for tx in transactions])
+        seen: set[tuple] = set()
+        flags = []
+        for tx, tx_cents in zip(transactions, cents.tolist()):
+            key = self._DuplicateKey(tx, tx_cents)
+            flags.append(key in keys or key in seen)
+            if within_batch:
+                seen.add(key)
+        return flags
+
+    def _DuplicateIndex(self) -> set[tuple]:
+        """Return the cached set of duplicate keys for the current file."""
+        df = self._LoadFrame()
+        cache = self._Cache
+        if cache.DuplicateKeys is None:
+            cache.DuplicateKeys = set(self._DuplicateKeys(df))
+        return cache.DuplicateKeys
+
+    @staticmethod
+    def _DuplicateKeys(df: DataFrame) -> Iterable[tuple]:
+        """Yield (type, category, description, cents, date) keys per row."""
+        return zip(
+            df["transaction"].astype(str).str.strip().str.lower(),
+            df["category"].astype(str).str.strip().str.lower(),
+            df["description"].astype(str).str.strip().str.lower(),
+            df[TransactionDAO.CENTS_COLUMN].tolist(),
+            df["date"].astype(str),
+        )
+
+    @staticmethod
+    def _DuplicateKey(tx: Transaction, cents: int) -> tuple:
+        """Return the normalized duplicate key for a single transaction
+        whose amount is *cents* (see AmountToCents)."""
+        return (
+            str(tx.transaction).strip().lower(),
+            str(tx.category).strip().lower(),
+            str(tx.description).strip().lower(),
+            cents,
+            NormalizeDateStr(str(tx.date)),
         )
-        return bool(mask.any())
 
     def SaveTransaction(self, tx: Transaction) -> None:
         """Append a single transaction in canonical column order."""
-        row = [
+        self.SaveTransactions([tx])
+
+    def SaveTransactions(self, transactions: Iterable[Transaction]) -> None:
+        """Append multiple transactions efficiently."""
+        if not transactions:
+            return
+        buffer = io.StringIO(newline="")
+        writer = csv.writer(buffer)
+        for tx in transactions:
+            writer.writerow(self._RowFor(tx))
+        text = buffer.getvalue()
+        if not text:
+            return
+
+        before = self._FileKey()
+        cache_valid = (self._Cache is not None
+                       and before == self._Cache.Key
+                       and self._CanAppendTo(self._Cache)
+                       and self._EndsWithNewline())
+        with self.CsvPath.open("a", newline="", encoding="utf-8") as csv_file:
+            csv_file.write(text)
+
+        after = self._FileKey()
+        self.Rollup.Append(text.encode("utf-8"), before, after)
+
+        # Parse exactly what was written so the cache matches a reload
+        if not (cache_valid
+                and self._ExtendCache(text.encode("utf-8"), after)):
+            self._Cache = None
+
+    @staticmethod
+    def _RowFor(tx: Transaction) -> list:
+        """Return the CSV row written for a transaction."""
+        return [
             str(tx.transaction),
             str(tx.category),
             str(tx.description),
             float(tx.amount),
             NormalizeDateStr(str(tx.date)),
         ]
-        with self.CsvPath.open("a", newline="", encoding="utf-8") as csv_file:
-            writer = csv.writer(csv_file)
-            writer.writerow(row)
 
-    def SaveTransactions(self, transactions: Iterable[Transaction]) -> None:
-        """Append multiple transactions efficiently."""
-        if not transactions:
-            return
-        with self.CsvPath.open("a", newline="", encoding="utf-8") as csv_file:
-            writer = csv.writer(csv_file)
-            for tx in transactions:
-                writer.writerow(
-                    [
-                        str(tx.transaction),
-                        str(tx.category),
-                        str(tx.description),
-                        float(tx.amount),
-                        NormalizeDateStr(str(tx.date)),
-                    ]
-                )
+    def _EndsWithNewline(self) -> bool:
+        """Return True if the CSV is empty or ends with a line break."""
+        try:
+            with self.CsvPath.open("rb") as f:
+                if f.seek(0, os.SEEK_END) == 0:
+                    return True
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) in (b"\n", b"\r")
+        except OSError:
+            return False
 
     def ConvertToTransactionList(self, csv_rows) -> list[Transaction]:
         """Convert list-of-lists rows to Transaction objects."""
@@ -236,54 +767,44 @@ class TransactionDAO:
     # Aggregates for reports
     # -------------------------
 
+    def GetReports(self, start=None, end=None) -> LedgerReports:
+        """Return every report for the inclusive [start, end] range.
+
+        One grouped pass over (type, category) and (month, type) feeds all
+        four reports; the result is cached until DataVersion changes, so
+        the per-report methods below share a single scan. Treat the frames
+        as read-only; the per-report methods return copies.
+        """
+        version = self.DataVersion()
+        if version != self._ReportsVersion:
+            self._Reports = {}
+            self._ReportsVersion = version
+        key = self._RangeBounds(start, end)
+        reports = self._Reports.get(key)
+        if reports is None:
+            by_category, by_month = self._Totals(start, end)
+            expense = self._CategoryReport(by_category, "expense")
+            income = self._CategoryReport(by_category, "income")
+            reports = LedgerReports(
+                expense=expense,
+                income=income,
+                combined=self._CombinedReport(expense, income),
+                monthly=self._MonthReport(by_month),
+            )
+            if len(self._Reports) >= self.REPORT_CACHE_SIZE:
+                self._Reports.pop(next(iter(self._Reports)))
+            self._Reports[key] = reports
+        return reports
+
     def ExpenseByCategoryData(self, start=None, end=None) -> DataFrame:
         """Return expense totals by category within an optional inclusive
         date range."""
-        df = self.GetDataFrameInRange(start, end)
-        if df.empty:
-            return pd.DataFrame({"category": [], "amount": []})
-
-        t = df["transaction"].astype(str).str.strip().str.lower()
-        # Select only columns we need and copy to avoid views
-        expenses = df.loc[t.eq("expense"), ["category", "amount"]].copy()
-        if expenses.empty:
-            return pd.DataFrame({"category": [], "amount": []})
-
-        report = (
-            expenses.groupby("category", as_index=False, sort=False)["amount"]
-            .sum()
-            .copy()
-        )
-        report.loc[:, "amount"] = report["amount"].astype(float).round(2)
-        report = (
-            report.sort_values("amount", ascending=False, kind="stable")
-            .reset_index(drop=True)
-        )
-        return report
+        return self.GetReports(start, end).expense.copy()
 
     def IncomeByCategoryData(self, start=None, end=None) -> DataFrame:
         """Return income totals by category within an optional inclusive date
         range."""
-        df = self.GetDataFrameInRange(start, end)
-        if df.empty:
-            return pd.DataFrame({"category": [], "amount": []})
-
-        t = df["transaction"].astype(str).str.strip().str.lower()
-        income = df.loc[t.eq("income"), ["category", "amount"]].copy()
-        if income.empty:
-            return pd.DataFrame({"category": [], "amount": []})
-
-        report = (
-            income.groupby("category", as_index=False, sort=False)["amount"]
-            .sum()
-            .copy()
-        )
-        report.loc[:, "amount"] = report["amount"].astype(float).round(2)
-        report = (
-            report.sort_values("amount", ascending=False, kind="stable")
-            .reset_index(drop=True)
-        )
-        return report
+        return self.GetReports(start, end).income.copy()
 
     def AllByCategoryData(self, start=None, end=None) -> pd.DataFrame:
         """Return combined category totals across Income and Expense.
@@ -291,10 +812,230 @@ class TransactionDAO:
         Output schema: columns ['type', 'category', 'amount'] where 'type' in
         {'Income', 'Expense'}.
         """
-        # Build from the already-safe helpers to minimize CoW pitfalls
-        exp = self.ExpenseByCategoryData(start, end)
-        inc = self.IncomeByCategoryData(start, end)
+        return self.GetReports(start, end).combined.copy()
+
+    def SummaryByMonthData(self) -> DataFrame:
+        """Return DataFrame with columns: month ('FullMonth YYYY'), income,
+        expense, net.
+
+        Read from the persisted monthly rollup, so the cost is O(months)
+        once the rollup is current.
+        """
+        totals = self.Rollup.Refresh().MonthTypeTotals()
+        if not totals:
+            return self._MonthReport(pd.Series(dtype="int64"))
+        keys = list(totals)
+        index = pd.MultiIndex.from_arrays(
+            [pd.PeriodIndex([m for m, _ in keys], freq="M"),
+             [t for _, t in keys]],
+            names=["month", "type"])
+        return self._MonthReport(
+            pd.Series(list(totals.values()), index=index, dtype="int64"))
+
+    # -------------------------
+    # Daily analytics
+    # -------------------------
+
+    def DailyBalanceData(self, start=None, end=None) -> DataFrame:
+        """Return ['date', 'income', 'expense', 'net', 'balance'] with one
+        row per calendar day in the inclusive [start, end] range.
+
+        Days without transactions are present with zero totals. balance is
+        the running net since the first ledger day, so a range that starts
+        mid-history opens with the balance carried into it.
+        """
+        daily = self._DailyTotals()
+        net = daily.Income - daily.Expense
+        balance = np.cumsum(net)
+        lo, hi = self._DaySlice(daily.Days, start, end)
+        return DataFrame({
+            "date": daily.Days[lo:hi].astype("datetime64[ns]"),
+            "income": daily.Income[lo:hi] / 100,
+            "expense": daily.Expense[lo:hi] / 100,
+            "net": net[lo:hi] / 100,
+            "balance": balance[lo:hi] / 100,
+        })
+
+    def SpendMovingAverageData(self, windows: Iterable[int] = (7, 30, 90),
+                               category: str | None = None, start=None,
+                               end=None) -> DataFrame:
+        """Return 'date' plus one 'ma<N>' column per window: the trailing
+        N-day mean of daily expense within [start, end].
+
+        *category* (matched ignoring case and surrounding spaces) limits
+        spend to one category; None averages all expenses. Each mean is a
+        difference of two cumulative sums, so every window costs one pass
+        over the day axis; days with fewer than N days of history are NaN.
+        """
+        daily = self._DailyTotals()
+        if category is None:
+            spend = daily.Expense
+        else:
+            key = str(category).strip().lower()
+            spend = (daily.CategoryExpense[:, daily.Categories.index(key)]
+                     if key in daily.Categories
+                     else np.zeros(len(daily.Days), dtype=np.int64))
+        running = np.concatenate(([0], np.cumsum(spend)))
+        lo, hi = self._DaySlice(daily.Days, start, end)
+        out = {"date": daily.Days[lo:hi].astype("datetime64[ns]")}
+        for window in windows:
+            window = int(window)
+            if window < 1:
+                raise ValueError("Moving-average windows must be >= 1 day.")
+            means = np.full(len(spend), np.nan)
+            if len(spend) >= window:
+                means[window - 1:] = (running[window:]
+                                      - running[:-window]) / window / 100
+            out[f"ma{window}"] = means[lo:hi]
+        return DataFrame(out)
+
+    def _DailyTotals(self) -> DailyTotals:
+        """Return the per-day totals, rebuilt once per data version."""
+        version = self.DataVersion()
+        if self._Daily is None or version != self._DailyVersion:
+            self._Daily = self._BuildDailyTotals(self._FrameInRange())
+            self._DailyVersion = version
+        return self._Daily
+
+    @classmethod
+    def _BuildDailyTotals(cls, df: DataFrame) -> DailyTotals:
+        """Bin valid-date rows by day with bincount (no per-row Python)."""
+        days = df["datetime"].to_numpy().astype("datetime64[D]")
+        if not len(days):
+            empty = np.zeros(0, dtype=np.int64)
+            return DailyTotals(days, empty, empty, [],
+                               np.zeros((0, 0), dtype=np.int64))
+        first = days.min()
+        offset = (days - first).astype(np.int64)
+        n_days = int(offset.max()) + 1
+        cents = df[cls.CENTS_COLUMN].to_numpy(dtype=np.int64)
+        type_codes, types = FoldedCodes(df["transaction"])
+        kinds = np.append(types, "")[type_codes]
+
+        def Bin(mask: np.ndarray, slots: np.ndarray, size: int) -> np.ndarray:
+            sums = np.bincount(slots[mask], weights=cents[mask],
+                               minlength=size)
+            return np.rint(sums).astype(np.int64)
+
+        is_income = kinds == "income"
+        is_expense = kinds == "expense"
+        category_codes, categories = FoldedCodes(df["category"])
+        n_categories = len(categories)
+        # Rows with a missing category still count toward Expense
+        by_category = is_expense & (category_codes >= 0)
+        flat = offset * n_categories + category_codes
+        matrix = Bin(by_category, flat, n_days * n_categories).reshape(
+            n_days, n_categories)
+        return DailyTotals(
+            Days=first + np.arange(n_days),
+            Income=Bin(is_income, offset, n_days),
+            Expense=Bin(is_expense, offset, n_days),
+            Categories=[str(c) for c in categories],
+            CategoryExpense=matrix,
+        )
 
+    def _DaySlice(self, days: np.ndarray, start=None,
+                  end=None) -> tuple[int, int]:
+        """Return the [lo, hi) positions of [start, end] on a day axis."""
+        bounds = self._RangeBounds(start, end)
+        if bounds is None:
+            return 0, 0
+        lo, hi = 0, len(days)
+        if bounds[0] is not None:
+            lo = int(np.searchsorted(days, bounds[0].astype("datetime64[D]"),
+                                     side="left"))
+        if bounds[1] is not None:
+            hi = int(np.searchsorted(days, bounds[1].astype("datetime64[D]"),
+                                     side="right"))
+        return lo, max(lo, hi)
+
+    # -------------------------
+    # Aggregation kernel
+    # -------------------------
+
+    def _Totals(self, start=None, end=None) -> tuple[pd.Series, pd.Series]:
+        """Return (by_category, by_month) cent totals for [start, end].
+
+        Uses the cached ledger, or streams the CSV when ChunkSize is set.
+        """
+        if self.ChunkSize:
+            return self._ScanTotals(start, end)
+        return self._PartialTotals(self._FrameInRange(start, end))
+
+    def _ScanTotals(self, start=None, end=None) -> tuple[pd.Series,
+                                                          pd.Series]:
+        """Stream the CSV in ChunkSize rows and merge per-chunk totals."""
+        bounds = self._RangeBounds(start, end)
+        totals = self._PartialTotals(self._EmptyFrame())
+        if bounds is None:
+            return totals
+        try:
+            reader = pd.read_csv(self.Datasource, dtype=str,
+                                 chunksize=self.ChunkSize)
+        except (FileNotFoundError, pd.errors.EmptyDataError):
+            return totals
+        with reader:
+            for chunk in reader:
+                df = self._NormalizeFrame(chunk)
+                dt = df["datetime"]
+                mask = dt.notna()
+                if bounds[0] is not None:
+                    mask &= dt >= bounds[0]
+                if bounds[1] is not None:
+                    mask &= dt <= bounds[1]
+                part = self._PartialTotals(df.loc[mask])
+                totals = tuple(self._MergeTotals(a, b)
+                               for a, b in zip(totals, part))
+        return totals
+
+    @classmethod
+    def _PartialTotals(cls, df: DataFrame) -> tuple[pd.Series, pd.Series]:
+        """Sum int64 cents by (type, category) and by (month, type).
+
+        *df* must hold valid-date rows only. Integer sums are exact and
+        associative, so partial results from any chunking merge to the
+        same totals.
+        """
+        t = (df["transaction"].astype(str).str.strip().str.lower()
+             .rename("type"))
+        cents = df[cls.CENTS_COLUMN].astype(np.int64)
+        by_category = cents.groupby([t, df["category"]], sort=False,
+                                    observed=True).sum()
+        by_month = cents.groupby([df["month"], t], sort=False,
+                                 observed=True).sum()
+        return by_category, by_month
+
+    @staticmethod
+    def _MergeTotals(a: pd.Series, b: pd.Series) -> pd.Series:
+        """Add two partial cent totals that share the same key levels."""
+        if a.empty:
+            return b
+        if b.empty:
+            return a
+        merged = pd.concat([a, b])
+        return merged.groupby(level=list(range(merged.index.nlevels)),
+                              sort=False).sum()
+
+    @staticmethod
+    def _CategoryReport(by_category: pd.Series, type_key: str) -> DataFrame:
+        """Build the ['category', 'amount'] report for one type, sorted by
+        amount descending then category."""
+        types = by_category.index.get_level_values(0)
+        if by_category.empty or type_key not in types:
+            return pd.DataFrame({"category": [], "amount": []})
+        cents = by_category.xs(type_key, level=0)
+        report = pd.DataFrame({"category": cents.index.to_numpy(),
+                               "amount": cents.to_numpy() / 100})
+        return (
+            report.sort_values(["amount", "category"],
+                               ascending=[False, True], kind="stable")
+            .reset_index(drop=True)
+        )
+
+    @staticmethod
+    def _CombinedReport(exp: DataFrame, inc: DataFrame) -> DataFrame:
+        """Stack the expense and income reports with a 'type' column,
+        Income first, each by amount descending."""
         frames: list[pd.DataFrame] = []
 
         if exp is not None and not exp.empty:
@@ -312,7 +1053,6 @@ class TransactionDAO:
 
         # Create a fresh owner DataFrame (copy=True) and then mutate safely
         out = pd.concat(frames, ignore_index=True, copy=True)
-        out = out.copy()  # extra safety against view semantics
 
         # Safe, explicit assignment
         out.loc[:, "type"] = pd.Categorical(
@@ -320,46 +1060,25 @@ class TransactionDAO:
         )
 
         # Stable sort: Income first, then Expense; each by amount desc
-        out = (
+        return (
             out.sort_values(["type", "amount"], ascending=[True, False],
                             kind="stable")
             .reset_index(drop=True)
         )
-        return out
 
-    def SummaryByMonthData(self) -> DataFrame:
-        """Return DataFrame with columns: month ('FullMonth YYYY'), income,
-        expense, net."""
-        df = self.GetDataFrame().copy()
-        df.loc[:, "transaction"] = df["transaction"].astype(
-            str).str.strip().str.lower()
-
-        # Build a mask first; then slice; then recompute dt on the sliced frame
-        mask = pd.to_datetime(df["date"], format="%Y/%m/%d",
-                              errors="coerce").notna()
-        df = df.loc[mask].copy()
-        dt = pd.to_datetime(df["date"], format="%Y/%m/%d", errors="coerce")
-
-        df.loc[:, "__month"] = dt.dt.to_period("M")
-
-        gb = df.groupby(["__month", "transaction"], observed=True)[
-            "amount"].sum()
-        pt = gb.unstack(fill_value=0.0).copy()
-
-        # Ensure both columns exist; use .loc to avoid chained assignment
-        # ambiguity
-        for col in ("income", "expense"):
-            if col not in pt.columns:
-                pt.loc[:, col] = 0.0
-
-        # Normalize dtypes and compute net
-        pt = pt.astype({"income": "float64", "expense": "float64"},
-                       errors="ignore")
-        pt.loc[:, "net"] = pt["income"] - pt["expense"]
-
-        out = pt.reset_index().sort_values("__month").copy()
-        out.loc[:, "month"] = out["__month"].dt.to_timestamp().dt.strftime(
-            "%B %Y")
-        out = out.drop(columns="__month")
-        out = out.loc[:, ["month", "income", "expense", "net"]]
-        return out
+    @staticmethod
+    def _MonthReport(by_month: pd.Series) -> DataFrame:
+        """Build the month/income/expense/net report in calendar order."""
+        if by_month.empty:
+            return pd.DataFrame(
+                {"month": [], "income": [], "expense": [], "net": []})
+        pt = by_month.unstack(fill_value=0).sort_index()
+        zero = pd.Series(0, index=pt.index)
+        income = pt["income"] if "income" in pt.columns else zero
+        expense = pt["expense"] if "expense" in pt.columns else zero
+        return pd.DataFrame({
+            "month": pt.index.to_timestamp().strftime("%B %Y"),
+            "income": income.to_numpy() / 100,
+            "expense": expense.to_numpy() / 100,
+            "net": (income - expense).to_numpy() / 100,
+        })
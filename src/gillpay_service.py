@@ -25,13 +25,40 @@
 from __future__ import annotations
 
 import datetime
+import math
+from dataclasses import dataclass
 from typing import Dict, List
 
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
 from prettytable import PrettyTable
 
 from src.models.transaction import Transaction
-from src.dao.transaction_dao import TransactionDAO
+from src.models.transaction_batch import TransactionBatch
+from src.dao.transaction_dao import AmountToCents, TransactionDAO
 from src.dao.category_dao import CategoryDAO
+from src.category_registry import CategoryRegistry
+from src.ledger_query import LedgerQuery
+from src.recurring_detector import RecurringDetector
+
+
+@dataclass(frozen=True)
+class EntryValidation:
+    """Per-row outcome of GillPayService.ValidateEntries.
+
+    codes holds one GillPayService.ENTRY_* code per row (ENTRY_OK = 0);
+    messages holds the text ValidateEntry would raise for that row, or ''
+    when the row is valid.
+    """
+
+    codes: np.ndarray
+    messages: list[str]
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Boolean mask of rows that passed every rule."""
+        return self.codes == GillPayService.ENTRY_OK
 
 
 class GillPayService:
@@ -39,10 +66,43 @@ class GillPayService:
 
     DATE_FMT = "%Y/%m/%d"
 
-    def __init__(self) -> None:
-        """Initialize the service and its DAO dependency."""
+    # Distinct queries whose results are kept per data version
+    QUERY_CACHE_SIZE = 32
+
+    # Validation error codes, in the order the rules are checked
+    ENTRY_OK = 0
+    ENTRY_BAD_TYPE = 1
+    ENTRY_BAD_DATE = 2
+    ENTRY_BAD_CATEGORY = 3
+    ENTRY_BAD_AMOUNT = 4
+    ENTRY_NONPOSITIVE_AMOUNT = 5
+    ENTRY_EMPTY_DESCRIPTION = 6
+
+    ENTRY_MESSAGES = {
+        ENTRY_OK: "",
+        ENTRY_BAD_TYPE: "Invalid transaction type. Use 'income' or "
+                        "'expense'.",
+        ENTRY_BAD_DATE: "You entered an invalid date.\nPlease enter the "
+                        "date in the format YYYY/MM/DD.",
+        ENTRY_BAD_AMOUNT: "Amount must be a number.",
+        ENTRY_NONPOSITIVE_AMOUNT: "Amount must be greater than zero.",
+        ENTRY_EMPTY_DESCRIPTION: "Description cannot be empty.",
+    }
+
+    def __init__(self, Dao: TransactionDAO | None = None) -> None:
+        """Initialize the service and its DAO dependency; pass *Dao* to
+        share an existing TransactionDAO (and its cache)."""
         self.CategoryDAO = CategoryDAO()
-        self.TransactionDAO = TransactionDAO()
+        self.TransactionDAO = Dao if Dao is not None else TransactionDAO()
+        # Canonical chart categories and the per-version id arrays
+        self.Categories = CategoryRegistry()
+        self._CategoryCodesVersion = None
+        self._CategoryCodesByType: dict[str, tuple] = {}
+        # Query results keyed by plan, valid for _QueriesVersion
+        self._Queries: dict[LedgerQuery, DataFrame] = {}
+        self._QueriesVersion = None
+        # Recurring-transaction results, cached per data version
+        self.Recurring = RecurringDetector(self.TransactionDAO)
 
     # Data access
 
@@ -73,35 +133,142 @@ class GillPayService:
 
     def ValidateEntry(self, Tx: Transaction) -> None:
         """Validate a transaction; raise ValueError if any rule fails."""
+        messages = self.ENTRY_MESSAGES
         tx_type = (Tx.transaction or "").strip().lower()
         if tx_type not in {"income", "expense"}:
-            raise ValueError(
-                "Invalid transaction type. Use 'income' or 'expense'.")
+            raise ValueError(messages[self.ENTRY_BAD_TYPE])
 
         if not self.DateValidator(Tx.date):
+            raise ValueError(messages[self.ENTRY_BAD_DATE])
+
+        gui_type = "Income" if tx_type == "income" else "Expense"
+        if self.CategoryDAO.CanonicalName(gui_type, Tx.category) is None:
             raise ValueError(
-                "You entered an invalid date.\nPlease enter the date in the "
-                "format YYYY/MM/DD.")
-
-        allowed_list = self.CategoryDAO.ListCategoryNames(
-            "Income" if tx_type == "income" else "Expense")
-        needle = (Tx.category or "").strip().casefold()
-        is_valid = any(c.casefold() == needle for c in allowed_list)
-        if not is_valid:
-            allowed = ", ".join(allowed_list)
-            raise ValueError(
-                f"Invalid category '{Tx.category}' for transaction '"
-                f"{tx_type}'.\nAllowed: {allowed}.")
+                self.CategoryMessage(Tx.category, tx_type))
 
         try:
             amount = float(Tx.amount)
         except Exception:
-            raise ValueError("Amount must be a number.")
+            raise ValueError(messages[self.ENTRY_BAD_AMOUNT])
+        if not math.isfinite(amount):
+            raise ValueError(messages[self.ENTRY_BAD_AMOUNT])
         if amount <= 0:
-            raise ValueError("Amount must be greater than zero.")
+            raise ValueError(messages[self.ENTRY_NONPOSITIVE_AMOUNT])
 
         if not (Tx.description or "").strip():
-            raise ValueError("Description cannot be empty.")
+            raise ValueError(messages[self.ENTRY_EMPTY_DESCRIPTION])
+
+    def CategoryMessage(self, Category, TxType: str) -> str:
+        """Return the invalid-category message for a normalized type."""
+        gui_type = "Income" if TxType == "income" else "Expense"
+        allowed = ", ".join(self.CategoryDAO.ListCategoryNames(gui_type))
+        return (f"Invalid category '{Category}' for transaction '"
+                f"{TxType}'.\nAllowed: {allowed}.")
+
+    def ValidateEntries(self, Frame: DataFrame) -> EntryValidation:
+        """Validate every row of a ['transaction', 'category',
+        'description', 'amount', 'date'] frame with column operations.
+
+        Applies ValidateEntry's rules in the same order and returns, per
+        row, the code of the first rule that failed and the message
+        ValidateEntry would have raised. Every rule runs once per distinct
+        value of its column and is broadcast back through the factorized
+        codes, so the cost tracks the number of distinct cells rather than
+        rows. Missing text cells count as '' and a missing amount as NaN,
+        which, like inf, is not a number.
+        """
+        type_codes, types = self._TextColumn(Frame, "transaction")
+        types = [t.strip().lower() for t in types]
+        is_income = np.array([t == "income" for t in types])[type_codes]
+        bad_type = ~np.array([t in {"income", "expense"}
+                              for t in types])[type_codes]
+
+        date_codes, dates = self._TextColumn(Frame, "date")
+        bad_date = ~np.array([self.DateValidator(d)
+                              for d in dates])[date_codes]
+
+        category_codes, categories = self._TextColumn(Frame, "category")
+        needles = [c.strip().casefold() for c in categories]
+        known = {t: {n.casefold()
+                     for n in self.CategoryDAO.ListCategoryNames(t)}
+                 for t in ("Income", "Expense")}
+        income_ok = np.array([n in known["Income"] for n in needles])
+        expense_ok = np.array([n in known["Expense"] for n in needles])
+        bad_category = ~np.where(is_income, income_ok[category_codes],
+                                 expense_ok[category_codes])
+
+        amount, is_number = self._AmountColumn(Frame)
+        is_number &= np.isfinite(amount)
+        with np.errstate(invalid="ignore"):
+            not_positive = is_number & (amount <= 0)
+
+        text_codes, descriptions = self._TextColumn(Frame, "description")
+        no_description = np.array([not d.strip()
+                                   for d in descriptions])[text_codes]
+
+        codes = np.select(
+            [bad_type, bad_date, bad_category, ~is_number, not_positive,
+             no_description],
+            [self.ENTRY_BAD_TYPE, self.ENTRY_BAD_DATE,
+             self.ENTRY_BAD_CATEGORY, self.ENTRY_BAD_AMOUNT,
+             self.ENTRY_NONPOSITIVE_AMOUNT, self.ENTRY_EMPTY_DESCRIPTION],
+            self.ENTRY_OK,
+        ).astype(np.int8)
+
+        lookup = np.array([self.ENTRY_MESSAGES.get(c, "")
+                           for c in range(self.ENTRY_EMPTY_DESCRIPTION + 1)],
+                          dtype=object)
+        messages = lookup[codes]
+        category_messages: dict[tuple[int, int], str] = {}
+        for i in np.flatnonzero(codes == self.ENTRY_BAD_CATEGORY):
+            key = (category_codes[i], type_codes[i])
+            if key not in category_messages:
+                category_messages[key] = self.CategoryMessage(
+                    categories[key[0]], types[key[1]])
+            messages[i] = category_messages[key]
+        return EntryValidation(codes=codes, messages=messages.tolist())
+
+    @staticmethod
+    def _TextColumn(Frame: DataFrame, Col: str) -> tuple[np.ndarray, list]:
+        """Return (codes, distinct values as str) for a text column.
+
+        Missing cells and an absent column map to a trailing '' so every
+        code indexes the returned list.
+        """
+        if Col not in Frame.columns:
+            return np.full(len(Frame), -1, dtype=np.intp), [""]
+        codes, uniques = pd.factorize(Frame[Col])
+        return codes, [str(v) for v in uniques] + [""]
+
+    @staticmethod
+    def _AmountColumn(Frame: DataFrame) -> tuple[np.ndarray, np.ndarray]:
+        """Return (amount as float, parsed-by-float() mask) per row."""
+        if "amount" not in Frame.columns:
+            return (np.full(len(Frame), np.nan),
+                    np.zeros(len(Frame), dtype=bool))
+        values = Frame["amount"]
+        if pd.api.types.is_numeric_dtype(values):
+            return (values.to_numpy(dtype=float, na_value=np.nan),
+                    np.ones(len(values), dtype=bool))
+        codes, uniques = pd.factorize(values)
+        # A trailing NaN slot catches code -1 (missing), as float(nan) does
+        parsed = np.full(len(uniques) + 1, np.nan)
+        ok = np.ones(len(uniques) + 1, dtype=bool)
+        for i, value in enumerate(uniques):
+            try:
+                parsed[i] = float(value)
+            except Exception:
+                ok[i] = False
+        return parsed[codes], ok[codes]
+
+    def ImportTransactions(self, Path, **Options):
+        """Bulk-import a CSV export; see TransactionImporter for options.
+
+        Returns the ImportResult with accepted/rejected/duplicate counts and
+        offending line numbers.
+        """
+        from src.transaction_importer import TransactionImporter
+        return TransactionImporter(self, **Options).ImportCsv(Path)
 
     def DateValidator(self, DateText: str) -> bool:
         """Return True if the string matches YYYY/MM/DD."""
@@ -114,19 +281,68 @@ class GillPayService:
     # Summaries
 
     def CalculateSum(self, Items: List[Transaction]) -> float:
-        """Return the sum of the amount field across transactions."""
-        total = 0.0
+        """Return the sum of the amount field across transactions.
+
+        Summed as whole cents, so the total is exact; a TransactionBatch
+        is summed straight from its cents array.
+        """
+        if isinstance(Items, TransactionBatch):
+            return int(Items.Cents.sum()) / 100
+        total = 0
         for tx in Items:
-            total += float(tx.amount)
-        return total
+            total += round(float(tx.amount) * 100)
+        return total / 100
 
     def GetTransactionSummary(self) -> Dict[str, float]:
-        """Return a summary dict with keys: income, expense, net."""
-        income = self.CalculateSum(self.GetIncomeData())
-        expense = self.CalculateSum(self.GetExpenseData())
-        net = income - expense
+        """Return a summary dict with keys: income, expense, net.
+
+        One masked int64 cents sum per type over a single ledger load; no
+        Transaction objects are built.
+        """
+        df = self.TransactionDAO.GetDataFrame()
+        cents = df[TransactionDAO.CENTS_COLUMN].to_numpy()
+        kinds = df["transaction"]
+        income_cents = int(cents[(kinds == "income").to_numpy()].sum())
+        expense_cents = int(cents[(kinds == "expense").to_numpy()].sum())
+        income, expense = income_cents / 100, expense_cents / 100
+        net = (income_cents - expense_cents) / 100
         return {"income": income, "expense": expense, "net": net}
 
+    # Ad-hoc queries
+
+    def Query(self, filters=None, date_range=None, group_by=None,
+              metrics=None, order_by=None, limit=None) -> DataFrame:
+        """Answer an ad-hoc ledger question in one grouped pass.
+
+        Example: Query(filters={"type": "expense"}, group_by=["category"],
+        metrics=["sum", "count"], order_by="-sum", limit=5). See
+        LedgerQuery.Normalize for the accepted arguments (ValueError on
+        unknown names). Results are cached by (data version, normalized
+        query), so repeating a question after no ledger change is free.
+        Returns a copy the caller may modify.
+        """
+        plan = LedgerQuery.Normalize(filters, date_range, group_by, metrics,
+                                     order_by, limit)
+        version = self.TransactionDAO.DataVersion()
+        if version != self._QueriesVersion:
+            self._Queries = {}
+            self._QueriesVersion = version
+        result = self._Queries.get(plan)
+        if result is None:
+            result = plan.Run(self.TransactionDAO)
+            if len(self._Queries) >= self.QUERY_CACHE_SIZE:
+                self._Queries.pop(next(iter(self._Queries)))
+            self._Queries[plan] = result
+        return result.copy()
+
+    def GetRecurringTransactions(self, MinOccurrences: int = 3) -> DataFrame:
+        """Return recurring transactions and their expected next dates.
+
+        See RecurringDetector for how buckets and periods are matched;
+        results are cached per data version. Returns a copy.
+        """
+        return self.Recurring.Detect(MinOccurrences).copy()
+
     # Reports (CLI PrettyTable)
 
     def GenerateReport(self, ReportType: str) -> None:
@@ -164,37 +380,27 @@ class GillPayService:
     def GetExpenseTotalsByCategory(self) -> Dict[str, float]:
         """Return {DisplayCategory: total} for expenses, collapsing
         case/space variants."""
-        df = self.TransactionDAO.ExpenseByCategoryData().copy(deep=True)
-        df.loc[:, "category"] = df["category"].astype(str)
-        df.loc[:, "__norm"] = df["category"].str.strip().str.lower()
-        summed = df.groupby("__norm", as_index=True, sort=False, dropna=False)[
-            "amount"].sum()
-        name_map = (
-            df.loc[:, ["__norm", "category"]]
-            .drop_duplicates("__norm", keep="first")
-            .set_index("__norm")["category"]
-            .apply(lambda s: str(s).strip().title())
-            .to_dict()
-        )
-        return {name_map.get(k, (k or "").title()): float(v) for k, v in
-                summed.items()}
+        return self.Categories.Totals(*self._CategoryCodes("expense"))
 
     def GetIncomeTotalsByCategory(self) -> Dict[str, float]:
         """Return {DisplayCategory: total} for income, collapsing case/space
         variants."""
-        df = self.TransactionDAO.GetDataFrame().copy(deep=True)
-        df.loc[:, "transaction"] = df["transaction"].astype(str).str.lower()
-        df = df[df["transaction"] == "income"].copy()
-        df.loc[:, "category"] = df["category"].astype(str)
-        df.loc[:, "__norm"] = df["category"].str.strip().str.lower()
-        summed = df.groupby("__norm", as_index=True, sort=False, dropna=False)[
-            "amount"].sum()
-        name_map = (
-            df.loc[:, ["__norm", "category"]]
-            .drop_duplicates("__norm", keep="first")
-            .set_index("__norm")["category"]
-            .apply(lambda s: str(s).strip().title())
-            .to_dict()
-        )
-        return {name_map.get(k, (k or "").title()): float(v) for k, v in
-                summed.items()}
+        return self.Categories.Totals(*self._CategoryCodes("income"))
+
+    def _CategoryCodes(self, TypeKey: str) -> tuple[np.ndarray, np.ndarray]:
+        """Return (registry ids, cents) for one type's category report.
+
+        Built from the DAO's cached reports once per data version, so a
+        chart click only pays for the bincount in CategoryRegistry.Totals.
+        """
+        version = self.TransactionDAO.DataVersion()
+        if version != self._CategoryCodesVersion:
+            reports = self.TransactionDAO.GetReports()
+            self._CategoryCodesByType = {
+                key: (self.Categories.Ids(report["category"]),
+                      AmountToCents(report["amount"]))
+                for key, report in (("expense", reports.expense),
+                                    ("income", reports.income))
+            }
+            self._CategoryCodesVersion = version
+        return self._CategoryCodesByType[TypeKey]
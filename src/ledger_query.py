@@ -0,0 +1,191 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: LedgerQuery
+
+# PURPOSE: Describe an ad-hoc ledger question (filters, date range,
+# grouping, metrics, ordering, limit) once and answer it in one pass.
+
+# INPUT: Query arguments from GillPayService.Query; a TransactionDAO.
+
+# PROCESS: Normalize the arguments into a hashable plan, slice the cached
+# date index for the range, filter text columns through their category
+# codes, group int64 cents once and aggregate every requested metric.
+
+# OUTPUT: A small DataFrame with one row per group.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Normalized, cacheable ledger queries for GillPay."""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from src.dao.transaction_dao import FoldedCodes, TransactionDAO
+
+
+@dataclass(frozen=True)
+class LedgerQuery:
+    """Hashable plan for one ledger question.
+
+    Build with LedgerQuery.Normalize so equivalent requests (other
+    spelling, case or ordering of filter values) share one cache entry.
+    """
+
+    # Text filter columns and the ledger column each reads
+    FILTER_COLUMNS = {"type": "transaction", "transaction": "transaction",
+                      "category": "category", "description": "description"}
+    GROUP_COLUMNS = ("type", "category", "description", "date", "month",
+                     "year")
+    # Aggregations over int64 cents; builtins map to their names
+    METRICS = ("sum", "count", "mean", "min", "max")
+    METRIC_ALIASES = {sum: "sum", len: "count", min: "min", max: "max"}
+
+    Filters: tuple[tuple[str, tuple[str, ...]], ...] = ()
+    DateRange: tuple | None = None
+    GroupBy: tuple[str, ...] = ()
+    Metrics: tuple[str, ...] = ("sum",)
+    OrderBy: tuple[str, ...] = ()
+    Limit: int | None = None
+
+    @classmethod
+    def Normalize(cls, filters=None, date_range=None, group_by=None,
+                  metrics=None, order_by=None, limit=None) -> "LedgerQuery":
+        """Validate query arguments and return the canonical plan.
+
+        filters maps 'type', 'category' or 'description' to one value or
+        a list of values, matched ignoring case and surrounding spaces.
+        date_range is (start, end) with either end optional; a range keeps
+        only rows with a valid date. group_by lists GROUP_COLUMNS; metrics
+        lists METRICS (or sum/len/min/max); order_by lists output columns,
+        '-' prefixed for descending. Raises ValueError on unknown names.
+        """
+        normalized_filters = []
+        for col, values in (filters or {}).items():
+            col = str(col).strip().lower()
+            if col not in cls.FILTER_COLUMNS:
+                raise ValueError(f"Cannot filter on '{col}'.")
+            if isinstance(values, str) or not hasattr(values, "__iter__"):
+                values = [values]
+            folded = tuple(sorted({cls.Fold(v) for v in values}))
+            normalized_filters.append((cls.FILTER_COLUMNS[col], folded))
+
+        if date_range is not None:
+            start, end = (tuple(date_range) + (None, None))[:2]
+            bounds = TransactionDAO._RangeBounds(start, end)
+            if bounds is None:
+                raise ValueError("Invalid date in date_range.")
+            date_range = bounds
+
+        group = tuple(str(g).strip().lower() for g in (group_by or ()))
+        for name in group:
+            if name not in cls.GROUP_COLUMNS:
+                raise ValueError(f"Cannot group by '{name}'.")
+
+        names = []
+        for metric in metrics or ("sum",):
+            name = cls.METRIC_ALIASES.get(metric, metric)
+            name = str(name).strip().lower()
+            if name not in cls.METRICS:
+                raise ValueError(f"Unknown metric '{metric}'.")
+            if name not in names:
+                names.append(name)
+
+        if isinstance(order_by, str):
+            order_by = [order_by]
+        order = tuple(str(o).strip() for o in (order_by or ()))
+        for key in order:
+            if key.lstrip("-") not in group + tuple(names):
+                raise ValueError(f"Cannot order by '{key}'.")
+
+        if limit is not None:
+            limit = int(limit)
+            if limit < 0:
+                raise ValueError("limit must be zero or more.")
+
+        return cls(Filters=tuple(sorted(normalized_filters)),
+                   DateRange=date_range, GroupBy=group,
+                   Metrics=tuple(names), OrderBy=order, Limit=limit)
+
+    @staticmethod
+    def Fold(value) -> str:
+        """Return the case/space-insensitive form of a text value."""
+        return str(value).strip().lower()
+
+    def Run(self, dao: TransactionDAO) -> DataFrame:
+        """Answer the query against *dao*'s cached ledger.
+
+        Columns are the GroupBy keys followed by the metrics; amounts are
+        in dollars and 'count' is a row count.
+        """
+        if self.DateRange is None:
+            df = dao.GetDataFrame()
+        else:
+            start, end = (None if b is None
+                          else pd.Timestamp(b).strftime("%Y/%m/%d")
+                          for b in self.DateRange)
+            df = dao.GetDataFrameInRange(start, end)
+
+        mask = np.ones(len(df), dtype=bool)
+        for col, values in self.Filters:
+            codes, folded = FoldedCodes(df[col])
+            wanted = np.isin(folded, values)
+            mask &= (codes >= 0) & wanted[codes]
+        if not mask.all():
+            df = df.loc[mask]
+
+        cents = df[TransactionDAO.CENTS_COLUMN].astype(np.int64)
+        if self.GroupBy:
+            keys = [self._GroupKey(df, name) for name in self.GroupBy]
+            grouped = cents.groupby(keys, sort=False, observed=True,
+                                    dropna=False).agg(list(self.Metrics))
+            result = grouped.reset_index()
+            for name in self.GroupBy:
+                if isinstance(result[name].dtype, pd.CategoricalDtype):
+                    result[name] = result[name].astype(object)
+        else:
+            result = DataFrame([cents.agg(list(self.Metrics))
+                                .reindex(self.Metrics)])
+        result = self._ToDollars(result)
+
+        order = self.OrderBy or self.GroupBy
+        if order and len(result):
+            result = result.sort_values(
+                [o.lstrip("-") for o in order],
+                ascending=[not o.startswith("-") for o in order],
+                kind="stable", na_position="last")
+        if self.Limit is not None:
+            result = result.head(self.Limit)
+        return result.reset_index(drop=True)
+
+    @classmethod
+    def _GroupKey(cls, df: DataFrame, name: str) -> pd.Series:
+        """Return the per-row grouping key for one GROUP_COLUMNS name."""
+        if name == "type":
+            codes, folded = FoldedCodes(df["transaction"])
+            return pd.Series(pd.Categorical.from_codes(
+                codes, categories=folded), index=df.index, name="type")
+        if name == "year":
+            return df["datetime"].dt.year.rename("year")
+        return df[name]
+
+    def _ToDollars(self, result: DataFrame) -> DataFrame:
+        """Convert cent metrics to dollars; counts stay integers."""
+        for name in self.Metrics:
+            if name == "count":
+                result[name] = result[name].astype(np.int64)
+            elif name == "sum":
+                result[name] = result[name].astype(np.int64) / 100
+            else:
+                # mean, and min/max of an empty selection, can be NaN
+                result[name] = result[name].astype(float) / 100
+        return result
@@ -0,0 +1,123 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: LedgerStore
+
+# PURPOSE: One app-wide, observable view of the ledger shared by every GUI
+# tab and the summary bar.
+
+# INPUT: A TransactionDAO; transactions to save; subscriber callbacks.
+
+# PROCESS: Load the ledger frame once per data version, save through the
+# DAO, and publish a LedgerChange to every subscriber whenever the version
+# moves.
+
+# OUTPUT: Shared DataFrame snapshots and change notifications.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Shared observable ledger store for GillPay's GUI."""
+
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+from pandas import DataFrame
+
+from src.dao.transaction_dao import TransactionDAO
+from src.models.transaction import Transaction
+
+
+@dataclass(frozen=True)
+class LedgerChange:
+    """Published after the ledger moves to a new data version.
+
+    Frame is the shared snapshot for that version (treat as read-only).
+    Appended holds the rows added by a save through the store, or None
+    when the change came from a reload (external edit, first load).
+    """
+
+    Version: object
+    Frame: DataFrame
+    Appended: DataFrame | None = None
+
+
+class LedgerStore:
+    """App-wide ledger snapshot with publish/subscribe change events.
+
+    Tabs subscribe once and redraw from the LedgerChange they receive, so
+    a save costs one DAO read for the whole window instead of one per tab.
+    Report queries still go through Dao, whose report cache is keyed on
+    the same data version.
+    """
+
+    def __init__(self, dao: TransactionDAO | None = None):
+        """Wrap *dao* (default ledger when omitted); nothing is read yet."""
+        self.Dao = dao if dao is not None else TransactionDAO()
+        self._Subscribers: list[Callable[[LedgerChange], None]] = []
+        self._Version = None
+        self._Frame: DataFrame | None = None
+
+    def Subscribe(self, callback: Callable[[LedgerChange], None]) -> Callable[
+            [], None]:
+        """Register *callback* for change events; returns an unsubscribe
+        function."""
+        self._Subscribers.append(callback)
+
+        def Unsubscribe() -> None:
+            if callback in self._Subscribers:
+                self._Subscribers.remove(callback)
+
+        return Unsubscribe
+
+    @property
+    def Version(self):
+        """Data version of the current snapshot (None before first load)."""
+        return self._Version
+
+    def Snapshot(self) -> DataFrame:
+        """Return the shared frame, loading it on first use only."""
+        if self._Frame is None:
+            self.Refresh()
+        return self._Frame
+
+    def Refresh(self) -> bool:
+        """Reload if the DAO's data version moved and notify subscribers.
+
+        Returns True when an event was published.
+        """
+        return self._Update(None)
+
+    def SaveTransaction(self, tx: Transaction) -> None:
+        """Append one transaction and publish the change."""
+        self.SaveTransactions([tx])
+
+    def SaveTransactions(self, transactions: Iterable[Transaction]) -> None:
+        """Append transactions through the DAO and publish one change
+        carrying the appended rows."""
+        transactions = list(transactions)
+        if not transactions:
+            return
+        before = None if self._Frame is None else len(self._Frame)
+        self.Dao.SaveTransactions(transactions)
+        self._Update(before)
+
+    def _Update(self, rows_before: int | None) -> bool:
+        """Load the current version once and publish it if it is new."""
+        version = self.Dao.DataVersion()
+        if self._Frame is not None and version == self._Version:
+            return False
+        frame = self.Dao.GetDataFrame()
+        appended = None
+        if rows_before is not None and len(frame) >= rows_before:
+            appended = frame.iloc[rows_before:]
+        self._Version, self._Frame = version, frame
+        change = LedgerChange(Version=version, Frame=frame, Appended=appended)
+        for callback in list(self._Subscribers):
+            callback(change)
+        return True
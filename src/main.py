@@ -6,12 +6,15 @@
 
 # PURPOSE: Launch GillPay (CLI) and simple visualizations or open the GUI.
 
-# INPUT: User selections via CLI prompts.
+# INPUT: User selections via CLI prompts, or subcommand arguments
+# (add, summary, report, export, import) for scripted use.
 
 # PROCESS: Route actions to service layer; validate inputs; render
-# summaries/reports.
+# summaries/reports. Pandas-backed layers are imported only by the
+# commands that use them.
 
-# OUTPUT: Saved transactions, printed summaries/reports, or GUI launch.
+# OUTPUT: Saved transactions, printed summaries/reports (table, CSV or
+# JSON), or GUI launch.
 
 # HONOR CODE: On my honor, as an Aggie, I have neither given nor received
 # unauthorized aid on this academic work.
@@ -21,15 +24,51 @@
 # intelligence tools to assist in writing my Python code.
 
 
+from __future__ import annotations
+
+import time
+
+# Taken before the other imports so --startup-profile covers module loading
+_STARTED = time.perf_counter()
+
+import argparse
+import sys
 from datetime import datetime, date
-from typing import Dict, Literal, Optional
-from src.gillpay_service import GillPayService
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Literal, Optional
 from src.models.transaction import Transaction
 
+if TYPE_CHECKING:
+    from src.gillpay_service import GillPayService
+    from src.startup_profile import StartupProfile
+
 # Constants for report routing
 REPORT_EXP_BY_CAT: Literal["EXP_BY_CAT"] = "EXP_BY_CAT"
 REPORT_SUMMARY_BY_MONTH: Literal["SUMMARY_BY_MONTH"] = "SUMMARY_BY_MONTH"
 
+# Subcommand report names
+REPORT_NAMES = {"exp-by-cat": REPORT_EXP_BY_CAT,
+                "by-month": REPORT_SUMMARY_BY_MONTH}
+
+OUTPUT_FORMATS = ("table", "csv", "json")
+
+# Packages a light command or the menu must start without
+PANDAS_STACK = ("numpy", "pandas", "prettytable", "matplotlib")
+
+# --startup-profile budget: mark -> (max seconds since start, packages that
+# must not be imported by then); see StartupBudget
+CLI_STARTUP_BUDGET = {
+    "imports": (0.15, PANDAS_STACK),
+    "menu shown": (0.25, PANDAS_STACK),
+}
+
+# Subcommands that must finish without Pandas, with their time budget
+LIGHT_COMMANDS = {"summary": 0.5}
+
+# Ledger TransactionDAO binds to when no --data path is given
+DEFAULT_LEDGER = Path(__file__).resolve().parents[1] / "data" / \
+    "gillpay_data.csv"
+
 # Validation helpers
 ALLOWED_DATE_FORMATS = [
     "%Y/%m/%d",  # 2025/10/05
@@ -131,10 +170,20 @@ def PromptDescription() -> str:
 
 # Core CLI actions
 
-def HandleTransaction() -> None:
+def NewService(Data: Optional[str] = None) -> GillPayService:
+    """Return a GillPayService, importing it (and Pandas) on first use;
+    *Data* overrides the ledger path."""
+    from src.gillpay_service import GillPayService
+    if Data is None:
+        return GillPayService()
+    from src.dao.transaction_dao import TransactionDAO
+    return GillPayService(TransactionDAO(Data))
+
+
+def HandleTransaction(Data: Optional[str] = None) -> None:
     """Collect a transaction from the user and persist it via the service."""
     try:
-        GillPay = GillPayService()
+        GillPay = NewService(Data)
 
         print()
         TransactionType = PromptTransactionType()
@@ -160,26 +209,69 @@ def HandleTransaction() -> None:
             f"An unexpected error occurred while saving the transaction: {Ex}")
 
 
-def HandleSummary() -> None:
+def HandleSummary(Data: Optional[str] = None) -> None:
     """Print the account summary (income, expense, net)."""
     try:
-        GillPay = GillPayService()
-        SummaryData = GillPay.GetTransactionSummary()
+        SummaryData = ReadSummary(Data)
         print()
-        print(f"{'-' * 5} Account Summary {'-' * 5}")
-        print(f"{'Description':10} {'Amount':>10}")
-        print(f"{'Income':10} {SummaryData['income']:>10.2f}")
-        print(f"{'Expense':10} {SummaryData['expense']:>10.2f}")
-        print(f"{'Net':10} {SummaryData['net']:>10.2f}")
+        PrintSummary(SummaryData)
     except Exception as Ex:
         print(
             f"An unexpected error occurred while generating the summary: {Ex}")
 
 
-def HandleReport(ReportType: str) -> None:
+def ReadSummary(Data: Optional[str] = None) -> Dict[str, float]:
+    """Return the account summary (income, expense, net).
+
+    CSV ledgers with a saved monthly rollup are summed from its per-type
+    totals, which count every row the way GetTransactionSummary does; this
+    needs neither Pandas nor a full ledger parse, and writes nothing. Other
+    ledgers, and CSV ledgers without a usable rollup, go through the
+    service.
+    """
+    if not IsCsvLedger(Data):
+        return NewService(Data).GetTransactionSummary()
+    from src.dao.monthly_rollup import MonthlyRollup
+    Rollup = MonthlyRollup(LedgerPath(Data)).Peek()
+    if Rollup is None:
+        # Summing with Pandas beats folding the whole file in Python
+        return NewService(Data).GetTransactionSummary()
+    Kinds = Rollup.KindTotals()
+    Income = Kinds.get("income", [0, 0])[0]
+    Expense = Kinds.get("expense", [0, 0])[0]
+    return {"income": Income / 100, "expense": Expense / 100,
+            "net": (Income - Expense) / 100}
+
+
+def LedgerPath(Data: Optional[str] = None) -> Path:
+    """Return the resolved ledger path (default: DEFAULT_LEDGER)."""
+    return (Path(Data) if Data else DEFAULT_LEDGER).resolve()
+
+
+def IsCsvLedger(Data: Optional[str] = None) -> bool:
+    """Return True when *Data* (default: DEFAULT_LEDGER) is a CSV ledger."""
+    return LedgerPath(Data).suffix.lower() == ".csv"
+
+
+def HasRollup(Data: Optional[str] = None) -> bool:
+    """Return True when a monthly rollup has been saved for *Data*."""
+    from src.dao.monthly_rollup import MonthlyRollup
+    return MonthlyRollup(LedgerPath(Data)).Path.exists()
+
+
+def PrintSummary(SummaryData: Dict[str, float]) -> None:
+    """Print the account summary block."""
+    print(f"{'-' * 5} Account Summary {'-' * 5}")
+    print(f"{'Description':10} {'Amount':>10}")
+    print(f"{'Income':10} {SummaryData['income']:>10.2f}")
+    print(f"{'Expense':10} {SummaryData['expense']:>10.2f}")
+    print(f"{'Net':10} {SummaryData['net']:>10.2f}")
+
+
+def HandleReport(ReportType: str, Data: Optional[str] = None) -> None:
     """Display a report. Supported values: EXP_BY_CAT, SUMMARY_BY_MONTH."""
     try:
-        GillPay = GillPayService()
+        GillPay = NewService(Data)
         print()
         GillPay.GenerateReport(ReportType)
     except Exception as Ex:
@@ -198,11 +290,11 @@ def TryGetCategoryTotals(Service: GillPayService) -> Optional[Dict[str, float]]:
 
 
 def LaunchApp() -> None:
-    """Launch the Tk GUI (preferred: gui.app:main(); fallback: run as
+    """Launch the Tk GUI (preferred: gui.app:Main(); fallback: run as
     module)."""
     try:
-        from gui.app import main as GuiMain
-        GuiMain()
+        from gui.app import Main as GuiMain
+        GuiMain([])
         return
     except Exception:
         pass
@@ -214,7 +306,7 @@ def LaunchApp() -> None:
         print(f"Could not launch GUI: {ex}")
 
 
-def HandleMatplotlibChart() -> None:
+def HandleMatplotlibChart(Data: Optional[str] = None) -> None:
     """Show a simple bar chart of expense totals by category using
     Matplotlib."""
     try:
@@ -224,7 +316,7 @@ def HandleMatplotlibChart() -> None:
         return
 
     try:
-        GillPay = GillPayService()
+        GillPay = NewService(Data)
         TotalsByCategory = GillPay.GetExpenseTotalsByCategory()
     except Exception as Ex:
         print(f"Could not compute category totals: {Ex}")
@@ -264,12 +356,18 @@ def PrintMenu() -> None:
     print("Press 7: Farewell!")
 
 
-def main() -> None:
-    """Interactive CLI loop for GillPay."""
+def RunMenu(Data: Optional[str] = None,
+            Profile: Optional[StartupProfile] = None) -> None:
+    """Interactive CLI loop for GillPay; *Profile* gets a 'menu shown'
+    mark the first time the menu prints."""
     GillPayIsRunning = True
+    MenuShown = False
     try:
         while GillPayIsRunning:
             PrintMenu()
+            if Profile is not None and not MenuShown:
+                Profile.Mark("menu shown")
+            MenuShown = True
             try:
                 UserChoice = int(input("Action: ").strip())
             except ValueError:
@@ -280,15 +378,15 @@ def main() -> None:
                 continue
 
             if UserChoice == 1:
-                HandleTransaction()
+                HandleTransaction(Data)
             elif UserChoice == 2:
-                HandleSummary()
+                HandleSummary(Data)
             elif UserChoice == 3:
-                HandleReport(REPORT_EXP_BY_CAT)
+                HandleReport(REPORT_EXP_BY_CAT, Data)
             elif UserChoice == 4:
-                HandleReport(REPORT_SUMMARY_BY_MONTH)
+                HandleReport(REPORT_SUMMARY_BY_MONTH, Data)
             elif UserChoice == 5:
-                HandleMatplotlibChart()
+                HandleMatplotlibChart(Data)
             elif UserChoice == 6:
                 LaunchApp()
             elif UserChoice == 7:
@@ -304,6 +402,244 @@ def main() -> None:
             "needs!")
 
 
+# Subcommands (scripted use)
+
+def CliDate(Value: str) -> str:
+    """argparse type: accept any ALLOWED_DATE_FORMATS date as YYYY/MM/DD."""
+    Dt = TryParseDate(Value)
+    if not Dt:
+        raise argparse.ArgumentTypeError(
+            f"unrecognized date '{Value}' (try 2025/10/01)")
+    return Dt.strftime("%Y/%m/%d")
+
+
+def Emit(Columns: list[str], Rows: list[list], Format: str,
+         Title: str = "", Out=None) -> None:
+    """Write rows as a PrettyTable, CSV, or a JSON list of objects."""
+    Out = Out or sys.stdout
+    if Format == "json":
+        import json
+        json.dump([dict(zip(Columns, Row)) for Row in Rows], Out, indent=2,
+                  default=lambda V: V.item() if hasattr(V, "item")
+                  else str(V))
+        Out.write("\n")
+    elif Format == "csv":
+        import csv
+        Writer = csv.writer(Out, lineterminator="\n")
+        Writer.writerow(Columns)
+        Writer.writerows(Rows)
+    else:
+        from prettytable import PrettyTable
+        Table = PrettyTable()
+        Table.field_names = [C.replace("_", " ").title() for C in Columns]
+        if Title:
+            Table.title = Title
+        for Row in Rows:
+            Table.add_row([f"${V:.2f}" if isinstance(V, float) else V
+                           for V in Row])
+        Out.write(f"{Table}\n")
+
+
+def CmdAdd(Args: argparse.Namespace) -> int:
+    """Validate and save one transaction given on the command line."""
+    if Args.amount <= 0:
+        raise ValueError("Amount must be greater than zero.")
+    if not IsValidDate(Args.date):
+        raise ValueError("Date must be between 1900/01/01 and today.")
+    GillPay = NewService(Args.data)
+    NewTransaction = Transaction(
+        transaction=Args.type,
+        category=Args.category.strip(),
+        description=Args.description.strip(),
+        amount=round(Args.amount, 2),
+        date=Args.date,
+    )
+    GillPay.ValidateEntry(NewTransaction)
+    GillPay.TransactionDAO.SaveTransaction(NewTransaction)
+    print("Transaction recorded successfully.")
+    return 0
+
+
+def CmdSummary(Args: argparse.Namespace) -> int:
+    """Print income, expense and net totals."""
+    SummaryData = ReadSummary(Args.data)
+    if Args.format == "table":
+        PrintSummary(SummaryData)
+    else:
+        Emit(["income", "expense", "net"],
+             [[SummaryData["income"], SummaryData["expense"],
+               SummaryData["net"]]], Args.format)
+    return 0
+
+
+def CmdReport(Args: argparse.Namespace) -> int:
+    """Print expense-by-category or summary-by-month for a date range."""
+    Dao = NewService(Args.data).TransactionDAO
+    if REPORT_NAMES[Args.name] == REPORT_EXP_BY_CAT:
+        Report = Dao.ExpenseByCategoryData(Args.start, Args.end)
+        Columns, Title = ["category", "amount"], "Expense By Category"
+    else:
+        if Args.start is None and Args.end is None:
+            Report = Dao.SummaryByMonthData()
+        else:
+            Report = Dao.GetReports(Args.start, Args.end).monthly
+        Columns = ["month", "income", "expense", "net"]
+        Title = "Summary By Month"
+    Rows = Report.loc[:, Columns].astype(object).values.tolist()
+    Emit(Columns, Rows, Args.format, Title)
+    return 0
+
+
+def CmdExport(Args: argparse.Namespace) -> int:
+    """Write the ledger (optionally a date range of it) to a file or
+    stdout."""
+    Dao = NewService(Args.data).TransactionDAO
+    if Args.start is None and Args.end is None:
+        Frame = Dao.GetDataFrame()
+    else:
+        Frame = Dao.GetDataFrameInRange(Args.start, Args.end)
+    Frame = Frame.loc[:, Dao.COLUMNS]
+    Out = (open(Args.output, "w", newline="", encoding="utf-8")
+           if Args.output else sys.stdout)
+    try:
+        if Args.format == "csv":
+            Frame.to_csv(Out, index=False, float_format="%.2f",
+                         lineterminator="\n")
+        else:
+            Emit(Dao.COLUMNS, Frame.astype(object).values.tolist(),
+                 Args.format, "Transactions", Out)
+    finally:
+        if Out is not sys.stdout:
+            Out.close()
+    return 0
+
+
+def CmdImport(Args: argparse.Namespace) -> int:
+    """Bulk-import a CSV; exits 1 when any row was rejected."""
+    Result = NewService(Args.data).ImportTransactions(
+        Args.path,
+        chunksize=Args.chunksize,
+        default_category=Args.default_category,
+        skip_duplicates=not Args.keep_duplicates,
+    )
+    Emit(["accepted", "rejected", "duplicates"],
+         [[Result.accepted, Result.rejected, Result.duplicates]],
+         Args.format, "Import")
+    for Line, Message in Result.errors:
+        print(f"line {Line}: {Message}", file=sys.stderr)
+    return 1 if Result.rejected else 0
+
+
+def BuildParser() -> argparse.ArgumentParser:
+    """Return the argparse parser for the GillPay subcommands."""
+    Parser = argparse.ArgumentParser(
+        prog="gillpay",
+        description="GillPay finance tracker. Run without a command for "
+                    "the interactive menu (on --data when given).")
+    Parser.add_argument("--data", metavar="PATH",
+                        help="ledger CSV or SQLite file (default: "
+                             "data/gillpay_data.csv)")
+    Parser.add_argument("--startup-profile", action="store_true",
+                        help="print an import/first-output timing breakdown "
+                             "to stderr; exit status 3 when it exceeds the "
+                             "startup budget")
+    Commands = Parser.add_subparsers(dest="command", metavar="command")
+
+    def AddFormat(Sub: argparse.ArgumentParser, Default: str) -> None:
+        Sub.add_argument("--format", choices=OUTPUT_FORMATS, default=Default,
+                         help=f"output format (default: {Default})")
+
+    def AddRange(Sub: argparse.ArgumentParser) -> None:
+        Sub.add_argument("--from", dest="start", type=CliDate,
+                         metavar="DATE", help="first date to include")
+        Sub.add_argument("--to", dest="end", type=CliDate, metavar="DATE",
+                         help="last date to include")
+
+    Add = Commands.add_parser("add", help="record a transaction")
+    Add.add_argument("--type", required=True, choices=("expense", "income"),
+                     type=str.lower)
+    Add.add_argument("--category", required=True)
+    Add.add_argument("--description", required=True)
+    Add.add_argument("--amount", required=True, type=float)
+    Add.add_argument("--date", type=CliDate,
+                     default=date.today().strftime("%Y/%m/%d"),
+                     help="transaction date (default: today)")
+    Add.set_defaults(Handler=CmdAdd)
+
+    Summary = Commands.add_parser("summary", help="income, expense and net")
+    AddFormat(Summary, "table")
+    Summary.set_defaults(Handler=CmdSummary)
+
+    Report = Commands.add_parser("report", help="print a report")
+    Report.add_argument("name", choices=tuple(REPORT_NAMES))
+    AddRange(Report)
+    AddFormat(Report, "table")
+    Report.set_defaults(Handler=CmdReport)
+
+    Export = Commands.add_parser("export", help="export the ledger")
+    Export.add_argument("-o", "--output", metavar="FILE",
+                        help="write to FILE instead of stdout")
+    AddRange(Export)
+    AddFormat(Export, "csv")
+    Export.set_defaults(Handler=CmdExport)
+
+    Import = Commands.add_parser("import", help="bulk-import a CSV file")
+    Import.add_argument("path", help="CSV file to import")
+    Import.add_argument("--default-category", default="Other",
+                        help="category for rows without one")
+    Import.add_argument("--chunksize", type=int, default=10_000,
+                        help="rows read per chunk")
+    Import.add_argument("--keep-duplicates", action="store_true",
+                        help="import rows already in the ledger")
+    AddFormat(Import, "table")
+    Import.set_defaults(Handler=CmdImport)
+    return Parser
+
+
+def StartupBudget(Args: argparse.Namespace) -> dict:
+    """Return the --startup-profile budget for a parsed command line.
+
+    Every run must import and show the menu without the Pandas stack;
+    LIGHT_COMMANDS on a CSV ledger with a saved rollup must also finish
+    without it, in time. Other runs are data-bound, so their 'done' mark is
+    reported only.
+    """
+    Budget = dict(CLI_STARTUP_BUDGET)
+    if (Args.command in LIGHT_COMMANDS and IsCsvLedger(Args.data)
+            and HasRollup(Args.data)):
+        Budget["done"] = (LIGHT_COMMANDS[Args.command], PANDAS_STACK)
+    return Budget
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run a subcommand, or the interactive menu when none is given."""
+    Argv = sys.argv[1:] if argv is None else argv
+    if not Argv:
+        RunMenu()
+        return 0
+    Profile = None
+    if "--startup-profile" in Argv:
+        from src.startup_profile import StartupProfile
+        Profile = StartupProfile("gillpay " + " ".join(Argv), _STARTED)
+        Profile.Mark("imports")
+    Args = BuildParser().parse_args(Argv)
+    Status = 0
+    if Args.command is None:
+        RunMenu(Args.data, Profile)
+    else:
+        try:
+            Status = Args.Handler(Args)
+        except (OSError, ValueError) as Ex:
+            print(f"gillpay {Args.command}: {Ex}", file=sys.stderr)
+            Status = 1
+        if Profile is not None:
+            Profile.Mark("done")
+    if Profile is not None and Profile.Report(StartupBudget(Args)):
+        from src.startup_profile import BUDGET_EXCEEDED_STATUS
+        Status = Status or BUDGET_EXCEEDED_STATUS
+    return Status
+
+
 # Fun: ASCII logo
 
 def GillPayLogo():
@@ -317,4 +653,4 @@ def GillPayLogo():
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -25,9 +25,13 @@ from dataclasses import dataclass
 from typing import Any, Iterable
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Transaction:
-    """Immutable data container for a GillPay transaction."""
+    """Immutable data container for a GillPay transaction.
+
+    Slotted, so instances carry no per-object __dict__; use
+    TransactionBatch for large result sets.
+    """
 
     transaction: str
     category: str
@@ -0,0 +1,172 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: TransactionBatch
+
+# PURPOSE: Columnar container for many transactions without one Python
+# object per row.
+
+# INPUT: A ledger DataFrame from TransactionDAO.
+
+# PROCESS: Keep dictionary codes for the text columns, integer cents and
+# date ordinals in parallel NumPy arrays; build Transaction objects only
+# for the rows a caller actually touches.
+
+# OUTPUT: Transaction objects on demand, sub-batches and DataFrames.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Columnar batch of GillPay transactions backed by parallel arrays."""
+
+from dataclasses import dataclass
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+from src.models.transaction import Transaction
+
+# datetime.date(1970, 1, 1).toordinal()
+EPOCH_ORDINAL = 719163
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class TransactionBatch:
+    """Read-only run of transactions stored column by column.
+
+    Text columns are (codes, values) pairs where code -1 marks a missing
+    cell; amounts are int64 cents; Ordinals holds date.toordinal() per row
+    (0 for an invalid date). Slicing returns a batch of array views, and
+    indexing or iterating builds Transaction objects one row at a time.
+    """
+
+    TypeCodes: np.ndarray
+    Types: np.ndarray
+    CategoryCodes: np.ndarray
+    Categories: np.ndarray
+    DescriptionCodes: np.ndarray
+    Descriptions: np.ndarray
+    Cents: np.ndarray
+    DateCodes: np.ndarray
+    Dates: np.ndarray
+    Ordinals: np.ndarray
+
+    @classmethod
+    def FromDataFrame(cls, df: pd.DataFrame) -> "TransactionBatch":
+        """Wrap a ledger frame; categorical columns share its codes."""
+
+        def Encode(col: str) -> tuple[np.ndarray, np.ndarray]:
+            values = df[col]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                codes = values.array.codes
+                uniques = values.cat.categories.to_numpy(dtype=object)
+            else:
+                codes, uniques = pd.factorize(values)
+                uniques = np.asarray(uniques, dtype=object)
+            return _ReadOnly(codes), uniques
+
+        if "cents" in df.columns:
+            cents = df["cents"].to_numpy()
+        else:
+            cents = np.rint(df["amount"].to_numpy(dtype=float) * 100)
+        if "datetime" in df.columns:
+            days = df["datetime"].to_numpy().astype("datetime64[D]")
+            ordinals = np.where(np.isnat(days), 0,
+                                days.astype(np.int64) + EPOCH_ORDINAL)
+        else:
+            ordinals = np.zeros(len(df), dtype=np.int64)
+        return cls(*Encode("transaction"), *Encode("category"),
+                   *Encode("description"),
+                   _ReadOnly(cents.astype(np.int64)), *Encode("date"),
+                   _ReadOnly(ordinals.astype(np.int64)))
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.Cents)
+
+    def __getitem__(self, key):
+        """Return a Transaction for an integer, else a sub-batch for a
+        slice, boolean mask or index array."""
+        if isinstance(key, (int, np.integer)):
+            i = int(key)
+            return Transaction(
+                transaction=_Decode(self.Types, self.TypeCodes[i]),
+                category=_Decode(self.Categories, self.CategoryCodes[i]),
+                description=_Decode(self.Descriptions,
+                                    self.DescriptionCodes[i]),
+                amount=int(self.Cents[i]) / 100,
+                date=_Decode(self.Dates, self.DateCodes[i]),
+            )
+        return TransactionBatch(
+            self.TypeCodes[key], self.Types,
+            self.CategoryCodes[key], self.Categories,
+            self.DescriptionCodes[key], self.Descriptions,
+            self.Cents[key], self.DateCodes[key], self.Dates,
+            self.Ordinals[key])
+
+    def __iter__(self) -> Iterator[Transaction]:
+        """Yield one Transaction per row; codes are decoded column-wise
+        up front, objects are built as the caller advances."""
+        columns = (
+            _Lookup(self.Types)[self.TypeCodes].tolist(),
+            _Lookup(self.Categories)[self.CategoryCodes].tolist(),
+            _Lookup(self.Descriptions)[self.DescriptionCodes].tolist(),
+            (self.Cents / 100).tolist(),
+            _Lookup(self.Dates)[self.DateCodes].tolist(),
+        )
+        for tx_type, category, description, amount, date in zip(*columns):
+            yield Transaction(transaction=tx_type, category=category,
+                              description=description, amount=amount,
+                              date=date)
+
+    @property
+    def Amounts(self) -> np.ndarray:
+        """Amounts in dollars as float64."""
+        return self.Cents / 100
+
+    def ToList(self) -> list[Transaction]:
+        """Materialize every row as a Transaction."""
+        return list(self)
+
+    def ToDataFrame(self) -> pd.DataFrame:
+        """Return the batch in the ledger column layout.
+
+        Text columns are categoricals over the batch's own code arrays,
+        so no per-row strings are built; 'amount' is derived from cents.
+        """
+
+        def Column(codes: np.ndarray, values: np.ndarray) -> pd.Categorical:
+            return pd.Categorical.from_codes(
+                codes, dtype=pd.CategoricalDtype(values), validate=False)
+
+        return pd.DataFrame({
+            "transaction": Column(self.TypeCodes, self.Types),
+            "category": Column(self.CategoryCodes, self.Categories),
+            "description": Column(self.DescriptionCodes, self.Descriptions),
+            "amount": self.Amounts,
+            "date": Column(self.DateCodes, self.Dates),
+        }, copy=False)
+
+
+def _ReadOnly(values: np.ndarray) -> np.ndarray:
+    """Return a non-writeable view so batches never alias writable data."""
+    view = np.asarray(values).view()
+    view.flags.writeable = False
+    return view
+
+
+def _Lookup(values: np.ndarray) -> np.ndarray:
+    """Return *values* with a trailing 'nan' so code -1 decodes the way
+    str() renders a missing cell."""
+    return np.append(values, "nan").astype(object)
+
+
+def _Decode(values: np.ndarray, code) -> str:
+    """Return the string for one dictionary code."""
+    return "nan" if code < 0 else str(values[code])
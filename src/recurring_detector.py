@@ -0,0 +1,189 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: RecurringDetector
+
+# PURPOSE: Find recurring transactions (rent, subscriptions, paychecks) in
+# the full ledger history and predict when each is due next.
+
+# INPUT: A TransactionDAO; the minimum number of occurrences to report.
+
+# PROCESS: Normalize descriptions once per distinct value, hash
+# (type, category, description, whole-dollar amount) into integer bucket
+# ids, order rows by bucket then date, take inter-arrival gaps with one
+# vectorized diff, and score each bucket's gaps against weekly, biweekly,
+# monthly, quarterly and yearly periods with bincount reductions.
+
+# OUTPUT: A DataFrame of detected recurrences with their expected next
+# dates, cached per data version.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Vectorized detector for recurring GillPay transactions."""
+
+import re
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from src.dao.transaction_dao import FoldedCodes, TransactionDAO
+
+# Digits and punctuation dropped from descriptions before bucketing, so
+# "Invoice #1042" and "Invoice #1043" land together
+_NOISE = re.compile(r"[\d\W_]+")
+
+
+class RecurringDetector:
+    """Detect recurring transactions over a DAO's full history.
+
+    A bucket is every valid-date row sharing type, category, normalized
+    description and amount rounded to whole dollars. A bucket recurs when
+    it has at least min_occurrences rows and at least MIN_REGULAR of its
+    gaps fall within a period's tolerance. Results are cached per
+    (data version, min_occurrences).
+    """
+
+    # (name, nominal days, tolerance days, calendar months or None)
+    PERIODS = (
+        ("weekly", 7, 1, None),
+        ("biweekly", 14, 2, None),
+        ("monthly", 30.44, 3, 1),
+        ("quarterly", 91.31, 7, 3),
+        ("yearly", 365.25, 10, 12),
+    )
+
+    # Share of a bucket's gaps that must match its period
+    MIN_REGULAR = 0.8
+
+    COLUMNS = ["type", "category", "description", "amount", "frequency",
+               "interval_days", "occurrences", "last_date", "next_date"]
+
+    def __init__(self, dao: TransactionDAO):
+        """Bind to *dao*; nothing is computed until Detect."""
+        self.Dao = dao
+        self._Results: dict[int, DataFrame] = {}
+        self._Version = None
+
+    def Detect(self, min_occurrences: int = 3) -> DataFrame:
+        """Return detected recurrences ordered by next_date.
+
+        Columns follow COLUMNS; description and amount come from the most
+        recent occurrence. Treat the frame as read-only.
+        """
+        min_occurrences = max(2, int(min_occurrences))
+        version = self.Dao.DataVersion()
+        if version != self._Version:
+            self._Results = {}
+            self._Version = version
+        result = self._Results.get(min_occurrences)
+        if result is None:
+            result = self._Detect(self.Dao.GetDataFrameInRange(),
+                                  min_occurrences)
+            self._Results[min_occurrences] = result
+        return result
+
+    @staticmethod
+    def NormalizeDescription(text) -> str:
+        """Return the bucketing form of a description."""
+        return " ".join(_NOISE.sub(" ", str(text).casefold()).split())
+
+    @classmethod
+    def BucketIds(cls, df: DataFrame) -> np.ndarray:
+        """Return one integer bucket id per row (dense, 0-based)."""
+        type_codes, types = FoldedCodes(df["transaction"])
+        category_codes, categories = FoldedCodes(df["category"])
+        description = df["description"]
+        if isinstance(description.dtype, pd.CategoricalDtype):
+            raw_codes = description.array.codes
+            raw = description.cat.categories
+        else:
+            raw_codes, raw = pd.factorize(description)
+        desc_lookup, descriptions = pd.factorize(
+            np.array([cls.NormalizeDescription(d) for d in raw],
+                     dtype=object))
+        desc_codes = np.append(desc_lookup, -1)[raw_codes]
+        dollar_codes, dollars = pd.factorize(
+            np.rint(df[TransactionDAO.CENTS_COLUMN].to_numpy() / 100))
+
+        # Mixed-radix composite of the four codes (+1 keeps -1 in range)
+        key = type_codes.astype(np.int64) + 1
+        for codes, size in ((category_codes, len(categories)),
+                            (desc_codes, len(descriptions)),
+                            (dollar_codes, len(dollars))):
+            key = key * (size + 1) + (codes.astype(np.int64) + 1)
+        return pd.factorize(key)[0]
+
+    @classmethod
+    def _Detect(cls, df: DataFrame, min_occurrences: int) -> DataFrame:
+        """Run the detector over valid-date rows of *df*."""
+        if df.empty:
+            return DataFrame(columns=cls.COLUMNS)
+        bucket = cls.BucketIds(df)
+        days = df["datetime"].to_numpy().astype("datetime64[D]").astype(
+            np.int64)
+        order = np.lexsort((days, bucket))
+        bucket, days = bucket[order], days[order]
+        n_buckets = int(bucket.max()) + 1
+
+        counts = np.bincount(bucket, minlength=n_buckets)
+        # Row position of each bucket's most recent occurrence
+        last = np.flatnonzero(np.append(bucket[1:] != bucket[:-1], True))
+
+        same = bucket[1:] == bucket[:-1]
+        gaps = np.diff(days)[same]
+        gap_bucket = bucket[1:][same]
+        n_gaps = np.bincount(gap_bucket, minlength=n_buckets)
+        mean_gap = np.bincount(gap_bucket, weights=gaps,
+                               minlength=n_buckets) / np.maximum(n_gaps, 1)
+
+        # Period whose nominal length is closest to each bucket's mean gap
+        nominal = np.array([p[1] for p in cls.PERIODS])
+        tolerance = np.array([p[2] for p in cls.PERIODS])
+        period = np.abs(mean_gap[:, None] - nominal[None, :]).argmin(axis=1)
+        regular = np.abs(gaps - nominal[period[gap_bucket]]) <= tolerance[
+            period[gap_bucket]]
+        n_regular = np.bincount(gap_bucket, weights=regular,
+                                minlength=n_buckets)
+        recurring = ((counts >= min_occurrences)
+                     & (n_regular >= cls.MIN_REGULAR * np.maximum(n_gaps, 1)))
+
+        ids = np.flatnonzero(recurring)
+        if not len(ids):
+            return DataFrame(columns=cls.COLUMNS)
+        rows = df.iloc[order[last[ids]]]
+        last_date = rows["datetime"].dt.normalize().reset_index(drop=True)
+        result = DataFrame({
+            "type": rows["transaction"].astype(str).str.strip().str.lower()
+            .to_numpy(),
+            "category": rows["category"].astype(str).to_numpy(),
+            "description": rows["description"].astype(str).to_numpy(),
+            "amount": rows[TransactionDAO.CENTS_COLUMN].to_numpy() / 100,
+            "frequency": [cls.PERIODS[p][0] for p in period[ids]],
+            "interval_days": np.round(mean_gap[ids], 1),
+            "occurrences": counts[ids],
+            "last_date": last_date,
+            "next_date": cls._NextDates(last_date, period[ids]),
+        })
+        return result.sort_values(["next_date", "category"],
+                                  kind="stable").reset_index(drop=True)
+
+    @classmethod
+    def _NextDates(cls, last: pd.Series, period: np.ndarray) -> pd.Series:
+        """Step each last date by its period: calendar months for monthly
+        and longer periods (keeping the day of month), days otherwise."""
+        out = last.copy()
+        for p, (_, nominal, _, months) in enumerate(cls.PERIODS):
+            mask = period == p
+            if not mask.any():
+                continue
+            step = (pd.DateOffset(months=months) if months
+                    else pd.Timedelta(days=nominal))
+            out[mask] = last[mask] + step
+        return out
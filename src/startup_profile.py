@@ -0,0 +1,116 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: StartupProfile
+
+# PURPOSE: Measure and enforce the startup-time budget of the GillPay CLI
+# and GUI entry points (--startup-profile).
+
+# INPUT: Named marks from the entry points; a budget per mark.
+
+# PROCESS: Record wall-clock time at each mark since the entry module began
+# importing, note which heavy packages were first imported before each
+# mark, and compare both against the budget.
+
+# OUTPUT: A breakdown table and any budget violations printed to stderr.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Startup timing marks and budgets for the GillPay entry points.
+
+Standard library only, so profiling never adds the imports it measures.
+"""
+
+import sys
+import time
+from dataclasses import dataclass
+
+# Packages whose first import is attributed to the phase that loaded them
+HEAVY_MODULES = ("numpy", "pandas", "matplotlib", "tkcalendar",
+                 "prettytable")
+
+# Exit status an entry point returns when a budget is exceeded
+BUDGET_EXCEEDED_STATUS = 3
+
+
+@dataclass(frozen=True)
+class StartupMark:
+    """One named point in startup: seconds since start and since the
+    previous mark, and the HEAVY_MODULES first imported in between."""
+
+    Label: str
+    Elapsed: float
+    Phase: float
+    Loaded: tuple[str, ...]
+
+
+class StartupProfile:
+    """Ordered startup marks checked against a budget.
+
+    A budget maps a mark label to (max seconds since start, modules that
+    must not be imported yet). Marks missing from a run are not checked.
+    """
+
+    def __init__(self, Name: str, Start: float | None = None) -> None:
+        """Start the clock at *Start* (a time.perf_counter value taken as
+        early as possible in the entry module), or now."""
+        self.Name = Name
+        self.Start = time.perf_counter() if Start is None else Start
+        self.Marks: list[StartupMark] = []
+        self._Last = self.Start
+        self._Seen: set[str] = set()
+
+    def Mark(self, Label: str) -> StartupMark:
+        """Record *Label* at the current time."""
+        now = time.perf_counter()
+        loaded = tuple(m for m in HEAVY_MODULES
+                       if m in sys.modules and m not in self._Seen)
+        self._Seen.update(loaded)
+        mark = StartupMark(Label, now - self.Start, now - self._Last, loaded)
+        self.Marks.append(mark)
+        self._Last = now
+        return mark
+
+    def Violations(self, Budget: dict[str, tuple[float,
+                                                 tuple[str, ...]]]
+                   ) -> list[str]:
+        """Return one message per budget line the recorded marks break."""
+        problems = []
+        loaded: set[str] = set()
+        for mark in self.Marks:
+            loaded.update(mark.Loaded)
+            if mark.Label not in Budget:
+                continue
+            limit, forbidden = Budget[mark.Label]
+            if mark.Elapsed > limit:
+                problems.append(f"'{mark.Label}' reached at "
+                                f"{mark.Elapsed:.3f}s, budget {limit:.3f}s")
+            early = sorted(loaded.intersection(forbidden))
+            if early:
+                problems.append(f"'{mark.Label}' reached with "
+                                f"{', '.join(early)} already imported")
+        return problems
+
+    def Report(self, Budget: dict[str, tuple[float, tuple[str, ...]]],
+               Out=None) -> int:
+        """Print the breakdown and violations; return the number of
+        violations."""
+        Out = Out or sys.stderr
+        print(f"Startup profile: {self.Name}", file=Out)
+        print(f"  {'mark':22} {'at':>8} {'phase':>8}  imported", file=Out)
+        for mark in self.Marks:
+            limit = Budget.get(mark.Label, (None, ()))[0]
+            budget = "" if limit is None else f"  (budget {limit:.3f}s)"
+            print(f"  {mark.Label:22} {mark.Elapsed:>7.3f}s "
+                  f"{mark.Phase:>7.3f}s  {', '.join(mark.Loaded) or '-'}"
+                  f"{budget}", file=Out)
+        problems = self.Violations(Budget)
+        for problem in problems:
+            print(f"  BUDGET EXCEEDED: {problem}", file=Out)
+        return len(problems)
@@ -0,0 +1,237 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: TransactionImporter
+
+# PURPOSE: Bulk-import bank CSV exports into the GillPay ledger with the same
+# validation and duplicate rules as manual entry.
+
+# INPUT: Path to a bank CSV export, an optional column map, and import
+# options.
+
+# PROCESS: Stream the source in fixed-size chunks keyed by source line
+# number; map columns; normalize
+# dates and amounts; validate each chunk via GillPayService.ValidateEntries;
+# dedupe against the ledger; append each accepted chunk with one file open.
+
+# OUTPUT: An ImportResult with accepted/rejected/duplicate counts and the
+# offending source line numbers.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Chunked bulk importer for bank CSV exports."""
+
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterator
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from src.dao.transaction_dao import TransactionDAO, NormalizeDateColumn
+from src.models.transaction import Transaction
+
+if TYPE_CHECKING:
+    from src.gillpay_service import GillPayService
+
+
+@dataclass
+class ImportResult:
+    """Outcome of an import run.
+
+    errors holds (source line number, message) pairs for rejected and
+    duplicate rows in line order, capped at the importer's max_errors.
+    """
+
+    accepted: int = 0
+    rejected: int = 0
+    duplicates: int = 0
+    errors: list[tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        """Number of data rows read from the source."""
+        return self.accepted + self.rejected + self.duplicates
+
+
+class TransactionImporter:
+    """Stream a CSV export into the ledger one chunk at a time.
+
+    Memory stays bounded by *chunksize* regardless of the source size.
+    column_map maps ledger columns ('transaction', 'category',
+    'description', 'amount', 'date') to source column names; unmapped
+    columns are looked up under their ledger name. When the source has no
+    transaction type column, the type is taken from the amount's sign
+    (negative = expense) and the amount is made positive.
+    """
+
+    DUPLICATE_MESSAGE = "Duplicate of an existing transaction."
+
+    def __init__(self, service: GillPayService,
+                 column_map: dict[str, str] | None = None,
+                 chunksize: int = 10_000,
+                 default_category: str = "Other",
+                 skip_duplicates: bool = True,
+                 max_errors: int = 1_000) -> None:
+        """Configure the importer around a service and its DAO."""
+        self.Service = service
+        self.Dao: TransactionDAO = service.TransactionDAO
+        self.ColumnMap = dict(column_map or {})
+        self.ChunkSize = max(1, int(chunksize))
+        self.DefaultCategory = default_category
+        self.SkipDuplicates = skip_duplicates
+        self.MaxErrors = max_errors
+
+    def ImportCsv(self, path) -> ImportResult:
+        """Import every row of *path*; return the per-row outcome."""
+        result = ImportResult()
+        for chunk in self.ReadChunks(path):
+            self.ImportChunk(chunk, result)
+        return result
+
+    def ReadChunks(self, path) -> Iterator[DataFrame]:
+        """Yield *path* as string frames of up to ChunkSize records, each
+        indexed by the source line number its record starts on.
+
+        Blank lines are skipped, so are not counted as rows; short records
+        are padded with '' and surplus cells dropped.
+        """
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            reader = csv.reader(f)
+            header = next((r for r in reader if not self._Blank(r)), None)
+            if header is None:
+                return
+            width = len(header)
+            rows: list[list[str]] = []
+            lines: list[int] = []
+            start = reader.line_num + 1
+            for row in reader:
+                if not self._Blank(row):
+                    rows.append((row + [""] * width)[:width])
+                    lines.append(start)
+                    if len(rows) == self.ChunkSize:
+                        yield DataFrame(rows, columns=header, index=lines,
+                                        dtype=str)
+                        rows, lines = [], []
+                start = reader.line_num + 1
+            if rows:
+                yield DataFrame(rows, columns=header, index=lines, dtype=str)
+
+    @staticmethod
+    def _Blank(row: list[str]) -> bool:
+        """Return True for an empty or whitespace-only source line."""
+        return not row or (len(row) == 1 and not row[0].strip())
+
+    def ImportChunk(self, chunk: DataFrame, result: ImportResult) -> None:
+        """Validate, dedupe and append one chunk of raw source rows.
+
+        The chunk index holds each row's source line number.
+        """
+        frame = self.MapColumns(chunk)
+        lines = chunk.index.tolist()
+        notes: list[tuple[int, str]] = []
+
+        checked = self.Service.ValidateEntries(frame)
+        messages = checked.messages
+        # An unparseable amount is reported ahead of every other rule
+        no_amount = frame["amount"].isna().to_numpy()
+        for i in np.flatnonzero(no_amount | ~checked.valid):
+            message = (self.Service.ENTRY_MESSAGES[
+                self.Service.ENTRY_BAD_AMOUNT] if no_amount[i]
+                else messages[i])
+            self.Reject(result, notes, lines[i], message)
+
+        keep = np.flatnonzero(checked.valid & ~no_amount)
+        rows = frame.iloc[keep]
+        candidates: list[Transaction] = [
+            Transaction(transaction=t, category=c, description=d,
+                        amount=float(a), date=dt)
+            for t, c, d, a, dt in zip(
+                rows["transaction"], rows["category"], rows["description"],
+                rows["amount"], rows["date"])
+        ]
+        candidate_lines = [lines[i] for i in keep]
+
+        if self.SkipDuplicates and candidates:
+            flags = self.Dao.FindDuplicates(candidates, within_batch=True)
+            accepted = []
+            for tx, line, is_dup in zip(candidates, candidate_lines, flags):
+                if is_dup:
+                    result.duplicates += 1
+                    notes.append((line, self.DUPLICATE_MESSAGE))
+                else:
+                    accepted.append(tx)
+        else:
+            accepted = candidates
+
+        self.Note(result, notes)
+        self.Dao.SaveTransactions(accepted)
+        result.accepted += len(accepted)
+
+    def MapColumns(self, chunk: DataFrame) -> DataFrame:
+        """Return the chunk as ledger columns with cleaned values.
+
+        amount is float (NaN when unparseable or not finite) and date is normalized to
+        YYYY/MM/DD where possible; other columns are stripped strings.
+        """
+        def Source(col: str) -> pd.Series | None:
+            name = self.ColumnMap.get(col, col)
+            if name in chunk.columns:
+                return chunk[name].astype(str).str.strip()
+            return None
+
+        blank = pd.Series("", index=chunk.index, dtype=object)
+        raw_amount = Source("amount")
+        raw_amount = blank if raw_amount is None else raw_amount
+        amount = pd.to_numeric(
+            raw_amount.str.replace(r"[$,\s]", "", regex=True),
+            errors="coerce",
+        )
+        # 'inf' and '1e400' parse but are not amounts
+        amount = amount.where(np.isfinite(amount))
+
+        tx_type = Source("transaction")
+        if tx_type is None:
+            tx_type = pd.Series("income", index=chunk.index, dtype=object)
+            tx_type = tx_type.mask(amount < 0, "expense")
+            amount = amount.abs()
+        else:
+            tx_type = tx_type.str.lower()
+
+        category = Source("category")
+        if category is None:
+            category = blank
+        category = category.mask(category.eq(""), self.DefaultCategory)
+
+        description = Source("description")
+        date = Source("date")
+        return DataFrame({
+            "transaction": tx_type,
+            "category": category,
+            "description": blank if description is None else description,
+            "amount": amount,
+            "date": NormalizeDateColumn(blank if date is None else date),
+        })
+
+    def Reject(self, result: ImportResult, notes: list[tuple[int, str]],
+               line: int, message: str) -> None:
+        """Count a rejected row and add why to the chunk's *notes*."""
+        result.rejected += 1
+        notes.append((line, message))
+
+    def Note(self, result: ImportResult,
+             notes: list[tuple[int, str]]) -> None:
+        """Record a chunk's (line, message) notes in line order while
+        staying under max_errors."""
+        room = self.MaxErrors - len(result.errors)
+        if room > 0:
+            result.errors.extend(sorted(notes)[:room])
@@ -9,7 +9,8 @@
 # INPUT: Aggregated data (dicts/ordered dicts) from DAO- or service-layer calls.
 
 # PROCESS: Build bar charts for expense by category, income by category,
-# income vs expense by month, and net by month.
+# income vs expense by month, and net by month; line charts for the running
+# balance and moving averages of daily spend.
 
 # OUTPUT: Matplotlib Figure objects suitable for mounting in Tk frames.
 
@@ -297,6 +298,49 @@ def BuildNetByMonthFigure(
     return fig
 
 
+def BuildBalanceTrendsFigure(
+        Dates: List,
+        Balance: List[float],
+        Averages: Dict[str, List[float]],
+        Title: str = "Running Balance",
+        TrendTitle: str = "Daily Spend, Moving Averages",
+) -> Figure:
+    """Build a two-panel line chart: running balance on top, moving
+    averages of daily spend (one line per window label) below."""
+    fig = Figure(figsize=(10, 6), dpi=100, constrained_layout=True,
+                 facecolor=THEME_COLORS["Navy"])
+    top, bottom = fig.subplots(2, 1, sharex=True)
+    line_colors = [THEME_COLORS["Orange"], THEME_COLORS["Surface"],
+                   THEME_COLORS["White"]]
+    line_styles = ["-", "-", "--"]
+
+    top.plot(Dates, Balance, color=THEME_COLORS["Orange"], linewidth=1.4,
+             zorder=3)
+    top.axhline(0, linewidth=1, color=THEME_COLORS["Surface"], alpha=0.6,
+                zorder=2)
+    top.set_title(Title, color=THEME_COLORS["White"])
+
+    for i, (label, values) in enumerate(Averages.items()):
+        bottom.plot(Dates, values, label=label, linewidth=1.2, zorder=3,
+                    color=line_colors[i % len(line_colors)],
+                    linestyle=line_styles[i % len(line_styles)])
+    bottom.set_title(TrendTitle, color=THEME_COLORS["White"])
+    if Averages:
+        bottom.legend(facecolor=THEME_COLORS["Surface"],
+                      edgecolor=THEME_COLORS["Surface"])
+
+    for ax in (top, bottom):
+        ax.set_facecolor(THEME_COLORS["Navy"])
+        ax.set_axisbelow(True)
+        ax.tick_params(axis="both", labelcolor=THEME_COLORS["White"])
+        ax.yaxis.set_major_formatter(FuncFormatter(Currency))
+        ax.grid(axis="y", alpha=0.25, color=THEME_COLORS["Surface"],
+                zorder=0)
+        for s in ax.spines.values():
+            s.set_color(THEME_COLORS["Surface"])
+    return fig
+
+
 # Tk embedding helper
 
 def MountFigureInTk(FrameWidget, FigureObj: Figure):
@@ -10,9 +10,10 @@
 # INPUT: User selections and text input from the GUI.
 
 # PROCESS: Validate inputs, normalize dates and amounts, perform duplicate
-# checks, and persist via DAO.
+# checks, persist via DAO, and report the category's remaining monthly
+# budget after an expense is saved.
 
-# OUTPUT: Saved transactions and UI feedback.
+# OUTPUT: Saved transactions, budget updates and UI feedback.
 
 # HONOR CODE: On my honor, as an Aggie, I have neither given nor received
 # unauthorized aid on this academic work.
@@ -24,11 +25,12 @@
 """Add Transaction tab for GillPay's Tkinter UI."""
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, simpledialog
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
 from tkcalendar import DateEntry
-from src.dao.transaction_dao import TransactionDAO
+from src.budget_engine import BudgetEngine
+from src.ledger_store import LedgerStore
 from src.models.transaction import Transaction
 from src.dao.category_dao import CategoryDAO
 from src.ui.category_manager_dialog import CategoryManagerDialog
@@ -39,11 +41,14 @@ from src.ui.category_manager_dialog import CategoryManagerDialog
 class AddTransactionTab(ttk.Frame):
     """UI tab to create and save new transactions."""
 
-    def __init__(self, parent, dao: TransactionDAO, view_tab=None):
-        """Initialize controls, bindings, and default state."""
+    def __init__(self, parent, store: LedgerStore,
+                 budgets: BudgetEngine | None = None):
+        """Initialize controls, bindings, and default state; saves go
+        through *store* so every subscribed tab refreshes. With *budgets*,
+        expense saves report the category's remaining monthly budget."""
         super().__init__(parent, padding=12)
-        self.Dao = dao
-        self.ViewTab = view_tab
+        self.Store = store
+        self.Budgets = budgets
         self.CatDao = CategoryDAO()
 
         label_opts = {"anchor": "e", "width": 15}
@@ -104,6 +109,11 @@ class AddTransactionTab(ttk.Frame):
                    style="Gill.TButton", command=self.OpenCategoryManager).grid(
             row=0, column=1, sticky="w", padx=(12, 0)
         )
+        if self.Budgets is not None:
+            ttk.Button(self.CatField, text="Set Budget",
+                       style="Gill.TButton", command=self.OnSetBudget).grid(
+                row=0, column=2, sticky="w", padx=(12, 0)
+            )
 
         # Custom category entry (only when "Other" is selected)
         self.CustomCatVar = tk.StringVar()
@@ -159,6 +169,11 @@ class AddTransactionTab(ttk.Frame):
             row=0, column=1, padx=6)
         self.columnconfigure(1, weight=1)
 
+        # Remaining budget after the last expense save
+        self.BudgetVar = tk.StringVar()
+        ttk.Label(self, textvariable=self.BudgetVar).grid(
+            row=6, column=0, columnspan=4, pady=(10, 0))
+
         def BindLocalShortcuts():
             widgets = [self.AmountEntry, self.DescriptionEntry,
                        self.CategoryBox, self.CustomCatEntry]
@@ -332,7 +347,7 @@ class AddTransactionTab(ttk.Frame):
         )
 
         try:
-            is_dup = self.Dao.IsDuplicate(t)
+            is_dup = self.Store.Dao.IsDuplicate(t)
         except Exception:
             is_dup = False
 
@@ -351,15 +366,63 @@ class AddTransactionTab(ttk.Frame):
                 return
 
         try:
-            self.Dao.SaveTransaction(t)
+            self.Store.SaveTransaction(t)
         except Exception as ex:
             messagebox.showerror("Save Failed",
                                  f"Could not save transaction:\n{ex}")
             return
 
+        self.ShowBudget(t)
         self.ClearForm(preserve_type=True)
-        if self.ViewTab:
-            self.ViewTab.LoadData()
+
+    # Budgets
+
+    def ShowBudget(self, t: Transaction):
+        """Report the saved expense's remaining budget for its month; the
+        engine's accumulator makes this O(1)."""
+        self.BudgetVar.set("")
+        if self.Budgets is None or t.transaction != "expense":
+            return
+        status = self.Budgets.Status(t.category, t.date)
+        if status is None:
+            return
+        month = datetime.strptime(status.Month, "%Y-%m").strftime("%B %Y")
+        if status.IsOver:
+            text = (f"{status.Category}: ${-status.Remaining:,.2f} over the "
+                    f"${status.Budget:,.2f} budget for {month}.")
+            messagebox.showwarning("Over Budget", text, parent=self)
+        else:
+            text = (f"{status.Category}: ${status.Remaining:,.2f} of "
+                    f"${status.Budget:,.2f} left for {month}.")
+        self.BudgetVar.set(text)
+
+    def OnSetBudget(self):
+        """Ask for the selected expense category's monthly budget; an
+        empty answer removes it."""
+        if self.TypeVar.get() != "Expense":
+            messagebox.showinfo("Budgets",
+                                "Budgets apply to expense categories.",
+                                parent=self)
+            return
+        category = (self.CategoryVar.get() or "").strip()
+        if not category:
+            return
+        current = self.Budgets.Budgets.GetBudgetCents(category)
+        answer = simpledialog.askstring(
+            "Monthly Budget",
+            f"Monthly budget for {category} (leave empty to remove):",
+            initialvalue="" if current is None else f"{current / 100:.2f}",
+            parent=self,
+        )
+        if answer is None:
+            return
+        try:
+            if answer.strip():
+                self.Budgets.SetBudget(category, answer.strip())
+            else:
+                self.Budgets.RemoveBudget(category)
+        except ValueError as ex:
+            messagebox.showerror("Invalid Budget", str(ex), parent=self)
 
     def ClearForm(self, preserve_type: bool = False):
         """Reset the form to defaults, optionally preserving the type
@@ -7,10 +7,12 @@
 # PURPOSE: Lightweight GUI tab with buttons to display GillPay
 # charts (Matplotlib).
 
-# INPUT: User clicks on chart buttons; data provided by GillPayService.
+# INPUT: User clicks on chart buttons; data provided by GillPayService over
+# the shared LedgerStore.
 
 # PROCESS: Query service for aggregated data and render themed Matplotlib
-# figures.
+# figures (category totals, monthly bars, running balance and spend moving
+# averages); redraw the visible chart when the ledger changes.
 
 # OUTPUT: Charts embedded into the tab content area.
 
@@ -27,7 +29,9 @@
 import tkinter as tk
 from tkinter import ttk
 from src.gillpay_service import GillPayService
+from src.ledger_store import LedgerChange, LedgerStore
 from src.ui.charts import (
+    BuildBalanceTrendsFigure,
     BuildExpenseByCategoryFigure,
     BuildIncomeByCategoryFigure,
     BuildIncomeExpenseByMonthFigure,
@@ -37,10 +41,14 @@ from src.ui.charts import (
 
 
 class ChartsTab(ttk.Frame):
-    """Chart launcher tab hosting four chart buttons and a render area."""
+    """Chart launcher tab hosting five chart buttons and a render area."""
 
-    def __init__(self, Master, **Kw):
-        """Initialize layout, buttons, and service reference."""
+    ALL_EXPENSES = "All Expenses"
+    TREND_WINDOWS = (7, 30, 90)
+
+    def __init__(self, Master, Store: LedgerStore | None = None, **Kw):
+        """Initialize layout, buttons, and service reference; with *Store*,
+        share its DAO and redraw the shown chart on ledger changes."""
         super().__init__(Master, **Kw)
 
         self.columnconfigure(0, weight=1)
@@ -66,18 +74,40 @@ class ChartsTab(ttk.Frame):
                            command=self.OnIE, **BtnStyle)
         BtnNet = ttk.Button(Controls, text="Net by Month", command=self.OnNet,
                             **BtnStyle)
+        BtnTrends = ttk.Button(Controls, text="Balance & Trends",
+                               command=self.OnTrends, **BtnStyle)
 
         BtnExpCat.pack(side=tk.LEFT, padx=(0, 8))
         BtnIncCat.pack(side=tk.LEFT, padx=8)
         BtnIE.pack(side=tk.LEFT, padx=8)
         BtnNet.pack(side=tk.LEFT, padx=8)
-
-        self.Service = GillPayService()
+        BtnTrends.pack(side=tk.LEFT, padx=8)
+
+        self.Service = GillPayService(Store.Dao if Store else None)
+
+        # Category shown in the moving-average panel of Balance & Trends
+        self.TrendCategory = tk.StringVar(value=self.ALL_EXPENSES)
+        self.TrendPicker = ttk.Combobox(
+            Controls, textvariable=self.TrendCategory, state="readonly",
+            width=18, values=self.TrendCategories())
+        self.TrendPicker.pack(side=tk.LEFT, padx=8)
+        self.TrendPicker.bind("<<ComboboxSelected>>",
+                              lambda _e: self.OnTrends())
+        self.CurrentChart = None
+        if Store is not None:
+            Store.Subscribe(self.OnLedgerChanged)
+
+    def OnLedgerChanged(self, Change: LedgerChange):
+        """Redraw the chart currently on screen, if any."""
+        self.TrendPicker.configure(values=self.TrendCategories())
+        if self.CurrentChart is not None:
+            self.CurrentChart()
 
     # Button handlers / actions
 
     def OnExpCat(self):
         """Render 'Expense by Category' chart."""
+        self.CurrentChart = self.OnExpCat
         try:
             Totals = self.Service.GetExpenseTotalsByCategory()
             Fig = BuildExpenseByCategoryFigure(Totals)
@@ -87,6 +117,7 @@ class ChartsTab(ttk.Frame):
 
     def OnIncCat(self):
         """Render 'Income by Category' chart."""
+        self.CurrentChart = self.OnIncCat
         try:
             Totals = self.Service.GetIncomeTotalsByCategory()
             Fig = BuildIncomeByCategoryFigure(Totals)
@@ -96,6 +127,7 @@ class ChartsTab(ttk.Frame):
 
     def OnIE(self):
         """Render 'Income vs Expense by Month' chart."""
+        self.CurrentChart = self.OnIE
         DF = self.Service.TransactionDAO.SummaryByMonthData()
         Data = {
             str(Row["month"]): {
@@ -110,6 +142,7 @@ class ChartsTab(ttk.Frame):
 
     def OnNet(self):
         """Render 'Net by Month' chart."""
+        self.CurrentChart = self.OnNet
         DF = self.Service.TransactionDAO.SummaryByMonthData()
         Data = {
             str(Row["month"]): {"income": 0.0, "expense": 0.0,
@@ -119,6 +152,36 @@ class ChartsTab(ttk.Frame):
         Fig = BuildNetByMonthFigure(Data)
         MountFigureInTk(self.ChartHost, Fig)
 
+    def OnTrends(self):
+        """Render the running balance and 7/30/90-day spend averages."""
+        self.CurrentChart = self.OnTrends
+        try:
+            Dao = self.Service.TransactionDAO
+            Category = self.TrendCategory.get()
+            Category = None if Category == self.ALL_EXPENSES else Category
+            Balance = Dao.DailyBalanceData()
+            Averages = Dao.SpendMovingAverageData(self.TREND_WINDOWS,
+                                                  category=Category)
+            Fig = BuildBalanceTrendsFigure(
+                Balance["date"].tolist(),
+                Balance["balance"].tolist(),
+                {f"{W}-day": Averages[f"ma{W}"].tolist()
+                 for W in self.TREND_WINDOWS},
+                TrendTitle=f"{Category or self.ALL_EXPENSES}: Daily Spend, "
+                           f"Moving Averages",
+            )
+            MountFigureInTk(self.ChartHost, Fig)
+        except Exception as Ex:
+            self.ShowError(str(Ex))
+
+    def TrendCategories(self) -> list:
+        """Return the picker choices: all expenses, then each category."""
+        try:
+            Names = self.Service.CategoryDAO.ListCategoryNames("Expense")
+        except Exception:
+            Names = []
+        return [self.ALL_EXPENSES, *Names]
+
     # Error display
 
     def ShowError(self, Message: str):
@@ -5,11 +5,12 @@
 # PROGRAM: Tab Report Category
 
 # PURPOSE: Show category totals as a table with refresh, sorting,
-# and inclusive date range.
+# inclusive date range, and each expense category's monthly budget.
 
 # INPUT: User-selected type (Expense/Income/All) and start/end dates.
 
-# PROCESS: Query DAO and render a sortable table.
+# PROCESS: Query DAO and render a sortable table; look up budget and
+# remaining amount for the end date's month from the BudgetEngine.
 
 # OUTPUT: A Treeview table and a total amount label.
 
@@ -30,17 +31,24 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import date, datetime
 from tkcalendar import DateEntry
-from src.dao.transaction_dao import TransactionDAO, NormalizeDateStr
+from src.budget_engine import BudgetEngine
+from src.dao.transaction_dao import NormalizeDateStr
+from src.ledger_store import LedgerStore
 
 
 class ReportCategoryTab(ttk.Frame):
     """Tkinter frame showing totals by category with type/date filters and
     sorting."""
 
-    def __init__(self, parent, dao: TransactionDAO):
-        """Build UI, bind events, set defaults, and load initial data."""
+    def __init__(self, parent, store: LedgerStore,
+                 budgets: BudgetEngine | None = None):
+        """Build UI, bind events, set defaults, and load initial data;
+        reload whenever *store* publishes a ledger change or a budget is
+        edited in *budgets*."""
         super().__init__(parent, padding=12)
-        self.Dao = dao
+        self.Store = store
+        self.Dao = store.Dao
+        self.Budgets = budgets
 
         bar = ttk.Frame(self)
         bar.grid(row=0, column=0, sticky="we", pady=(0, 8))
@@ -93,7 +101,8 @@ class ReportCategoryTab(ttk.Frame):
         self.EndPicker.set_date(date.today())
 
         # Table (hide 'type' unless showing All)
-        self.ColumnsAll = ("type", "category", "amount")
+        self.ColumnsAll = ("type", "category", "amount", "budget",
+                           "remaining")
         self.Tree = ttk.Treeview(self, columns=self.ColumnsAll, show="headings",
                                  height=16, style="Gill.Treeview")
         self.Tree.heading("type", text="Type",
@@ -108,12 +117,22 @@ class ReportCategoryTab(ttk.Frame):
         self.Tree.column("type", width=0, minwidth=0, stretch=False, anchor="w")
         self.Tree.column("category", width=240, anchor="w")
         self.Tree.column("amount", width=120, anchor="e")
+        for key, label in (("budget", "Budget"), ("remaining", "Remaining")):
+            self.Tree.heading(key, text=label,
+                              command=lambda c=key: self.SortBy(c, False),
+                              anchor="e")
+            self.Tree.column(key, width=120, anchor="e")
+        if self.Budgets is None:
+            self.Tree.configure(displaycolumns=("type", "category", "amount"))
         self.Tree.tag_configure("oddrow", background="#F6F9FC")
         self.Tree.tag_configure("evenrow", background="")
         self.Tree.grid(row=1, column=0, sticky="nsew")
         self.rowconfigure(1, weight=1)
         self.columnconfigure(0, weight=1)
 
+        self.Store.Subscribe(lambda change: self.LoadData())
+        if self.Budgets is not None:
+            self.Budgets.Subscribe(self.LoadData)
         self.LoadData()
 
     # ---- Date normalization helpers ----
@@ -202,6 +221,10 @@ class ReportCategoryTab(ttk.Frame):
 
         # Toggle 'Type' column
         self._ShowTypeColumn(typ == "All")
+        month = end[:7]
+        if self.Budgets is not None:
+            label = datetime.strptime(end, "%Y/%m/%d").strftime("%b %Y")
+            self.Tree.heading("remaining", text=f"Remaining ({label})")
 
         if df is None or df.empty:
             self.TotalLabel.config(
@@ -223,7 +246,9 @@ class ReportCategoryTab(ttk.Frame):
         if typ == "All":
             for i, (_, row) in enumerate(df.iterrows()):
                 values = (str(row["type"]), str(row["category"]),
-                          f"{float(row['amount']):.2f}")
+                          f"{float(row['amount']):.2f}",
+                          *self.BudgetCells(str(row["type"]),
+                                            str(row["category"]), month))
                 tag = "evenrow" if i % 2 == 0 else "oddrow"
                 self.Tree.insert("", "end", values=values, tags=(tag,))
             inc_total = float(df.loc[df["type"] == "Income", "amount"].sum())
@@ -236,19 +261,30 @@ class ReportCategoryTab(ttk.Frame):
         else:
             for i, (_, row) in enumerate(df.iterrows()):
                 values = (typ, str(row["category"]),
-                          f"{float(row['amount']):.2f}")  # typ in hidden col
+                          f"{float(row['amount']):.2f}",  # typ in hidden col
+                          *self.BudgetCells(typ, str(row["category"]), month))
                 tag = "evenrow" if i % 2 == 0 else "oddrow"
                 self.Tree.insert("", "end", values=values, tags=(tag,))
             total = float(df["amount"].sum())
             self.TotalLabel.config(text=f"Total: ${total:,.2f}")
 
+    def BudgetCells(self, typ: str, category: str, month: str) -> tuple:
+        """Return the (budget, remaining) cells for one row; blank for
+        income and unbudgeted categories."""
+        if self.Budgets is None or typ != "Expense":
+            return "", ""
+        status = self.Budgets.Status(category, month)
+        if status is None:
+            return "", ""
+        return f"{status.Budget:.2f}", f"{status.Remaining:.2f}"
+
     def SortBy(self, column: str, descending: bool):
         """Sort the Treeview by column; toggles asc/desc."""
         rows = self.Tree.get_children("")
 
         def key_func(iid):
             v = self.Tree.set(iid, column)
-            if column == "amount":
+            if column in ("amount", "budget", "remaining"):
                 try:
                     return float(v)
                 except Exception:
@@ -7,7 +7,7 @@
 # PURPOSE: Show "Summary by Month" (Income, Expense, Net) with refresh and
 # sorting.
 
-# INPUT: Data from TransactionDAO.
+# INPUT: Data from TransactionDAO via the shared LedgerStore.
 
 # PROCESS: Load monthly summary and render a sortable table.
 
@@ -27,21 +27,23 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
 
-from src.dao.transaction_dao import TransactionDAO
+from src.ledger_store import LedgerStore
 
 
 class ReportMonthTab(ttk.Frame):
     """Report tab that displays income, expense, and net by month."""
 
-    def __init__(self, parent, dao: TransactionDAO):
-        """Initialize controls and load the initial dataset."""
+    def __init__(self, parent, store: LedgerStore):
+        """Initialize controls and load the initial dataset; reload whenever
+        *store* publishes a ledger change."""
         super().__init__(parent, padding=12)
-        self.Dao = dao
+        self.Store = store
+        self.Dao = store.Dao
 
         bar = ttk.Frame(self)
         bar.grid(row=0, column=0, sticky="we", pady=(0, 8))
         ttk.Button(bar, text="Refresh", style="Gill.TButton",
-                   command=self.LoadData).grid(row=0, column=0)
+                   command=self.OnRefreshClick).grid(row=0, column=0)
 
         self.Columns = ("month", "income", "expense", "net")
         self.Tree = ttk.Treeview(self, columns=self.Columns, show="headings",
@@ -65,8 +67,14 @@ class ReportMonthTab(ttk.Frame):
         self.rowconfigure(1, weight=1)
         self.columnconfigure(0, weight=1)
 
+        self.Store.Subscribe(lambda change: self.LoadData())
         self.LoadData()
 
+    def OnRefreshClick(self):
+        """Pick up outside edits; reload here if the ledger is unchanged."""
+        if not self.Store.Refresh():
+            self.LoadData()
+
     def LoadData(self):
         """Load monthly summary from DAO and populate the table."""
         try:
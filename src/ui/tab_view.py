@@ -27,16 +27,17 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
 from src.dao.category_dao import CategoryDAO
-from src.dao.transaction_dao import TransactionDAO
+from src.ledger_store import LedgerChange, LedgerStore
 
 
 class ViewTransactionsTab(ttk.Frame):
     """Tab to view, filter, and sort transactions."""
 
-    def __init__(self, parent, dao: TransactionDAO, on_refresh=None):
-        """Initialize filters, table, and initial data load."""
+    def __init__(self, parent, store: LedgerStore, on_refresh=None):
+        """Initialize filters, table, and initial data load; redraw on every
+        ledger change published by *store*."""
         super().__init__(parent, padding=12)
-        self.Dao = dao
+        self.Store = store
         self.CatDao = CategoryDAO()
         self.OnRefresh = on_refresh
 
@@ -70,7 +71,8 @@ class ViewTransactionsTab(ttk.Frame):
         self.CategoryFilterVar.trace_add("write", lambda *_: self.LoadData())
 
         ttk.Button(bar, text="Refresh", style="Gill.TButton",
-                   command=self.LoadData).grid(row=0, column=4, padx=(0, 8))
+                   command=self.OnRefreshClick).grid(row=0, column=4,
+                                                     padx=(0, 8))
 
         self.Columns = ("transaction", "category", "description", "amount",
                         "date")
@@ -102,8 +104,18 @@ class ViewTransactionsTab(ttk.Frame):
         self.rowconfigure(1, weight=1)
         self.columnconfigure(0, weight=1)
 
+        self.Store.Subscribe(self.OnLedgerChanged)
         self.LoadData()
 
+    def OnLedgerChanged(self, change: LedgerChange):
+        """Redraw from the snapshot published by the ledger store."""
+        self.Render(change.Frame)
+
+    def OnRefreshClick(self):
+        """Pick up outside edits; redraw here if the ledger is unchanged."""
+        if not self.Store.Refresh():
+            self.LoadData()
+
     def OnTypeFilterChanged(self):
         """When Type changes, rebuild Category filter list and reload table."""
         self.RefreshCategoryFilter()
@@ -125,14 +137,17 @@ class ViewTransactionsTab(ttk.Frame):
         self.CategoryFilterVar.set(cur if cur in vals else "All")
 
     def LoadData(self):
-        """Load DataFrame from DAO, apply filters, and render into the Treeview."""
+        """Render the shared ledger snapshot with the current filters."""
         try:
-            df = self.Dao.GetDataFrame()
+            df = self.Store.Snapshot()
         except Exception as ex:
             messagebox.showerror("Load Failed",
                                  f"Could not load transactions:\n{ex}")
             return
+        self.Render(df)
 
+    def Render(self, df):
+        """Apply filters to *df* and render it into the Treeview."""
         for iid in self.Tree.get_children():
             self.Tree.delete(iid)
 
@@ -142,6 +157,7 @@ class ViewTransactionsTab(ttk.Frame):
             return
 
         expected = list(self.Columns)
+        df = df.copy(deep=False)  # never add columns to the shared snapshot
         for c in expected:
             if c not in df.columns:
                 df[c] = "" if c != "amount" else 0.0
@@ -0,0 +1,30 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: Test Configuration
+
+# PURPOSE: Make the repo root importable for the GillPay test suite.
+
+# INPUT: None.
+
+# PROCESS: Put the repo root on sys.path so tests import src.* the way the
+# entry points and benchmarks do.
+
+# OUTPUT: None.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Shared pytest setup for GillPay."""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
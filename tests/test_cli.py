@@ -0,0 +1,71 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: CLI Tests
+
+# PURPOSE: Check the scriptable gillpay subcommands against GillPayService.
+
+# INPUT: Small ledgers written to a temporary directory.
+
+# PROCESS: Run src.main.main in-process with --data pointing at the ledger
+# and parse its JSON or CSV output.
+
+# OUTPUT: pytest results.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Tests for the gillpay CLI subcommands."""
+
+import json
+
+from src.dao.monthly_rollup import MonthlyRollup
+from src.main import NewService, main
+
+LEDGER = ("transaction,category,description,amount,date\n"
+          "income,Job,pay,10,2025/01/02\n"
+          "expense,Food,lunch,5,2025/01/03\n")
+
+
+def RunJson(capsys, *argv) -> list:
+    """Run the CLI with --format json and return the parsed output."""
+    assert main([*argv, "--format", "json"]) == 0
+    return json.loads(capsys.readouterr().out)
+
+
+def test_summary_and_by_month_on_bom_ledger(tmp_path, capsys):
+    path = tmp_path / "ledger.csv"
+    path.write_text(LEDGER, encoding="utf-8-sig")
+    data = ["--data", str(path)]
+    want = NewService(str(path)).GetTransactionSummary()
+    assert want == {"income": 10.0, "expense": 5.0, "net": 5.0}
+
+    # Cold: no rollup saved yet
+    assert RunJson(capsys, *data, "summary") == [want]
+    # report by-month builds and saves the rollup
+    assert RunJson(capsys, *data, "report", "by-month") == [
+        {"month": "January 2025", "income": 10.0, "expense": 5.0,
+         "net": 5.0}]
+    # Warm: summed from the saved rollup
+    assert RunJson(capsys, *data, "summary") == [want]
+
+
+def test_summary_writes_no_files(tmp_path, capsys):
+    path = tmp_path / "ledger.csv"
+    path.write_text(LEDGER, encoding="utf-8")
+    data = ["--data", str(path)]
+    RunJson(capsys, *data, "summary")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["ledger.csv"]
+
+    rollup = MonthlyRollup(path).Refresh().Path
+    saved = rollup.read_bytes()
+    with path.open("a", encoding="utf-8") as f:
+        f.write("income,Job,bonus,2.5,2025/02/01\n")
+    assert RunJson(capsys, *data, "summary") == [
+        {"income": 12.5, "expense": 5.0, "net": 7.5}]
+    assert rollup.read_bytes() == saved
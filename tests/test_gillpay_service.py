@@ -0,0 +1,63 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: GillPayService Tests
+
+# PURPOSE: Check the vectorized entry validation against the per-row rules.
+
+# INPUT: Small frames of entries; a ledger in a temporary directory.
+
+# PROCESS: Validate the same entries with ValidateEntries and ValidateEntry
+# and compare the codes and messages.
+
+# OUTPUT: pytest results.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Tests for GillPayService validation."""
+
+import math
+
+import pandas as pd
+import pytest
+
+from src.dao.transaction_dao import TransactionDAO
+from src.gillpay_service import GillPayService
+from src.models.transaction import Transaction
+
+
+@pytest.fixture
+def service(tmp_path) -> GillPayService:
+    """Return a service over an empty ledger."""
+    path = tmp_path / "ledger.csv"
+    path.write_text("transaction,category,description,amount,date\n",
+                    encoding="utf-8")
+    return GillPayService(TransactionDAO(str(path)))
+
+
+@pytest.mark.parametrize("amounts", [
+    [12.5, math.inf, -math.inf, math.nan],
+    ["12.5", "inf", "-inf", "nan"],
+])
+def test_non_finite_amounts_are_not_numbers(service, amounts):
+    frame = pd.DataFrame({"transaction": "expense", "category": "Groceries",
+                          "description": "HEB", "amount": amounts,
+                          "date": "2025/01/02"})
+
+    checked = service.ValidateEntries(frame)
+
+    bad = service.ENTRY_BAD_AMOUNT
+    assert checked.codes.tolist() == [service.ENTRY_OK, bad, bad, bad]
+    for amount, message in zip(amounts, checked.messages):
+        tx = Transaction("expense", "Groceries", "HEB", amount, "2025/01/02")
+        if message:
+            with pytest.raises(ValueError, match=message):
+                service.ValidateEntry(tx)
+        else:
+            service.ValidateEntry(tx)
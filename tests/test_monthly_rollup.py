@@ -0,0 +1,48 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: Monthly Rollup Tests
+
+# PURPOSE: Check the persisted monthly rollup against the DAO's Pandas
+# reports.
+
+# INPUT: Small ledgers written to a temporary directory.
+
+# PROCESS: Build the rollup and the DAO reports over the same file and
+# compare them.
+
+# OUTPUT: pytest results.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Tests for MonthlyRollup."""
+
+import pytest
+
+from src.dao.monthly_rollup import MonthlyRollup
+from src.dao.transaction_dao import TransactionDAO
+
+LEDGER = ("transaction,category,description,amount,date\n"
+          "income,Job,pay,10,2025/01/02\n"
+          "expense,Food,lunch,5,2025/01/03\n"
+          "expense,Rent,flat,7.5,2025/02/01\n")
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-8-sig"])
+def test_rollup_matches_dao_reports(tmp_path, encoding):
+    path = tmp_path / "ledger.csv"
+    path.write_text(LEDGER, encoding=encoding)
+    dao = TransactionDAO(str(path))
+
+    monthly = dao.GetReports().monthly
+    assert monthly["income"].sum() == 10
+    assert dao.SummaryByMonthData().equals(monthly)
+
+    kinds = MonthlyRollup(path).Refresh().KindTotals()
+    assert kinds == {"income": [1000, 1], "expense": [1250, 2]}
@@ -0,0 +1,57 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: SqliteTransactionDAO Tests
+
+# PURPOSE: Check that the SQLite backend answers like the CSV backend.
+
+# INPUT: A small out-of-order CSV ledger in a temporary directory.
+
+# PROCESS: Migrate the ledger to SQLite and compare range queries from both
+# DAOs.
+
+# OUTPUT: pytest results.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Tests for SqliteTransactionDAO."""
+
+import pytest
+
+from src.dao.sqlite_transaction_dao import (
+    MigrateCsvToSqlite,
+    SqliteTransactionDAO,
+)
+from src.dao.transaction_dao import TransactionDAO
+
+# Entered out of date order, with a same-day tie and an undated row
+LEDGER = ("transaction,category,description,amount,date\n"
+          "expense,Food,late,3,2025/03/01\n"
+          "income,Job,first,10,2025/01/02\n"
+          "expense,Rent,undated,7,bad\n"
+          "expense,Food,tie a,4,2025/02/10\n"
+          "expense,Food,early,2,2024/12/31\n"
+          "expense,Food,tie b,5,2025/02/10\n")
+
+
+@pytest.mark.parametrize("start, end", [
+    (None, None), ("2025/01/01", None), (None, "2025/02/10"),
+    ("2025/02/10", "2025/02/10"), ("2026/01/01", None),
+])
+def test_range_rows_match_csv_order(tmp_path, start, end):
+    csv_path = tmp_path / "ledger.csv"
+    csv_path.write_text(LEDGER, encoding="utf-8")
+    db_path = tmp_path / "ledger.sqlite"
+    MigrateCsvToSqlite(str(csv_path), str(db_path))
+
+    columns = TransactionDAO.COLUMNS + [TransactionDAO.CENTS_COLUMN]
+    want = TransactionDAO(str(csv_path)).GetDataFrameInRange(start, end)
+    got = SqliteTransactionDAO(str(db_path)).GetDataFrameInRange(start, end)
+    assert (got[columns].astype(str).values.tolist()
+            == want[columns].astype(str).values.tolist())
@@ -0,0 +1,141 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: TransactionDAO Tests
+
+# PURPOSE: Check the CSV DAO's duplicate index against what it stores, and
+# its cached, tail-parsed ledger against a fresh full reload.
+
+# INPUT: Small ledgers written to a temporary directory.
+
+# PROCESS: Save transactions, then ask the DAO (and a fresh DAO over the
+# same file) whether the same transactions are duplicates; apply seeded
+# random appends, saves, rewrites and truncations to a ledger and compare
+# the long-lived DAO with a new one after each step.
+
+# OUTPUT: pytest results.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Tests for TransactionDAO."""
+
+import math
+import os
+import random
+
+import pandas as pd
+import pytest
+
+from src.dao.transaction_dao import TransactionDAO
+from src.models.transaction import Transaction
+
+HEADER = "transaction,category,description,amount,date\n"
+
+# Steps applied to the ledger per seed in the reload property test
+RELOAD_STEPS = 40
+
+
+def test_duplicate_keys_match_stored_cents(tmp_path):
+    path = tmp_path / "ledger.csv"
+    path.write_text(HEADER, encoding="utf-8")
+    dao = TransactionDAO(str(path))
+    batch = [Transaction("expense", "Food", "a", amount, "2025/01/02")
+             for amount in (0.1 + 0.2, 2.675, math.inf, math.nan)]
+
+    assert dao.FindDuplicates(batch) == [False] * 4
+    dao.SaveTransactions(batch)
+
+    for reader in (dao, TransactionDAO(str(path))):
+        assert reader.FindDuplicates(batch) == [True] * 4
+        assert all(reader.IsDuplicate(tx) for tx in batch)
+    assert dao.FindDuplicates([]) == []
+
+
+def RandomLine(rng: random.Random) -> str:
+    """Return one ledger row with messy but plausible cells."""
+    return ",".join([
+        rng.choice(["income", "expense", " Expense", "INCOME", ""]),
+        rng.choice(["Food", "food ", "Rent", "Salary", ""]),
+        rng.choice(["lunch", "rent", "pay", '"a, b"', ""]),
+        rng.choice([f"{rng.uniform(0, 500):.2f}", str(rng.randint(0, 99)),
+                    "0.005", "1_000", "abc", ""]),
+        rng.choice(["2025/01/02", "2025-02-28", "03/15/2025",
+                    "15 Mar 2025", "3025/01/05", "bad", ""]),
+    ])
+
+
+def RandomText(rng: random.Random, rows: int, newline: str) -> str:
+    """Return *rows* random rows, each ended with *newline*."""
+    return "".join(RandomLine(rng) + newline for _ in range(rows))
+
+
+def Step(rng: random.Random, dao: TransactionDAO, path) -> None:
+    """Change the ledger once: append, save, rewrite or truncate."""
+    newline = rng.choice(["\n", "\r\n"])
+    action = rng.choice(["append", "append", "save", "rewrite",
+                         "truncate", "empty", "header"])
+    if action == "append":
+        text = RandomText(rng, rng.randint(1, 5), newline)
+        if rng.random() < 0.2:
+            text = text.rstrip("\r\n")  # row still being written
+        with path.open("a", encoding="utf-8", newline="") as f:
+            f.write(text)
+    elif action == "save":
+        dao.SaveTransactions([
+            Transaction(rng.choice(["income", "expense"]), "Food", "saved",
+                        round(rng.uniform(0, 500), 2), "2025/04/01")
+            for _ in range(rng.randint(1, 3))])
+        return
+    elif action == "rewrite":
+        path.write_text(HEADER.replace("\n", newline)
+                        + RandomText(rng, rng.randint(0, 20), newline),
+                        encoding=rng.choice(["utf-8", "utf-8-sig"]),
+                        newline="")
+    elif action == "truncate":
+        with path.open("r+b") as f:
+            f.truncate(rng.randint(0, path.stat().st_size))
+    elif action == "empty":
+        path.write_bytes(b"")
+    else:
+        path.write_text(HEADER, encoding="utf-8")
+    # The cache keys on (size, mtime, inode); give every external edit its
+    # own mtime, as a real editor save would have
+    stamp = path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(stamp, stamp))
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_cached_ledger_matches_fresh_reload(tmp_path, seed):
+    rng = random.Random(seed)
+    path = tmp_path / "ledger.csv"
+    path.write_text(HEADER + RandomText(rng, 10, "\n"), encoding="utf-8")
+    dao = TransactionDAO(str(path))
+
+    for _ in range(RELOAD_STEPS):
+        Step(rng, dao, path)
+        fresh = TransactionDAO(str(path))
+        try:
+            fresh.GetDataFrame()
+        except (pd.errors.ParserError, UnicodeDecodeError) as err:
+            # A truncate can cut a quoted cell or the byte-order mark in
+            # half; the cache must reject that ledger as a fresh load does
+            with pytest.raises(type(err)):
+                dao.GetDataFrame()
+            continue
+        pd.testing.assert_frame_equal(dao.GetDataFrame(),
+                                      fresh.GetDataFrame(),
+                                      check_categorical=False)
+        got, want = dao.GetReports(), fresh.GetReports()
+        for name in ("expense", "income", "monthly"):
+            pd.testing.assert_frame_equal(getattr(got, name),
+                                          getattr(want, name))
+        pd.testing.assert_frame_equal(
+            dao.GetDataFrameInRange("2025/01/01", "2025/03/31"),
+            fresh.GetDataFrameInRange("2025/01/01", "2025/03/31"),
+            check_categorical=False)
@@ -0,0 +1,77 @@
+# AUTHOR: Team 7 Goofy Goldfishes
+
+# DATE: 17OCT2026
+
+# PROGRAM: TransactionImporter Tests
+
+# PURPOSE: Check bulk-import validation and the reported source lines.
+
+# INPUT: Small ledgers and bank exports written to a temporary directory.
+
+# PROCESS: Import exports through GillPayService.ImportTransactions with a
+# small chunk size and inspect the ImportResult and the ledger.
+
+# OUTPUT: pytest results.
+
+# HONOR CODE: On my honor, as an Aggie, I have neither given nor received
+# unauthorized aid on this academic work.
+
+# GEN AI: In keeping with my commitment to leverage advanced technology for
+# enhanced efficiency and accuracy in my work, I use generative artificial
+# intelligence tools to assist in writing my Python code.
+
+"""Tests for TransactionImporter."""
+
+from src.dao.transaction_dao import TransactionDAO
+from src.gillpay_service import GillPayService
+from src.models.transaction import Transaction
+
+HEADER = "transaction,category,description,amount,date\n"
+
+
+def NewLedger(tmp_path) -> GillPayService:
+    """Return a service over an empty ledger in *tmp_path*."""
+    path = tmp_path / "ledger.csv"
+    path.write_text(HEADER, encoding="utf-8")
+    return GillPayService(TransactionDAO(str(path)))
+
+
+def test_non_finite_amounts_are_rejected_after_a_full_chunk(tmp_path):
+    service = NewLedger(tmp_path)
+    source = tmp_path / "export.csv"
+    source.write_text(
+        HEADER
+        + "expense,Groceries,a,5,2025/01/02\n"
+        + "expense,Groceries,b,6,2025/01/02\n"
+        + "expense,Groceries,c,inf,2025/01/02\n"
+        + "expense,Groceries,d,1e400,2025/01/02\n"
+        + "expense,Groceries,e,7,2025/01/02\n", encoding="utf-8")
+
+    result = service.ImportTransactions(source, chunksize=2)
+
+    bad = service.ENTRY_MESSAGES[service.ENTRY_BAD_AMOUNT]
+    assert (result.accepted, result.rejected) == (3, 2)
+    assert result.errors == [(4, bad), (5, bad)]
+    assert sorted(service.TransactionDAO.GetDataFrame()["description"]) == [
+        "a", "b", "e"]
+
+
+def test_errors_are_in_source_line_order(tmp_path):
+    service = NewLedger(tmp_path)
+    service.TransactionDAO.SaveTransactions([Transaction(
+        "expense", "Groceries", "seen", 5.0, "2025/01/02")])
+    source = tmp_path / "export.csv"
+    source.write_text(
+        HEADER
+        + "expense,Groceries,seen,5,2025/01/02\n"   # 2: duplicate
+        + "expense,Groceries,x,abc,2025/01/02\n"    # 3: bad amount
+        + "expense,Groceries,seen,5,2025/01/02\n"   # 4: duplicate
+        + "expense,Nope,y,5,2025/01/02\n"           # 5: bad category
+        + "expense,Groceries,ok,5,2025/01/02\n"     # 6: accepted
+        + "expense,Groceries,z,0,2025/01/02\n",     # 7: not positive
+        encoding="utf-8")
+
+    result = service.ImportTransactions(source, chunksize=4, max_errors=4)
+
+    assert (result.accepted, result.rejected, result.duplicates) == (1, 3, 2)
+    assert [line for line, _ in result.errors] == [2, 3, 4, 5]